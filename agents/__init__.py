@@ -1,12 +1,19 @@
 """Research agents for the multi-agent system"""
-from .planner import PlannerAgent, plan_research
-from .researcher import ResearcherAgent, execute_research
-from .writer import WriterAgent, write_report
-from .reviewer import ReviewerAgent, review_report
-
-__all__ = [
-    "PlannerAgent", "plan_research",
-    "ResearcherAgent", "execute_research", 
-    "WriterAgent", "write_report",
-    "ReviewerAgent", "review_report"
-]
+import importlib
+
+# 이름 -> 모듈 (첫 접근 시 임포트하여 패키지 임포트 비용을 줄임)
+_EXPORTS = {
+    "PlannerAgent": ".planner", "plan_research": ".planner",
+    "ResearcherAgent": ".researcher", "execute_research": ".researcher",
+    "WriterAgent": ".writer", "write_report": ".writer",
+    "ReviewerAgent": ".reviewer", "review_report": ".reviewer",
+    "create_llm": ".llm", "get_response_cache": ".llm",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
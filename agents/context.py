@@ -0,0 +1,199 @@
+"""
+Context Packing
+작성자 프롬프트에 넣을 수집 정보를 토큰 예산 안에 맞춰 구성
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# 작성자 프롬프트에서 수집 정보 + 출처 + 계획에 쓸 토큰 예산
+WRITER_CONTEXT_TOKENS = int(os.getenv("WRITER_CONTEXT_TOKENS", "6000"))
+# 예산 중 리서치 계획에 쓸 최대 비율
+PLAN_BUDGET_RATIO = 0.15
+MAX_SOURCES = 20
+
+_BULLET = re.compile(r"^\s*(?:[-*•]|\d+[.)])\s+")
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+class PackedContext(NamedTuple):
+    """토큰 예산에 맞춰 구성된 작성자 컨텍스트"""
+    gathered_info: str
+    sources: str
+    research_plan: str
+    tokens: int
+    kept: int
+    dropped: int
+    duplicates: int
+
+
+@lru_cache(maxsize=8)
+def get_token_counter(model_name: Optional[str] = None) -> Callable[[str], int]:
+    """
+    모델에 맞는 토큰 카운터 반환
+
+    tiktoken 인코딩을 쓸 수 없으면 (미설치, 오프라인 등) 문자 수 기반으로 추정함
+    """
+    try:
+        import tiktoken
+        try:
+            encoding = tiktoken.encoding_for_model(model_name or "gpt-4o-mini")
+        except KeyError:
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return lambda text: len(encoding.encode(text, disallowed_special=()))
+    except Exception:
+        return estimate_tokens
+
+
+def estimate_tokens(text: str) -> int:
+    """토크나이저 없이 토큰 수 추정 (ASCII 4자당 1토큰, 그 외 문자 1자당 1토큰)"""
+    ascii_chars = sum(1 for ch in text if ord(ch) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def truncate_to_tokens(text: str, budget: int, count: Callable[[str], int]) -> str:
+    """줄 단위로 잘라 토큰 예산 이하로 맞춤"""
+    if count(text) <= budget:
+        return text
+    kept, used = [], 0
+    for line in text.splitlines():
+        cost = count(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+    return "\n".join(kept)
+
+
+def _split_summary(summary: str) -> Tuple[str, List[str]]:
+    """요약을 (### 쿼리 제목, bullet 목록)으로 분리 (bullet이 아닌 줄은 앞 bullet에 이어붙임)"""
+    heading = ""
+    bullets: List[str] = []
+    for line in summary.splitlines():
+        if not line.strip():
+            continue
+        if line.startswith("#") and not bullets and not heading:
+            heading = line.strip()
+        elif _BULLET.match(line) or not bullets:
+            bullets.append(line.rstrip())
+        else:
+            bullets[-1] += "\n" + line.rstrip()
+    return heading, bullets
+
+
+def _bullet_key(bullet: str) -> str:
+    """중복 판정용 키 (출처 표기, 기호, 공백 제거)"""
+    text = re.sub(r"\[출처:[^\]]*\]", "", _BULLET.sub("", bullet, count=1))
+    return _NON_WORD.sub(" ", text).strip().casefold()
+
+
+def format_sources(sources: List[Dict], limit: int = MAX_SOURCES) -> str:
+    """URL 기준 중복을 제거한 출처 목록 포맷팅"""
+    if not sources:
+        return "출처 없음"
+
+    unique_sources = []
+    seen_urls = set()
+    for s in sources:
+        url = s.get("url", "")
+        if url and url not in seen_urls:
+            seen_urls.add(url)
+            unique_sources.append(s)
+
+    lines = []
+    for i, source in enumerate(unique_sources[:limit], 1):
+        title = source.get("title", "제목 없음")
+        url = source.get("url", "URL 없음")
+        lines.append(f"[{i}] {title}\n    {url}")
+
+    return "\n".join(lines)
+
+
+def pack_context(
+    gathered_info: List[str],
+    sources: List[Dict],
+    research_plan: str,
+    budget: Optional[int] = None,
+    model_name: Optional[str] = None
+) -> PackedContext:
+    """
+    수집 정보, 출처, 계획을 토큰 예산 안에 맞춰 구성
+
+    1. 출처 목록과 리서치 계획(예산의 PLAN_BUDGET_RATIO 이하)을 먼저 배정
+    2. 요약을 bullet 단위로 나누고 내용이 같은 bullet은 하나만 남김
+    3. 각 요약의 앞쪽 bullet부터 쿼리별로 번갈아 골라 남은 예산을 채움
+    4. 선택된 bullet을 원래 쿼리/순서대로 다시 묶음
+
+    Args:
+        gathered_info: 쿼리별 요약 목록
+        sources: 출처 목록
+        research_plan: 리서치 계획
+        budget: 토큰 예산 (없으면 WRITER_CONTEXT_TOKENS)
+        model_name: 토큰 계산 기준 모델
+
+    Returns:
+        PackedContext
+    """
+    budget = budget or WRITER_CONTEXT_TOKENS
+    count = get_token_counter(model_name)
+
+    sources_text = format_sources(sources)
+    plan_text = truncate_to_tokens(
+        research_plan or "계획 없음", int(budget * PLAN_BUDGET_RATIO), count
+    )
+    used = count(sources_text) + count(plan_text)
+
+    # bullet 분리 및 중복 제거
+    groups: List[Tuple[str, List[str]]] = []
+    seen = set()
+    duplicates = 0
+    for summary in gathered_info or []:
+        heading, bullets = _split_summary(summary)
+        unique = []
+        for bullet in bullets:
+            key = _bullet_key(bullet)
+            if key and key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            unique.append(bullet)
+        groups.append((heading, unique))
+
+    # 쿼리별 라운드 로빈으로 예산 채우기 (요약 앞쪽 bullet이 더 중요)
+    selected = [[False] * len(bullets) for _, bullets in groups]
+    opened = [False] * len(groups)
+    total = sum(len(bullets) for _, bullets in groups)
+    depth = max((len(bullets) for _, bullets in groups), default=0)
+    kept = 0
+    for rank in range(depth):
+        for g, (heading, bullets) in enumerate(groups):
+            if rank >= len(bullets):
+                continue
+            cost = count(bullets[rank]) + 1
+            if not opened[g] and heading:
+                cost += count(heading) + 2
+            if used + cost > budget:
+                continue
+            used += cost
+            opened[g] = True
+            selected[g][rank] = True
+            kept += 1
+
+    blocks = []
+    for g, (heading, bullets) in enumerate(groups):
+        chosen = [b for b, keep in zip(bullets, selected[g]) if keep]
+        if chosen:
+            blocks.append("\n".join(([heading, ""] if heading else []) + chosen))
+    info_text = "\n\n".join(blocks) if blocks else "수집된 정보 없음"
+
+    return PackedContext(
+        gathered_info=info_text,
+        sources=sources_text,
+        research_plan=plan_text,
+        tokens=count(info_text) + count(sources_text) + count(plan_text),
+        kept=kept,
+        dropped=total - kept,
+        duplicates=duplicates
+    )
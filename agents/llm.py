@@ -0,0 +1,265 @@
+"""
+LLM Factory & Response Cache
+에이전트 공용 LLM 생성 및 프롬프트 해시 기반 응답 캐시
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, TYPE_CHECKING
+
+from dotenv import load_dotenv
+
+from langchain_core.caches import BaseCache
+from langchain_core.messages import message_to_dict, messages_from_dict
+from langchain_core.outputs import ChatGeneration, Generation
+
+from tools.metrics import increment
+
+if TYPE_CHECKING:
+    from langchain_openai import ChatOpenAI
+
+load_dotenv()
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    """Generation 목록을 JSON 문자열로 직렬화"""
+    return json.dumps(
+        [
+            {"message": message_to_dict(g.message)} if isinstance(g, ChatGeneration)
+            else {"text": g.text}
+            for g in generations
+        ],
+        ensure_ascii=False
+    )
+
+
+def _load_generations(value: str) -> Sequence[Generation]:
+    """JSON 문자열을 Generation 목록으로 복원"""
+    generations = []
+    for item in json.loads(value):
+        if "message" in item:
+            message = messages_from_dict([item["message"]])[0]
+            generations.append(ChatGeneration(message=message))
+        else:
+            generations.append(Generation(text=item["text"]))
+    return generations
+
+
+class MemoryCacheBackend:
+    """메모리 LRU 캐시 백엔드"""
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self._data: "OrderedDict[str, str]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[str]:
+        value = self._data.get(key)
+        if value is not None:
+            self._data.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while self.max_entries > 0 and len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+class SQLiteCacheBackend:
+    """디스크(SQLite) 캐시 백엔드"""
+
+    def __init__(self, path: str):
+        self.path = path
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._conn.execute(
+            "SELECT value FROM llm_cache WHERE key = ?", (key,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        self._conn.execute(
+            "INSERT OR REPLACE INTO llm_cache (key, value) VALUES (?, ?)", (key, value)
+        )
+        self._conn.commit()
+
+    def clear(self) -> None:
+        self._conn.execute("DELETE FROM llm_cache")
+        self._conn.commit()
+
+
+class ResponseCache(BaseCache):
+    """
+    LLM 응답 캐시
+
+    키는 모델 설정 문자열(모델명, temperature 등)과 렌더링된 프롬프트의 해시.
+    메모리 LRU를 먼저 조회하고, 디스크 백엔드가 있으면 그 다음으로 조회함.
+    """
+
+    def __init__(
+        self,
+        memory: Optional[MemoryCacheBackend] = None,
+        disk: Optional[SQLiteCacheBackend] = None
+    ):
+        self.memory = memory or MemoryCacheBackend()
+        self.disk = disk
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, int]] = {}
+
+    @staticmethod
+    def make_key(prompt: str, llm_string: str) -> str:
+        """프롬프트 해시 키 생성"""
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        return self.lookup_for("default", prompt, llm_string)
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        key = self.make_key(prompt, llm_string)
+        value = _dump_generations(return_val)
+        with self._lock:
+            self.memory.set(key, value)
+            if self.disk is not None:
+                self.disk.set(key, value)
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self.memory.clear()
+            if self.disk is not None:
+                self.disk.clear()
+            self._stats.clear()
+
+    def lookup_for(
+        self,
+        agent: str,
+        prompt: str,
+        llm_string: str
+    ) -> Optional[Sequence[Generation]]:
+        """에이전트별 통계를 기록하며 캐시 조회"""
+        key = self.make_key(prompt, llm_string)
+        with self._lock:
+            value = self.memory.get(key)
+            if value is None and self.disk is not None:
+                value = self.disk.get(key)
+                if value is not None:
+                    self.memory.set(key, value)
+
+            counters = self._stats.setdefault(agent, {"hits": 0, "misses": 0})
+            counters["hits" if value is not None else "misses"] += 1
+
+        if value is None:
+            return None
+        increment("llm.cache_hits")
+        try:
+            return _load_generations(value)
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def stats(self) -> Dict[str, Any]:
+        """에이전트별 및 전체 적중 통계"""
+        with self._lock:
+            per_agent = {
+                agent: dict(
+                    counters,
+                    hit_rate=counters["hits"] / max(1, counters["hits"] + counters["misses"])
+                )
+                for agent, counters in self._stats.items()
+            }
+        hits = sum(c["hits"] for c in per_agent.values())
+        misses = sum(c["misses"] for c in per_agent.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "agents": per_agent
+        }
+
+
+class AgentCacheView(BaseCache):
+    """공유 ResponseCache를 에이전트 이름으로 감싸 통계를 분리하는 뷰"""
+
+    def __init__(self, cache: ResponseCache, agent: str):
+        self.cache = cache
+        self.agent = agent
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[Sequence[Generation]]:
+        return self.cache.lookup_for(self.agent, prompt, llm_string)
+
+    def update(self, prompt: str, llm_string: str, return_val: Sequence[Generation]) -> None:
+        self.cache.update(prompt, llm_string, return_val)
+
+    def clear(self, **kwargs: Any) -> None:
+        self.cache.clear(**kwargs)
+
+
+_shared_cache: Optional[ResponseCache] = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """모든 에이전트가 공유하는 응답 캐시"""
+    global _shared_cache
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            disk = None
+            if os.getenv("LLM_CACHE_BACKEND", "disk").lower() == "disk":
+                disk = SQLiteCacheBackend(
+                    os.getenv("LLM_CACHE_PATH", ".cache/llm_cache.sqlite")
+                )
+            _shared_cache = ResponseCache(
+                memory=MemoryCacheBackend(int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1000"))),
+                disk=disk
+            )
+        return _shared_cache
+
+
+def is_cache_enabled(agent: str) -> bool:
+    """에이전트별 캐시 사용 여부 (LLM_CACHE, LLM_CACHE_AGENTS 환경변수)"""
+    if os.getenv("LLM_CACHE", "on").lower() in ("0", "off", "false", "no"):
+        return False
+    agents = os.getenv("LLM_CACHE_AGENTS", "planner,researcher,reviewer")
+    return agent in {a.strip() for a in agents.split(",")}
+
+
+def create_llm(
+    agent: str,
+    temperature: float,
+    model_name: Optional[str] = None,
+    cache: Optional[bool] = None
+) -> "ChatOpenAI":
+    """
+    에이전트용 ChatOpenAI 생성
+
+    Args:
+        agent: 에이전트 이름 ("planner", "researcher", "writer", "reviewer")
+        temperature: 샘플링 온도
+        model_name: 모델 이름 (기본: OPENAI_MODEL 환경변수)
+        cache: 응답 캐시 사용 여부 (None이면 환경변수 설정을 따름)
+
+    Returns:
+        ChatOpenAI 인스턴스
+    """
+    # langchain_openai(openai SDK 포함)는 임포트 비용이 커서 실제 생성 시점에 로드
+    from langchain_openai import ChatOpenAI
+
+    use_cache = is_cache_enabled(agent) if cache is None else cache
+    return ChatOpenAI(
+        model=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
+        temperature=temperature,
+        cache=AgentCacheView(get_response_cache(), agent) if use_cache else False
+    )
@@ -3,21 +3,19 @@ Planner Agent
 리서치 계획 수립 및 검색 쿼리 생성 에이전트
 """
 
-import os
-from typing import List, Dict, Any
-from dotenv import load_dotenv
+from typing import List, Dict, Any, Optional
 
-from langchain_openai import ChatOpenAI
 # (langchain_core.prompts에서 필요한 템플릿 도구 임포트함)
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
 
 # (langchain_core.output_parsers에서 파서를 임포트함 - 이 줄이 꼭 필요함!)
 from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.language_models import BaseChatModel
 
 # (데이터 구조 정의를 위해 pydantic에서 BaseModel 등을 임포트함)
 from pydantic import BaseModel, Field
 
-load_dotenv()
+from .llm import create_llm
 
 
 class ResearchPlan(BaseModel):
@@ -31,11 +29,13 @@ class ResearchPlan(BaseModel):
 class PlannerAgent:
     """리서치 계획 수립 에이전트"""
     
-    def __init__(self, model_name: str = None):
-        self.llm = ChatOpenAI(
-            model=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.3
-        )
+    def __init__(
+        self,
+        model_name: str = None,
+        cache: Optional[bool] = None,
+        llm: Optional[BaseChatModel] = None
+    ):
+        self.llm = llm or create_llm("planner", temperature=0.3, model_name=model_name, cache=cache)
         self.parser = PydanticOutputParser(pydantic_object=ResearchPlan)
         
         self.prompt = ChatPromptTemplate.from_messages([
@@ -76,18 +76,36 @@ class PlannerAgent:
                 "format_instructions": self.parser.get_format_instructions()
             })
             
-            return {
-                "success": True,
-                "topic_summary": result.topic_summary,
-                "key_aspects": result.key_aspects,
-                "search_queries": result.search_queries,
-                "expected_sections": result.expected_sections
-            }
+            return self._plan_from(result)
             
         except Exception as e:
             # 파싱 실패 시 기본 계획 생성
             return self._fallback_plan(topic, str(e))
     
+    async def acreate_plan(self, topic: str) -> Dict[str, Any]:
+        """create_plan의 비동기 버전"""
+        try:
+            chain = self.prompt | self.llm | self.parser
+            
+            result = await chain.ainvoke({
+                "topic": topic,
+                "format_instructions": self.parser.get_format_instructions()
+            })
+            
+            return self._plan_from(result)
+            
+        except Exception as e:
+            return self._fallback_plan(topic, str(e))
+    
+    def _plan_from(self, result: ResearchPlan) -> Dict[str, Any]:
+        return {
+            "success": True,
+            "topic_summary": result.topic_summary,
+            "key_aspects": result.key_aspects,
+            "search_queries": result.search_queries,
+            "expected_sections": result.expected_sections
+        }
+    
     def _fallback_plan(self, topic: str, error: str) -> Dict[str, Any]:
         """파싱 실패 시 기본 계획"""
         return {
@@ -117,21 +135,38 @@ class PlannerAgent:
         }
 
 
-def plan_research(state: Dict[str, Any]) -> Dict[str, Any]:
+def plan_research(
+    state: Dict[str, Any],
+    planner: Optional[PlannerAgent] = None
+) -> Dict[str, Any]:
     """
     LangGraph 노드 함수: 리서치 계획 수립
     
     Args:
         state: 현재 상태
+        planner: 재사용할 에이전트 (없으면 새로 생성)
         
     Returns:
         업데이트된 상태
     """
     print("\n📋 리서치 계획 수립 중...")
     
-    planner = PlannerAgent()
-    plan = planner.create_plan(state["topic"])
+    planner = planner or PlannerAgent()
+    return _plan_update(planner.create_plan(state["topic"]))
+
+
+async def aplan_research(
+    state: Dict[str, Any],
+    planner: Optional[PlannerAgent] = None
+) -> Dict[str, Any]:
+    """LangGraph 비동기 노드 함수: 리서치 계획 수립"""
+    print("\n📋 리서치 계획 수립 중...")
     
+    planner = planner or PlannerAgent()
+    return _plan_update(await planner.acreate_plan(state["topic"]))
+
+
+def _plan_update(plan: Dict[str, Any]) -> Dict[str, Any]:
     print(f"   ✅ 검색 쿼리 {len(plan['search_queries'])}개 생성됨")
     
     # 계획 요약 출력
@@ -3,28 +3,60 @@ Researcher Agent
 웹 검색 및 정보 수집 에이전트
 """
 
+import asyncio
 import os
-from typing import List, Dict, Any
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
 
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate, PromptTemplate
+from langchain_core.language_models import BaseChatModel
 
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from tools.web_search import search_web
+from tools.web_search import get_search_tool
+from tools.dedup import ResultDeduplicator
+from tools.ranking import select_passages
+from tools import metrics
+from tools.blob_store import store_text, store_texts
 
-load_dotenv()
+from .llm import create_llm
 
 
 class ResearcherAgent:
     """웹 검색 및 정보 수집 에이전트"""
     
-    def __init__(self, model_name: str = None):
-        self.llm = ChatOpenAI(
-            model=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0
+    def __init__(
+        self,
+        model_name: str = None,
+        cache: Optional[bool] = None,
+        llm: Optional[BaseChatModel] = None,
+        search_tool: Any = None,
+        max_concurrency: Optional[int] = None,
+        summary_concurrency: Optional[int] = None,
+        scraper: Any = None,
+        enrich_top_k: Optional[int] = None,
+        enrich_budget: Optional[float] = None
+    ):
+        self.llm = llm or create_llm("researcher", temperature=0, model_name=model_name, cache=cache)
+        # 검색 도구는 한 번만 만들어 모든 쿼리에서 재사용
+        self.search_tool = search_tool or get_search_tool()
+        # 동시에 처리할 쿼리 수 (1이면 순차 실행)
+        self.max_concurrency = max(
+            1, max_concurrency or int(os.getenv("RESEARCH_MAX_CONCURRENCY", "4"))
+        )
+        # 배치 요약 시 동시에 보낼 LLM 요청 수
+        self.summary_concurrency = max(
+            1, summary_concurrency or int(os.getenv("SUMMARY_MAX_CONCURRENCY", "8"))
+        )
+        # 본문 보강: 점수 상위 결과 페이지를 스크랩해 요약에 사용 (0이면 사용 안 함)
+        self.enrich_top_k = max(0, enrich_top_k if enrich_top_k is not None else int(
+            os.getenv("SCRAPE_ENRICH_TOP_K", "0")
+        ))
+        # 보강 단계 전체 시간 예산(초). 마감까지 끝나지 않은 페이지는 검색 스니펫 사용
+        self.enrich_budget = enrich_budget if enrich_budget is not None else float(
+            os.getenv("SCRAPE_ENRICH_BUDGET", "8")
         )
+        self._scraper = scraper
         
         self.summary_prompt = ChatPromptTemplate.from_messages([
             ("system", """당신은 정보 분석 전문가입니다.
@@ -40,6 +72,14 @@ class ResearcherAgent:
 - 최대 5개 포인트로 요약""")
         ])
     
+    @property
+    def scraper(self):
+        """본문 보강용 스크래퍼 (보강을 켠 경우에만 최초 접근 시 로드)"""
+        if self._scraper is None:
+            from tools.scraper import get_scraper
+            self._scraper = get_scraper()
+        return self._scraper
+    
     def search_and_collect(
         self,
         queries: List[str],
@@ -55,31 +95,74 @@ class ResearcherAgent:
         Returns:
             수집된 정보 딕셔너리
         """
+        # 1단계: 모든 쿼리 검색 (동시 실행)
+        outcomes = self._search_all(queries, max_results_per_query)
+        
+        # 중복/유사 결과 제거 (요약 전에 걸러 요약 및 작성자 프롬프트 토큰 절약)
+        self._dedupe(outcomes)
+        
+        # 점수 상위 결과는 페이지 본문으로 보강 (시간 예산 내에서만)
+        targets = self._enrich_targets(outcomes)
+        if targets:
+            try:
+                pages = self.scraper.scrape_many([r["url"] for r in targets], timeout=self.enrich_budget)
+            except Exception as e:
+                print(f"   ⚠️  본문 보강 오류: {e}")
+                pages = []
+            self._apply_enrichment(targets, pages)
+        
+        # 2단계: 결과가 있는 쿼리만 모아 한 번에 배치 요약
+        to_summarize = [o for o in outcomes if o["results"]]
+        summaries = self._summarize_batch(
+            [(o["query"], o["results"]) for o in to_summarize]
+        )
+        return self._collect(outcomes, to_summarize, summaries)
+    
+    async def asearch_and_collect(
+        self,
+        queries: List[str],
+        max_results_per_query: int = 3
+    ) -> Dict[str, Any]:
+        """search_and_collect의 비동기 버전 (검색과 요약이 이벤트 루프를 막지 않음)"""
+        outcomes = await self._asearch_all(queries, max_results_per_query)
+        self._dedupe(outcomes)
+        
+        targets = self._enrich_targets(outcomes)
+        if targets:
+            try:
+                pages = await self.scraper.scrape_multiple(
+                    [r["url"] for r in targets], timeout=self.enrich_budget
+                )
+            except Exception as e:
+                print(f"   ⚠️  본문 보강 오류: {e}")
+                pages = []
+            self._apply_enrichment(targets, pages)
+        
+        to_summarize = [o for o in outcomes if o["results"]]
+        summaries = await self._asummarize_batch(
+            [(o["query"], o["results"]) for o in to_summarize]
+        )
+        return self._collect(outcomes, to_summarize, summaries)
+    
+    def _collect(
+        self,
+        outcomes: List[Dict[str, Any]],
+        summarized: List[Dict[str, Any]],
+        summaries: List[str]
+    ) -> Dict[str, Any]:
+        """쿼리별 결과와 요약을 입력 순서대로 합침"""
+        for outcome, summary in zip(summarized, summaries):
+            outcome["summary"] = summary
+        
         all_results = []
         all_sources = []
         gathered_info = []
         
-        for query in queries:
-            print(f"   🔍 검색 중: {query}")
-            
-            try:
-                results = search_web(query, max_results=max_results_per_query)
-                
-                for result in results:
-                    all_results.append(result)
-                    all_sources.append({
-                        "title": result.get("title", ""),
-                        "url": result.get("url", ""),
-                        "query": query
-                    })
-                
-                # 검색 결과 요약
-                if results:
-                    summary = self._summarize_results(query, results)
-                    gathered_info.append(summary)
-                    
-            except Exception as e:
-                print(f"   ⚠️  검색 오류 ({query}): {e}")
+        for outcome in outcomes:
+            all_results.extend(outcome["results"])
+            all_sources.extend(outcome["sources"])
+            if outcome.get("summary"):
+                gathered_info.append(outcome["summary"])
         
         return {
             "search_results": all_results,
@@ -87,59 +170,268 @@ class ResearcherAgent:
             "gathered_info": gathered_info
         }
     
-    def _summarize_results(self, query: str, results: List[Dict]) -> str:
-        """검색 결과 요약"""
-        # 검색 결과를 텍스트로 변환
-        results_text = ""
-        for i, r in enumerate(results, 1):
-            results_text += f"\n[{i}] {r.get('title', 'No title')}\n"
-            results_text += f"URL: {r.get('url', 'No URL')}\n"
-            results_text += f"내용: {r.get('content', 'No content')[:500]}\n"
+    def _search_all(self, queries: List[str], max_results: int) -> List[Dict[str, Any]]:
+        """모든 쿼리 검색 (입력 순서 유지)"""
+        if self.max_concurrency > 1 and len(queries) > 1:
+            workers = min(self.max_concurrency, len(queries))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # 입력 순서대로 결과를 모으므로 출처 순서가 항상 동일함
+                # (metrics.bind로 실행 지표 구간을 작업 스레드에 전달)
+                futures = [
+                    executor.submit(metrics.bind(self._search_query), q, max_results)
+                    for q in queries
+                ]
+                return [future.result() for future in futures]
+        return [self._search_query(q, max_results) for q in queries]
+    
+    async def _asearch_all(self, queries: List[str], max_results: int) -> List[Dict[str, Any]]:
+        """모든 쿼리 비동기 검색 (최대 max_concurrency개 동시, 입력 순서 유지)"""
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        
+        async def search(query: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._asearch_query(query, max_results)
+        
+        return list(await asyncio.gather(*(search(q) for q in queries)))
+    
+    def _dedupe(self, outcomes: List[Dict[str, Any]]) -> None:
+        """쿼리 순서대로 앞서 나온 결과와 겹치는 결과 및 출처를 제거"""
+        deduplicator = ResultDeduplicator()
+        for outcome in outcomes:
+            kept = deduplicator.filter(outcome["results"])
+            urls = {r.get("url", "") for r in kept}
+            outcome["results"] = kept
+            outcome["sources"] = [s for s in outcome["sources"] if s.get("url", "") in urls]
+        
+        url_dups, content_dups = deduplicator.stats()
+        if url_dups or content_dups:
+            print(f"   🧹 중복 결과 제거: URL {url_dups}개, 유사 내용 {content_dups}개")
+    
+    def _enrich_targets(self, outcomes: List[Dict[str, Any]]) -> List[Dict]:
+        """전체 쿼리에서 점수 상위 enrich_top_k개 결과 (이미 본문이 있는 결과는 제외)"""
+        if not self.enrich_top_k:
+            return []
+        candidates = [
+            r for o in outcomes for r in o["results"]
+            if not r.get("raw_content") and r.get("url", "").startswith(("http://", "https://"))
+        ]
+        candidates.sort(key=lambda r: r.get("score") or 0.0, reverse=True)
+        return candidates[:self.enrich_top_k]
+    
+    def _apply_enrichment(self, targets: List[Dict], pages: List[Dict[str, Any]]) -> None:
+        """스크랩에 성공한 페이지 본문을 raw_content로 붙임 (요약 시 BM25로 관련 문단만 발췌)"""
+        enriched = 0
+        skipped = 0
+        for result, page in zip(targets, pages):
+            if page and page.get("success") and len(page.get("content", "")) > len(result.get("content", "")):
+                result["raw_content"] = page["content"]
+                enriched += 1
+            elif page and page.get("error_type") == "deadline":
+                skipped += 1
+        print(f"   📄 본문 보강: {enriched}/{len(targets)}개 페이지"
+              + (f" (시간 예산 초과 {skipped}개 제외)" if skipped else ""))
+    
+    def _search_query(self, query: str, max_results: int) -> Dict[str, Any]:
+        """
+        단일 쿼리 검색
+        
+        쿼리별로 오류를 격리하여 한 쿼리의 실패가 다른 쿼리에 영향을 주지 않음
+        """
+        print(f"   🔍 검색 중: {query}")
+        
+        outcome = {"query": query, "results": [], "sources": []}
+        metrics.increment("search.calls")
         
         try:
-            chain = self.summary_prompt | self.llm
-            response = chain.invoke({
-                "query": query,
-                "search_results": results_text
-            })
-            return f"### {query}\n\n{response.content}"
+            results = self.search_tool.search(query, max_results=max_results)
+            self._fill_outcome(outcome, results)
         except Exception as e:
-            # LLM 호출 실패 시 기본 요약
-            return f"### {query}\n\n" + "\n".join(
-                f"- {r.get('title', 'N/A')} [출처: {r.get('url', 'N/A')}]"
-                for r in results[:3]
+            print(f"   ⚠️  검색 오류 ({query}): {e}")
+        
+        return outcome
+    
+    async def _asearch_query(self, query: str, max_results: int) -> Dict[str, Any]:
+        """
+        단일 쿼리 비동기 검색
+        
+        검색 도구에 asearch가 없으면 동기 search를 작업 스레드에서 실행함
+        """
+        print(f"   🔍 검색 중: {query}")
+        
+        outcome = {"query": query, "results": [], "sources": []}
+        metrics.increment("search.calls")
+        
+        try:
+            asearch = getattr(self.search_tool, "asearch", None)
+            if asearch is not None:
+                results = await asearch(query, max_results=max_results)
+            else:
+                results = await asyncio.to_thread(
+                    self.search_tool.search, query, max_results=max_results
+                )
+            self._fill_outcome(outcome, results)
+        except Exception as e:
+            print(f"   ⚠️  검색 오류 ({query}): {e}")
+        
+        return outcome
+    
+    def _fill_outcome(self, outcome: Dict[str, Any], results: List[Dict]) -> None:
+        # 검색 도구가 공유하는 결과 객체(SharedSearchTool 등)를 보강 단계에서 수정하지 않도록 복사
+        outcome["results"] = [dict(result) for result in results]
+        outcome["sources"] = [
+            {
+                "title": result.get("title", ""),
+                "url": result.get("url", ""),
+                "query": outcome["query"]
+            }
+            for result in results
+        ]
+    
+    def _summarize_batch(self, items: List[Tuple[str, List[Dict]]]) -> List[str]:
+        """
+        여러 쿼리의 검색 결과를 Runnable.batch로 한 번에 요약
+        
+        Args:
+            items: (쿼리, 검색 결과) 목록
+            
+        Returns:
+            입력 순서와 동일한 요약 목록 (실패한 항목은 기본 요약)
+        """
+        if not items:
+            return []
+        
+        chain = self.summary_prompt | self.llm
+        try:
+            responses = chain.batch(
+                self._summary_inputs(items),
+                config={"max_concurrency": self.summary_concurrency},
+                return_exceptions=True
+            )
+        except Exception as e:
+            responses = [e] * len(items)
+        
+        return self._summaries(items, responses)
+    
+    async def _asummarize_batch(self, items: List[Tuple[str, List[Dict]]]) -> List[str]:
+        """_summarize_batch의 비동기 버전 (Runnable.abatch)"""
+        if not items:
+            return []
+        
+        chain = self.summary_prompt | self.llm
+        try:
+            responses = await chain.abatch(
+                self._summary_inputs(items),
+                config={"max_concurrency": self.summary_concurrency},
+                return_exceptions=True
             )
+        except Exception as e:
+            responses = [e] * len(items)
+        
+        return self._summaries(items, responses)
+    
+    def _summary_inputs(self, items: List[Tuple[str, List[Dict]]]) -> List[Dict[str, str]]:
+        return [
+            {"query": query, "search_results": self._format_results(query, results)}
+            for query, results in items
+        ]
+    
+    def _summaries(self, items: List[Tuple[str, List[Dict]]], responses: List[Any]) -> List[str]:
+        """배치 응답을 요약 목록으로 변환 (실패한 항목은 기본 요약)"""
+        summaries = []
+        for (query, results), response in zip(items, responses):
+            if isinstance(response, Exception):
+                # LLM 호출 실패 시 항목별 기본 요약
+                summaries.append(self._fallback_summary(query, results))
+            else:
+                summaries.append(f"### {query}\n\n{response.content}")
+        
+        return summaries
+    
+    def _format_results(self, query: str, results: List[Dict]) -> str:
+        """검색 결과를 프롬프트용 텍스트로 변환 (본문은 쿼리 관련 문단만 발췌)"""
+        excerpts = select_passages(
+            query,
+            [r.get("raw_content") or r.get("content") or "No content" for r in results]
+        )
+        results_text = ""
+        for i, (r, excerpt) in enumerate(zip(results, excerpts), 1):
+            results_text += f"\n[{i}] {r.get('title', 'No title')}\n"
+            results_text += f"URL: {r.get('url', 'No URL')}\n"
+            results_text += f"내용: {excerpt}\n"
+        return results_text
+    
+    def _fallback_summary(self, query: str, results: List[Dict]) -> str:
+        """LLM 요약 실패 시 제목/URL 기반 기본 요약"""
+        return f"### {query}\n\n" + "\n".join(
+            f"- {r.get('title', 'N/A')} [출처: {r.get('url', 'N/A')}]"
+            for r in results[:3]
+        )
 
 
-def execute_research(state: Dict[str, Any]) -> Dict[str, Any]:
+def execute_research(
+    state: Dict[str, Any],
+    researcher: Optional[ResearcherAgent] = None
+) -> Dict[str, Any]:
     """
     LangGraph 노드 함수: 리서치 실행
     
     Args:
         state: 현재 상태
+        researcher: 재사용할 에이전트 (없으면 새로 생성)
         
     Returns:
         업데이트된 상태
     """
     print("\n🔎 리서치 실행 중...")
     
-    researcher = ResearcherAgent()
+    researcher = researcher or ResearcherAgent()
     queries = state.get("search_queries", [])
     
     if not queries:
-        return {
-            "errors": ["검색 쿼리가 없습니다."],
-            "current_step": "research_failed"
-        }
+        return _no_queries()
     
-    results = researcher.search_and_collect(queries)
+    return _research_update(researcher.search_and_collect(queries))
+
+
+async def aexecute_research(
+    state: Dict[str, Any],
+    researcher: Optional[ResearcherAgent] = None
+) -> Dict[str, Any]:
+    """LangGraph 비동기 노드 함수: 리서치 실행"""
+    print("\n🔎 리서치 실행 중...")
+    
+    researcher = researcher or ResearcherAgent()
+    queries = state.get("search_queries", [])
     
+    if not queries:
+        return _no_queries()
+    
+    return _research_update(await researcher.asearch_and_collect(queries))
+
+
+def _no_queries() -> Dict[str, Any]:
+    return {
+        "errors": ["검색 쿼리가 없습니다."],
+        "current_step": "research_failed"
+    }
+
+
+def _research_update(results: Dict[str, Any]) -> Dict[str, Any]:
     print(f"   ✅ {len(results['search_results'])}개 결과 수집됨")
     print(f"   📚 {len(results['sources'])}개 출처 기록됨")
     
+    # 본문과 요약은 blob 저장소에 두고 상태에는 참조만 담음
+    # (제목/쿼리는 같은 순서의 sources에 있으므로 검색 결과에는 다시 넣지 않음)
     return {
-        "search_results": results["search_results"],
+        "search_results": [
+            {
+                "url": result.get("url", ""),
+                "score": result.get("score", 0.0),
+                "content_id": store_text(result.get("content", ""))
+            }
+            for result in results["search_results"]
+        ],
         "sources": results["sources"],
-        "gathered_info": results["gathered_info"],
+        "gathered_info": store_texts(results["gathered_info"]),
         "current_step": "research_complete"
     }
@@ -3,56 +3,265 @@ Reviewer Agent - 보고서 검토 에이전트
 """
 
 import os
-from typing import Dict, Any
-from dotenv import load_dotenv
-from langchain_openai import ChatOpenAI
+import re
+from typing import Dict, Any, List, Optional, Tuple
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.output_parsers import PydanticOutputParser
+from langchain_core.language_models import BaseChatModel
+from pydantic import BaseModel, Field
 
-load_dotenv()
+from tools.blob_store import load_text
+
+from .llm import create_llm
+from .sections import Section, split_sections
+
+# 검토 청크 최대 길이 (자). 섹션 단위로 묶어 이 길이를 넘지 않게 나누며,
+# 이보다 긴 섹션은 문단 경계로 나눠 조각마다 섹션 제목 줄을 붙임
+REVIEW_CHUNK_CHARS = int(os.getenv("REVIEW_CHUNK_CHARS", "4000"))
+REVIEW_MAX_CONCURRENCY = int(os.getenv("REVIEW_MAX_CONCURRENCY", "4"))
+
+
+class SectionFeedback(BaseModel):
+    """섹션별 피드백"""
+    section: str = Field(description="수정이 필요한 섹션 제목 (섹션 목록의 제목 그대로)")
+    feedback: str = Field(description="해당 섹션에 대한 구체적인 수정 요청")
+
+
+class ReviewResult(BaseModel):
+    """검토 결과 출력 스키마"""
+    score: int = Field(description="검토한 부분의 품질 점수 (1-10)")
+    feedback: str = Field(description="검토한 부분의 평가 요약")
+    section_feedback: List[SectionFeedback] = Field(
+        default_factory=list, description="수정이 필요한 섹션별 피드백 (없으면 빈 목록)"
+    )
 
 
 class ReviewerAgent:
     """보고서 검토 에이전트"""
     
-    def __init__(self, model_name: str = None):
-        self.llm = ChatOpenAI(
-            model=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.2
-        )
+    def __init__(
+        self,
+        model_name: str = None,
+        cache: Optional[bool] = None,
+        llm: Optional[BaseChatModel] = None,
+        chunk_chars: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ):
+        self.llm = llm or create_llm("reviewer", temperature=0.2, model_name=model_name, cache=cache)
+        self.parser = PydanticOutputParser(pydantic_object=ReviewResult)
+        self.chunk_chars = chunk_chars or REVIEW_CHUNK_CHARS
+        self.max_concurrency = max_concurrency or REVIEW_MAX_CONCURRENCY
         
         self.review_prompt = ChatPromptTemplate.from_messages([
-            ("system", "당신은 전문 편집자입니다. 보고서 품질을 1-10점으로 평가하세요."),
-            ("human", "주제: {topic}\n\n보고서:\n{report}\n\n평가해주세요.")
+            ("system", "당신은 전문 편집자입니다. 보고서의 일부({part})를 받아 품질을 1-10점으로 평가하세요.\n"
+                       "받은 부분만 평가하고, 수정이 필요한 부분은 어느 섹션인지 섹션 제목으로 지정하세요.\n\n"
+                       "{format_instructions}"),
+            ("human", "주제: {topic}\n\n전체 섹션 목록:\n{sections}\n\n검토할 부분:\n{report}\n\n평가해주세요.")
         ])
     
     def review(self, topic: str, report: str) -> Dict[str, Any]:
+        """
+        보고서 전체 검토 (map-reduce)
+        
+        섹션 단위 청크로 나눠 병렬로 검토한 뒤, 청크 길이로 가중 평균한 점수와
+        섹션별 피드백으로 합침. 검토에 실패한 청크는 피드백에 명시하고
+        검토된 비율을 coverage로 반환함
+        """
         try:
+            chunks, inputs = self._review_inputs(topic, report)
             chain = self.review_prompt | self.llm
-            response = chain.invoke({"topic": topic, "report": report[:4000]})
-            score = 7  # 기본 점수
-            if "우수" in response.content or "훌륭" in response.content:
-                score = 9
-            elif "개선" in response.content or "부족" in response.content:
-                score = 5
-            return {
-                "quality_score": score,
-                "is_acceptable": score >= 6,
-                "feedback": response.content,
-                "needs_revision": score < 6
-            }
+            responses = chain.batch(
+                inputs,
+                config={"max_concurrency": self.max_concurrency},
+                return_exceptions=True
+            )
+            return self._reduce_responses(chunks, responses)
+        except Exception as e:
+            return self._failed_review(e)
+    
+    async def areview(self, topic: str, report: str) -> Dict[str, Any]:
+        """review의 비동기 버전 (청크 검토를 abatch로 실행)"""
+        try:
+            chunks, inputs = self._review_inputs(topic, report)
+            chain = self.review_prompt | self.llm
+            responses = await chain.abatch(
+                inputs,
+                config={"max_concurrency": self.max_concurrency},
+                return_exceptions=True
+            )
+            return self._reduce_responses(chunks, responses)
         except Exception as e:
-            return {"quality_score": 6, "is_acceptable": True, "feedback": str(e), "needs_revision": False}
+            return self._failed_review(e)
+    
+    def _review_inputs(self, topic: str, report: str) -> Tuple[List[str], List[Dict[str, str]]]:
+        """보고서를 청크로 나누고 청크별 프롬프트 입력 생성"""
+        sections = split_sections(report)
+        chunks = self._chunk_sections(sections)
+        titles = [s.title for s in sections if s.title]
+        section_list = "\n".join(f"- {title}" for title in titles) or "- (섹션 없음)"
+        inputs = [
+            {
+                "topic": topic,
+                "part": f"{i}/{len(chunks)}",
+                "sections": section_list,
+                "report": chunk,
+                "format_instructions": self.parser.get_format_instructions()
+            }
+            for i, chunk in enumerate(chunks, 1)
+        ]
+        return chunks, inputs
+    
+    def _reduce_responses(self, chunks: List[str], responses: List[Any]) -> Dict[str, Any]:
+        """청크 응답을 (청크 번호, 길이, 검토 결과 또는 예외) 목록으로 모아 합침"""
+        reviews = [
+            (i, len(chunk), response if isinstance(response, Exception) else self._parse_review(response.content))
+            for i, (chunk, response) in enumerate(zip(chunks, responses), 1)
+        ]
+        if all(isinstance(review, Exception) for _, _, review in reviews):
+            raise RuntimeError(f"모든 청크 검토 실패: {reviews[0][2]}")
+        
+        return self._reduce(reviews)
+    
+    def _failed_review(self, error: Exception) -> Dict[str, Any]:
+        return {"quality_score": 6, "is_acceptable": True, "feedback": str(error),
+                "section_feedback": {}, "needs_revision": False, "coverage": 0.0}
+    
+    def _chunk_sections(self, sections: List[Section]) -> List[str]:
+        """섹션을 순서대로 묶어 chunk_chars 이하의 청크로 나눔"""
+        chunks: List[str] = []
+        current = ""
+        for section in sections:
+            for piece in self._split_section(section):
+                if current and len(current) + len(piece) > self.chunk_chars:
+                    chunks.append(current)
+                    current = ""
+                current += piece
+        if current.strip() or not chunks:
+            chunks.append(current)
+        return chunks
+    
+    def _split_section(self, section: Section) -> List[str]:
+        """chunk_chars를 넘는 섹션을 문단 경계로 나눔 (조각마다 섹션 제목 줄을 붙여 피드백 대상 유지)"""
+        if len(section.text) <= self.chunk_chars:
+            return [section.text]
+        
+        if section.title:
+            heading, _, body = section.text.partition("\n")
+            prefix = f"{heading}\n"
+        else:
+            prefix, body = "", section.text
+        budget = max(1, self.chunk_chars - len(prefix))
+        
+        pieces: List[str] = []
+        current = ""
+        for block in _split_blocks(body, budget):
+            if current and len(current) + len(block) > budget:
+                pieces.append(prefix + current)
+                current = ""
+            current += block
+        if current.strip() or not pieces:
+            pieces.append(prefix + current)
+        return pieces
+    
+    def _parse_review(self, content: str) -> Dict[str, Any]:
+        """청크 검토 응답 파싱 (구조화 출력 실패 시 키워드 기반 추정)"""
+        try:
+            result = self.parser.parse(content)
+        except Exception:
+            return self._heuristic_review(content)
+        return {
+            "score": max(1, min(10, result.score)),
+            "feedback": result.feedback,
+            "section_feedback": {item.section: item.feedback for item in result.section_feedback}
+        }
+    
+    def _heuristic_review(self, content: str) -> Dict[str, Any]:
+        """구조화 출력 파싱 실패 시 키워드 기반 점수 추정"""
+        score = 7  # 기본 점수
+        if "우수" in content or "훌륭" in content:
+            score = 9
+        elif "개선" in content or "부족" in content:
+            score = 5
+        return {"score": score, "feedback": content, "section_feedback": {}}
+    
+    def _reduce(self, reviews: List[Tuple[int, int, Any]]) -> Dict[str, Any]:
+        """
+        청크 검토 결과를 전체 점수와 섹션별 피드백으로 합침
+        
+        reviews는 (청크 번호, 길이, 검토 결과 또는 예외) 목록이며, 점수는 검토된 청크로만
+        계산하고 실패한 청크는 피드백에 청크 번호와 함께 남김
+        """
+        done = [(length, review) for _, length, review in reviews if not isinstance(review, Exception)]
+        total = sum(length for length, _ in done) or 1
+        score = round(sum(length * review["score"] for length, review in done) / total)
+        # 한 청크라도 크게 부족하면 평균에 묻히지 않도록 최저 점수 + 2로 상한
+        score = max(1, min(score, min(review["score"] for _, review in done) + 2))
+        coverage = sum(length for length, _ in done) / (sum(length for _, length, _ in reviews) or 1)
+        
+        section_feedback: Dict[str, str] = {}
+        for _, review in done:
+            for title, text in review["section_feedback"].items():
+                section_feedback[title] = (section_feedback.get(title, "") + "\n" + text).strip()
+        
+        if len(reviews) == 1:
+            feedback = done[0][1]["feedback"]
+        else:
+            lines = []
+            for i, _, review in reviews:
+                if isinstance(review, Exception):
+                    lines.append(f"[{i}/{len(reviews)}] 검토 실패: {type(review).__name__}: {review}")
+                else:
+                    lines.append(f"[{i}/{len(reviews)}] ({review['score']}/10) {review['feedback']}")
+            feedback = "\n".join(lines)
+        if coverage < 1:
+            failed = len(reviews) - len(done)
+            feedback = (f"⚠️ 청크 {failed}/{len(reviews)}개 검토 실패 — "
+                        f"점수는 보고서의 {coverage:.0%}만 반영\n{feedback}")
+        
+        return {
+            "quality_score": score,
+            "is_acceptable": score >= 6,
+            "feedback": feedback,
+            "section_feedback": section_feedback,
+            "needs_revision": score < 6,
+            "coverage": coverage
+        }
+
 
+def _split_blocks(text: str, limit: int) -> List[str]:
+    """문단(빈 줄로 구분) 단위로 나누고, limit보다 긴 문단은 줄, 그래도 길면 글자 수로 나눔"""
+    blocks: List[str] = []
+    for paragraph in re.findall(r".*?(?:\n[ \t]*\n+|\Z)", text, re.S):
+        if len(paragraph) <= limit:
+            blocks.append(paragraph)
+            continue
+        for line in paragraph.splitlines(keepends=True):
+            blocks.extend(line[i:i + limit] for i in range(0, len(line), limit))
+    return [block for block in blocks if block]
 
-def review_report(state: Dict[str, Any]) -> Dict[str, Any]:
+
+def review_report(state: Dict[str, Any], reviewer: Optional[ReviewerAgent] = None) -> Dict[str, Any]:
     print("\n🔍 보고서 검토 중...")
-    reviewer = ReviewerAgent()
+    reviewer = reviewer or ReviewerAgent()
+    return _review_update(state, reviewer.review(state.get("topic", ""), load_text(state.get("draft_report"))))
+
+
+async def areview_report(state: Dict[str, Any], reviewer: Optional[ReviewerAgent] = None) -> Dict[str, Any]:
+    print("\n🔍 보고서 검토 중...")
+    reviewer = reviewer or ReviewerAgent()
+    return _review_update(state, await reviewer.areview(state.get("topic", ""), load_text(state.get("draft_report"))))
+
+
+def _review_update(state: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
+    # 초안 참조를 그대로 최종 보고서로 사용 (본문을 다시 저장하지 않음)
     draft = state.get("draft_report", "")
-    result = reviewer.review(state.get("topic", ""), draft)
     print(f"   ✅ 품질 점수: {result['quality_score']}/10")
+    if result.get("coverage", 1.0) < 1:
+        print(f"   ⚠️  일부 청크 검토 실패 (검토된 비율 {result['coverage']:.0%})")
     
     if result["is_acceptable"]:
-        return {"review_feedback": result["feedback"], "final_report": draft, 
+        return {"review_feedback": result["feedback"], "section_feedback": {}, "final_report": draft, 
                 "needs_revision": False, "current_step": "review_complete"}
-    return {"review_feedback": result["feedback"], "needs_revision": True,
-            "iteration_count": state.get("iteration_count", 0) + 1, "current_step": "needs_revision"}
+    return {"review_feedback": result["feedback"], "section_feedback": result["section_feedback"],
+            "needs_revision": True, "iteration_count": state.get("iteration_count", 0) + 1,
+            "current_step": "needs_revision"}
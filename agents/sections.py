@@ -0,0 +1,87 @@
+"""
+Markdown Sections
+보고서를 Markdown 섹션 단위로 나누고 다시 합치는 유틸리티
+"""
+
+import re
+from typing import Dict, List, NamedTuple, Optional
+
+# 섹션 경계로 사용하는 최대 제목 수준 (# 제목, ## 섹션)
+SECTION_LEVEL = 2
+
+_HEADING = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_FENCE = re.compile(r"^\s*(```|~~~)")
+
+
+class Section(NamedTuple):
+    """보고서 섹션 (text는 제목 줄을 포함한 원문 그대로)"""
+    title: str
+    level: int
+    text: str
+
+
+def normalize_title(title: str) -> str:
+    """비교용 제목 정규화 (번호, 강조 기호, 공백 제거)"""
+    title = re.sub(r"[*_`#]", "", title)
+    title = re.sub(r"^\s*(\d+(\.\d+)*\.?|[IVX]+\.)\s*", "", title)
+    return " ".join(title.split()).casefold()
+
+
+def split_sections(markdown: str) -> List[Section]:
+    """
+    Markdown을 섹션 목록으로 분할
+
+    제목 수준이 SECTION_LEVEL 이하인 줄에서 나누며, 첫 제목 이전의 내용
+    (메타데이터 등)은 제목이 빈 섹션이 됨. 코드 블록 안의 # 줄은 무시함.
+    join_sections(split_sections(x)) == x 가 항상 성립함.
+    """
+    sections: List[Section] = []
+    title, level, lines = "", 0, []
+    in_fence = False
+
+    for line in markdown.splitlines(keepends=True):
+        if _FENCE.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else _HEADING.match(line.rstrip("\r\n"))
+        if match and len(match.group(1)) <= SECTION_LEVEL:
+            if lines:
+                sections.append(Section(title, level, "".join(lines)))
+            title, level, lines = match.group(2).strip(), len(match.group(1)), []
+        lines.append(line)
+
+    if lines:
+        sections.append(Section(title, level, "".join(lines)))
+    return sections
+
+
+def join_sections(sections: List[Section]) -> str:
+    """섹션 목록을 하나의 Markdown으로 합침"""
+    return "".join(section.text for section in sections)
+
+
+def match_section(title: str, sections: List[Section]) -> Optional[int]:
+    """피드백에 적힌 섹션 제목과 일치하는 섹션 인덱스"""
+    wanted = normalize_title(title)
+    if not wanted:
+        return None
+    for i, section in enumerate(sections):
+        if section.title and normalize_title(section.title) == wanted:
+            return i
+    for i, section in enumerate(sections):
+        normalized = normalize_title(section.title)
+        if normalized and (wanted in normalized or normalized in wanted):
+            return i
+    return None
+
+
+def attribute_feedback(
+    feedback: Dict[str, str],
+    sections: List[Section]
+) -> Dict[int, str]:
+    """섹션 제목별 피드백을 섹션 인덱스별 피드백으로 변환 (매칭 실패 항목은 제외)"""
+    attributed: Dict[int, str] = {}
+    for title, text in feedback.items():
+        index = match_section(title, sections)
+        if index is not None and text.strip():
+            attributed[index] = (attributed.get(index, "") + "\n" + text).strip()
+    return attributed
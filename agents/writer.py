@@ -4,24 +4,35 @@ Writer Agent
 """
 
 import os
-from typing import Dict, Any, List
+from typing import Dict, Any, Callable, List, Optional, Tuple
 from datetime import datetime
-from dotenv import load_dotenv
 
-from langchain_openai import ChatOpenAI
 from langchain_core.prompts import ChatPromptTemplate
+from langchain_core.language_models import BaseChatModel
 
-load_dotenv()
+from tools.blob_store import load_text, load_texts, store_text
+
+from .llm import create_llm
+from .sections import SECTION_LEVEL, Section, split_sections, join_sections, attribute_feedback
+from .context import PackedContext, pack_context
+
+# 수정 모드: section(지적된 섹션만 재작성) | full(전체 재작성)
+REVISION_MODE = os.getenv("WRITER_REVISION_MODE", "section").lower()
 
 
 class WriterAgent:
     """보고서 작성 에이전트"""
     
-    def __init__(self, model_name: str = None):
-        self.llm = ChatOpenAI(
-            model=model_name or os.getenv("OPENAI_MODEL", "gpt-4o-mini"),
-            temperature=0.5
-        )
+    def __init__(
+        self,
+        model_name: str = None,
+        cache: Optional[bool] = None,
+        llm: Optional[BaseChatModel] = None,
+        context_tokens: Optional[int] = None
+    ):
+        self.llm = llm or create_llm("writer", temperature=0.5, model_name=model_name, cache=cache)
+        # 프롬프트 컨텍스트(수집 정보 + 출처 + 계획) 토큰 예산
+        self.context_tokens = context_tokens
         
         self.write_prompt = ChatPromptTemplate.from_messages([
             ("system", """당신은 전문 리서치 보고서 작성자입니다.
@@ -58,13 +69,42 @@ class WriterAgent:
 
 보고서 작성 시 반드시 출처를 인용하세요 (예: [1], [2]).""")
         ])
+        
+        self.revise_prompt = ChatPromptTemplate.from_messages([
+            ("system", """당신은 전문 리서치 보고서 작성자입니다.
+검토자의 피드백에 따라 보고서의 한 섹션만 수정합니다.
+
+수정 규칙:
+1. 주어진 섹션만 다시 작성하고 다른 섹션 내용은 출력하지 않음
+2. 섹션 제목 줄은 그대로 유지
+3. 기존 인용 번호 [1], [2] 체계를 유지
+4. Markdown 형식, 자연스러운 한국어 사용"""),
+            ("human", """주제: {topic}
+
+## 수집된 정보
+{gathered_info}
+
+## 출처 목록
+{sources}
+
+## 수정할 섹션
+{section}
+
+## 검토자 피드백
+{feedback}
+
+---
+
+피드백을 반영한 섹션 전체(제목 줄 포함)를 작성해주세요.""")
+        ])
     
     def write_report(
         self,
         topic: str,
         gathered_info: List[str],
         sources: List[Dict],
-        research_plan: str
+        research_plan: str,
+        on_token: Optional[Callable[[str], None]] = None
     ) -> str:
         """
         보고서 작성
@@ -74,26 +114,20 @@ class WriterAgent:
             gathered_info: 수집된 정보 목록
             sources: 출처 목록
             research_plan: 리서치 계획
+            on_token: 지정하면 LLM 응답을 스트리밍하며 토큰마다 호출됨
             
         Returns:
             작성된 보고서 (Markdown)
         """
-        # 정보 포맷팅
-        info_text = "\n\n".join(gathered_info) if gathered_info else "수집된 정보 없음"
-        
-        # 출처 포맷팅
-        sources_text = self._format_sources(sources)
+        inputs = self._write_inputs(topic, gathered_info, sources, research_plan)
         
         try:
             chain = self.write_prompt | self.llm
-            response = chain.invoke({
-                "topic": topic,
-                "gathered_info": info_text,
-                "sources": sources_text,
-                "research_plan": research_plan or "계획 없음"
-            })
             
-            report = response.content
+            if on_token is None:
+                report = chain.invoke(inputs).content
+            else:
+                report = self._stream(chain, inputs, on_token)
             
             # 메타데이터 추가
             report = self._add_metadata(report, topic)
@@ -103,27 +137,202 @@ class WriterAgent:
         except Exception as e:
             return self._fallback_report(topic, gathered_info, sources, str(e))
     
-    def _format_sources(self, sources: List[Dict]) -> str:
-        """출처 목록 포맷팅"""
-        if not sources:
-            return "출처 없음"
+    async def awrite_report(
+        self,
+        topic: str,
+        gathered_info: List[str],
+        sources: List[Dict],
+        research_plan: str,
+        on_token: Optional[Callable[[str], None]] = None
+    ) -> str:
+        """write_report의 비동기 버전"""
+        inputs = self._write_inputs(topic, gathered_info, sources, research_plan)
+        
+        try:
+            chain = self.write_prompt | self.llm
+            
+            if on_token is None:
+                report = (await chain.ainvoke(inputs)).content
+            else:
+                report = await self._astream(chain, inputs, on_token)
+            
+            return self._add_metadata(report, topic)
+            
+        except Exception as e:
+            return self._fallback_report(topic, gathered_info, sources, str(e))
+    
+    def _write_inputs(
+        self,
+        topic: str,
+        gathered_info: List[str],
+        sources: List[Dict],
+        research_plan: str
+    ) -> Dict[str, str]:
+        # 수집 정보/출처/계획을 토큰 예산 안에 맞춤
+        context = self._pack(gathered_info, sources, research_plan)
+        return {
+            "topic": topic,
+            "gathered_info": context.gathered_info,
+            "sources": context.sources,
+            "research_plan": context.research_plan
+        }
+    
+    def revise_report(
+        self,
+        topic: str,
+        draft: str,
+        section_feedback: Dict[str, str],
+        gathered_info: List[str],
+        sources: List[Dict]
+    ) -> Optional[str]:
+        """
+        피드백이 지정된 섹션만 다시 작성
+        
+        Args:
+            topic: 연구 주제
+            draft: 기존 보고서 초안
+            section_feedback: 섹션 제목별 수정 요청
+            gathered_info: 수집된 정보 목록
+            sources: 출처 목록
+            
+        Returns:
+            수정된 보고서 (나머지 섹션은 원문 그대로).
+            피드백을 어느 섹션에도 매칭하지 못하면 None
+        """
+        plan = self._revision_plan(topic, draft, section_feedback, gathered_info, sources)
+        if plan is None:
+            return None
+        
+        sections, indices, inputs = plan
+        chain = self.revise_prompt | self.llm
+        responses = chain.batch(inputs, return_exceptions=True)
+        return self._apply_revisions(sections, indices, responses)
+    
+    async def arevise_report(
+        self,
+        topic: str,
+        draft: str,
+        section_feedback: Dict[str, str],
+        gathered_info: List[str],
+        sources: List[Dict]
+    ) -> Optional[str]:
+        """revise_report의 비동기 버전"""
+        plan = self._revision_plan(topic, draft, section_feedback, gathered_info, sources)
+        if plan is None:
+            return None
+        
+        sections, indices, inputs = plan
+        chain = self.revise_prompt | self.llm
+        responses = await chain.abatch(inputs, return_exceptions=True)
+        return self._apply_revisions(sections, indices, responses)
+    
+    def _revision_plan(
+        self,
+        topic: str,
+        draft: str,
+        section_feedback: Dict[str, str],
+        gathered_info: List[str],
+        sources: List[Dict]
+    ) -> Optional[Tuple[List[Section], List[int], List[Dict[str, str]]]]:
+        """(섹션 목록, 수정할 섹션 인덱스, 섹션별 프롬프트 입력). 매칭되는 섹션이 없으면 None"""
+        sections = split_sections(draft)
+        targets = attribute_feedback(section_feedback or {}, sections)
+        if not targets:
+            return None
+        
+        context = self._pack(gathered_info, sources, "")
+        indices = sorted(targets)
+        inputs = [
+            {
+                "topic": topic,
+                "gathered_info": context.gathered_info,
+                "sources": context.sources,
+                "section": sections[i].text,
+                "feedback": targets[i]
+            }
+            for i in indices
+        ]
+        return sections, indices, inputs
+    
+    def _apply_revisions(
+        self,
+        sections: List[Section],
+        indices: List[int],
+        responses: List[Any]
+    ) -> str:
+        revised = list(sections)
+        for i, response in zip(indices, responses):
+            # 실패한 섹션은 원문 유지
+            if isinstance(response, Exception) or not response.content.strip():
+                continue
+            revised[i] = sections[i]._replace(text=self._merge_section(sections[i], response.content))
         
-        # 중복 제거
-        unique_sources = []
-        seen_urls = set()
-        for s in sources:
-            url = s.get("url", "")
-            if url and url not in seen_urls:
-                seen_urls.add(url)
-                unique_sources.append(s)
+        print(f"   🔧 섹션 수정: {len(indices)}/{len(sections)}개")
+        return join_sections(revised)
+    
+    def _merge_section(self, original: Section, rewritten: str) -> str:
+        """
+        재작성된 섹션에 원래 제목 줄과 섹션 끝 공백을 유지
+
+        LLM이 요청한 섹션 외에 같은 수준 이상의 다른 섹션(또는 보고서 전체)을 출력하면
+        보고서 내용이 중복/재배치되므로 재작성을 버리고 원문을 유지함
+        """
+        heading, _, _ = original.text.partition("\n")
+        parts = split_sections(rewritten.strip("\n"))
+        if not parts:
+            return original.text
+        
+        first, others = parts[0], parts[1:]
+        if first.title:
+            # LLM이 제목 줄을 다시 출력했다면 원래 제목으로 대체
+            body = first.text.partition("\n")[2].lstrip("\n")
+        else:
+            body = first.text
         
-        lines = []
-        for i, source in enumerate(unique_sources[:20], 1):  # 최대 20개
-            title = source.get("title", "제목 없음")
-            url = source.get("url", "URL 없음")
-            lines.append(f"[{i}] {title}\n    {url}")
+        level = original.level or SECTION_LEVEL
+        if any(section.level <= level for section in others):
+            print(f"   ⚠️  섹션 수정 무시 ({original.title}): 다른 섹션이 포함된 응답")
+            return original.text
+        # 원래 섹션보다 낮은 수준의 하위 섹션은 본문의 일부로 유지
+        body += join_sections(others)
         
-        return "\n".join(lines)
+        trailing = original.text[len(original.text.rstrip()):] or "\n"
+        return f"{heading}\n\n{body.rstrip()}{trailing}" if body.strip() else original.text
+    
+    def _stream(self, chain, inputs: Dict[str, Any], on_token: Callable[[str], None]) -> str:
+        """LLM 응답을 스트리밍하며 토큰을 콜백으로 전달하고 전체 텍스트 반환"""
+        parts = []
+        for chunk in chain.stream(inputs):
+            token = chunk.content
+            if token:
+                parts.append(token)
+                on_token(token)
+        return "".join(parts)
+    
+    async def _astream(self, chain, inputs: Dict[str, Any], on_token: Callable[[str], None]) -> str:
+        """_stream의 비동기 버전"""
+        parts = []
+        async for chunk in chain.astream(inputs):
+            token = chunk.content
+            if token:
+                parts.append(token)
+                on_token(token)
+        return "".join(parts)
+    
+    def _pack(self, gathered_info: List[str], sources: List[Dict], research_plan: str) -> PackedContext:
+        """작성자 모델 기준으로 토큰 예산에 맞춰 컨텍스트 구성"""
+        context = pack_context(
+            gathered_info,
+            sources,
+            research_plan,
+            budget=self.context_tokens,
+            model_name=getattr(self.llm, "model_name", None)
+        )
+        print(
+            f"   📦 컨텍스트: {context.tokens} 토큰 "
+            f"(정보 {context.kept}개 포함, {context.dropped}개 예산 초과 제외, 중복 {context.duplicates}개 제거)"
+        )
+        return context
     
     def _add_metadata(self, report: str, topic: str) -> str:
         """보고서에 메타데이터 추가"""
@@ -174,30 +383,107 @@ class WriterAgent:
         return report
 
 
-def write_report(state: Dict[str, Any]) -> Dict[str, Any]:
+def write_report(
+    state: Dict[str, Any],
+    writer: Optional[WriterAgent] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
     """
     LangGraph 노드 함수: 보고서 작성
     
+    수정 반복에서 검토자가 섹션별 피드백을 남겼다면 해당 섹션만 다시 작성함
+    (WRITER_REVISION_MODE=full이면 항상 전체를 다시 작성)
+    
     Args:
         state: 현재 상태
+        writer: 재사용할 에이전트 (없으면 새로 생성)
+        config: 실행 설정. configurable의 "on_token"이 있으면 토큰을 스트리밍하고,
+                "on_draft_start"가 있으면 초안 작성 시작 시 반복 횟수와 함께 호출함
         
     Returns:
         업데이트된 상태
     """
     print("\n✍️  보고서 작성 중...")
     
-    writer = WriterAgent()
+    writer = writer or WriterAgent()
+    on_token = _start_draft(state, config)
     
-    report = writer.write_report(
-        topic=state.get("topic", ""),
-        gathered_info=state.get("gathered_info", []),
-        sources=state.get("sources", []),
-        research_plan=state.get("research_plan", "")
-    )
+    report = None
+    if _wants_section_revision(state):
+        report = writer.revise_report(**_revision_args(state))
+        if report is not None and on_token:
+            on_token(report)
+    
+    if report is None:
+        report = writer.write_report(**_write_args(state), on_token=on_token)
     
+    return _writer_update(report)
+
+
+async def awrite_report(
+    state: Dict[str, Any],
+    writer: Optional[WriterAgent] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """LangGraph 비동기 노드 함수: 보고서 작성 (설정은 write_report와 동일)"""
+    print("\n✍️  보고서 작성 중...")
+    
+    writer = writer or WriterAgent()
+    on_token = _start_draft(state, config)
+    
+    report = None
+    if _wants_section_revision(state):
+        report = await writer.arevise_report(**_revision_args(state))
+        if report is not None and on_token:
+            on_token(report)
+    
+    if report is None:
+        report = await writer.awrite_report(**_write_args(state), on_token=on_token)
+    
+    return _writer_update(report)
+
+
+def _start_draft(state: Dict[str, Any], config: Optional[Dict[str, Any]]) -> Optional[Callable[[str], None]]:
+    """on_draft_start 콜백을 호출하고 on_token 콜백 반환"""
+    configurable = (config or {}).get("configurable", {})
+    on_draft_start = configurable.get("on_draft_start")
+    if on_draft_start:
+        on_draft_start(state.get("iteration_count", 0))
+    return configurable.get("on_token")
+
+
+def _wants_section_revision(state: Dict[str, Any]) -> bool:
+    return bool(
+        REVISION_MODE == "section"
+        and state.get("draft_report")
+        and state.get("section_feedback")
+        and state.get("iteration_count", 0) > 0
+    )
+
+
+def _revision_args(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "topic": state.get("topic", ""),
+        "draft": load_text(state.get("draft_report")),
+        "section_feedback": state.get("section_feedback"),
+        "gathered_info": load_texts(state.get("gathered_info", [])),
+        "sources": state.get("sources", [])
+    }
+
+
+def _write_args(state: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "topic": state.get("topic", ""),
+        "gathered_info": load_texts(state.get("gathered_info", [])),
+        "sources": state.get("sources", []),
+        "research_plan": state.get("research_plan", "")
+    }
+
+
+def _writer_update(report: str) -> Dict[str, Any]:
     print(f"   ✅ 보고서 작성 완료 ({len(report)} 자)")
     
     return {
-        "draft_report": report,
+        "draft_report": store_text(report),
         "current_step": "writing_complete"
     }
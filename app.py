@@ -5,6 +5,10 @@ LangGraph를 활용한 멀티에이전트 리서치 시스템
 사용법:
     python app.py "연구 주제"
     python app.py "AI 기술 트렌드" --output report.md
+    python app.py batch topics.txt --concurrency 4 --output-dir reports/batch
+    python app.py "AI 기술 트렌드" --checkpoint   # 중단 시 이어서 실행 가능
+    python app.py --list-runs
+    python app.py --resume <실행 ID>
     실행 명령
     pip install streamlit
     streamlit run app_web.py
@@ -15,12 +19,12 @@ import os
 import argparse
 from pathlib import Path
 from datetime import datetime
-from dotenv import load_dotenv
 
 # 프로젝트 루트를 path에 추가
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-load_dotenv()
+# 무거운 의존성(langgraph, langchain 등)은 실제로 필요한 시점에 임포트함.
+# --help 처럼 리서치를 실행하지 않는 호출은 표준 라이브러리만 로드함.
 
 
 def check_api_keys():
@@ -60,9 +64,98 @@ def save_report(report: str, topic: str, output_path: str = None):
     return filepath
 
 
+def print_draft_header(iteration: int):
+    """스트리밍 출력 시 초안 구분 헤더"""
+    print("\n" + "=" * 50)
+    print(f"📄 보고서 초안 {iteration + 1}")
+    print("=" * 50)
+
+
+def list_runs():
+    """완료되지 않은 체크포인트 실행 목록 출력"""
+    from graph.checkpoint import get_checkpoint_store
+    
+    store = get_checkpoint_store()
+    runs = store.runs(incomplete_only=True)
+    if not runs:
+        print(f"이어서 실행할 리서치가 없습니다. ({store.path})")
+        return
+    
+    print(f"\n💾 미완료 리서치 ({store.path})")
+    print("=" * 50)
+    for run in runs:
+        print(f"{run['run_id']}  [{run['status']}] {run['topic']}")
+        print(f"    마지막 완료 노드: {run['last_node'] or '-'}, 갱신: {run['updated_at']}")
+        if run["error"]:
+            print(f"    오류: {run['error'][:200]}")
+    print(f"\n이어서 실행: python app.py --resume <실행 ID>")
+
+
+def batch_main(argv):
+    """배치 모드: 주제 파일의 모든 주제를 한 프로세스에서 실행"""
+    parser = argparse.ArgumentParser(
+        prog="app.py batch",
+        description="주제 파일(.txt: 줄마다 주제, .jsonl: topic/title 필드)의 주제를 일괄 리서치합니다."
+    )
+    parser.add_argument("topics_file", help="주제 파일 경로")
+    parser.add_argument(
+        "--output-dir", "-d",
+        help="보고서와 manifest.jsonl 저장 디렉터리 (기본: reports/batch_<시각>)"
+    )
+    parser.add_argument(
+        "--concurrency", "-c",
+        type=int,
+        help="동시 실행 주제 수 (기본: BATCH_CONCURRENCY 또는 4)"
+    )
+    parser.add_argument(
+        "--max-iterations", "-m",
+        type=int,
+        default=2,
+        help="주제별 최대 수정 반복 횟수 (기본: 2)"
+    )
+    args = parser.parse_args(argv)
+    
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    if not check_api_keys():
+        return
+    
+    from graph.batch import load_topics, run_batch
+    
+    topics = load_topics(args.topics_file)
+    if not topics:
+        print("주제가 없습니다.")
+        return
+    
+    output_dir = args.output_dir or str(
+        Path("reports") / f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    )
+    print(f"\n📚 배치 주제: {len(topics)}개 → {output_dir}")
+    
+    start = datetime.now()
+    entries = run_batch(
+        topics,
+        output_dir,
+        concurrency=args.concurrency,
+        max_iterations=args.max_iterations
+    )
+    elapsed = (datetime.now() - start).total_seconds()
+    
+    succeeded = sum(1 for e in entries if e["status"] == "ok")
+    print(f"\n{'='*50}")
+    print(f"📦 배치 완료: 성공 {succeeded}/{len(entries)}, {elapsed:.1f}초")
+    print(f"📁 매니페스트: {Path(output_dir) / 'manifest.jsonl'}")
+    print(f"{'='*50}")
+
+
 def main():
+    if len(sys.argv) > 1 and sys.argv[1] == "batch":
+        return batch_main(sys.argv[2:])
+    
     parser = argparse.ArgumentParser(
-        description="자율 리서치 에이전트 - AI가 웹을 검색하고 보고서를 작성합니다."
+        description="자율 리서치 에이전트 - AI가 웹을 검색하고 보고서를 작성합니다.",
+        epilog="배치 모드: python app.py batch <주제 파일> (자세한 옵션은 python app.py batch --help)"
     )
     parser.add_argument(
         "topic",
@@ -79,11 +172,49 @@ def main():
         default=2,
         help="최대 수정 반복 횟수 (기본: 2)"
     )
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="보고서 작성 중 토큰 스트리밍 출력 끄기"
+    )
+    parser.add_argument(
+        "--checkpoint",
+        action="store_true",
+        help="노드마다 상태를 체크포인트(CHECKPOINT_PATH)에 저장해 중단 시 --resume으로 이어서 실행"
+    )
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_ID",
+        help="체크포인트에서 중단된 리서치를 이어서 실행"
+    )
+    parser.add_argument(
+        "--list-runs",
+        action="store_true",
+        help="이어서 실행할 수 있는 미완료 리서치 목록 출력"
+    )
     
     args = parser.parse_args()
     
-    # 주제 입력
-    if args.topic:
+    from dotenv import load_dotenv
+    load_dotenv()
+    
+    if args.list_runs:
+        return list_runs()
+    
+    if args.resume:
+        from graph.checkpoint import get_checkpoint_store
+        run = get_checkpoint_store().get(args.resume)
+        if run is None:
+            print(f"❌ 체크포인트에 없는 실행입니다: {args.resume}")
+            print("   python app.py --list-runs 로 목록을 확인하세요.")
+            return
+        if run["status"] == "done":
+            print(f"✅ 이미 완료된 실행입니다: {args.resume}")
+            return
+        topic = run["topic"]
+        args.max_iterations = run["max_iterations"]
+    elif args.topic:
+        # 주제 입력
         topic = args.topic
     else:
         print("\n🔬 자율 리서치 에이전트")
@@ -100,22 +231,43 @@ def main():
     print(f"\n📚 주제: {topic}")
     print(f"🔄 최대 반복: {args.max_iterations}회")
     
+    from tools.blob_store import BlobNotFoundError
+    
     try:
         # 리서치 실행
-        from graph.workflow import run_research
+        from graph.workflow import resume_research, run_research
         
-        result = run_research(topic, max_iterations=args.max_iterations)
+        callbacks = {} if args.no_stream else {
+            "on_token": lambda token: print(token, end="", flush=True),
+            "on_draft_start": print_draft_header
+        }
+        if args.resume:
+            result = resume_research(args.resume, **callbacks)
+        else:
+            run_id = None
+            if args.checkpoint:
+                from graph.checkpoint import new_run_id
+                run_id = new_run_id()
+            result = run_research(
+                topic,
+                max_iterations=args.max_iterations,
+                run_id=run_id,
+                **callbacks
+            )
         
         # 결과 출력
-        final_report = result.get("final_report") or result.get("draft_report", "")
+        from graph.state import report_text
+        final_report = report_text(result)
         
         if final_report:
-            print("\n" + "=" * 50)
-            print("📄 최종 보고서")
-            print("=" * 50)
-            print(final_report[:2000])
-            if len(final_report) > 2000:
-                print(f"\n... (총 {len(final_report)} 자)")
+            # 스트리밍 모드에서는 작성 중에 이미 출력됨
+            if args.no_stream:
+                print("\n" + "=" * 50)
+                print("📄 최종 보고서")
+                print("=" * 50)
+                print(final_report[:2000])
+                if len(final_report) > 2000:
+                    print(f"\n... (총 {len(final_report)} 자)")
             
             # 저장
             save_report(final_report, topic, args.output)
@@ -132,6 +284,9 @@ def main():
     except ImportError as e:
         print(f"\n❌ 모듈 import 오류: {e}")
         print("   pip install -r requirements.txt 를 실행해주세요.")
+    except BlobNotFoundError as e:
+        print(f"\n❌ {e}")
+        print("   처음부터 다시 실행하거나 BLOB_DIR/BLOB_TTL_HOURS 설정을 확인하세요.")
     except Exception as e:
         print(f"\n❌ 오류 발생: {e}")
         import traceback
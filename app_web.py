@@ -1,7 +1,6 @@
 import streamlit as st
 import os
 import sys
-import time
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
@@ -42,6 +41,107 @@ def save_report(report: str, topic: str):
     
     return filepath
 
+# 진행 상황 화면 갱신 주기 (초)
+REFRESH_SECONDS = float(os.getenv("WEB_REFRESH_SECONDS", "0.5"))
+
+@st.cache_resource(show_spinner=False)
+def get_research_runtime():
+    # 에이전트, LLM/검색 클라이언트, 컴파일된 그래프는 세션과 재실행 간에 공유
+    from graph.runtime import ResearchRuntime
+    return ResearchRuntime()
+
+@st.cache_resource(show_spinner=False)
+def get_job_manager():
+    # 리서치는 백그라운드 스레드에서 실행되므로 스크립트 스레드가 막히지 않음
+    from graph.jobs import ResearchJobManager
+    return ResearchJobManager(runtime=get_research_runtime())
+
+def render_artifacts(snapshot: dict, expanded: bool = True):
+    """노드가 끝날 때마다 채워지는 중간 결과 표시"""
+    if snapshot["research_plan"]:
+        with st.expander("📋 연구 계획", expanded=expanded and not snapshot["gathered_info"]):
+            st.markdown(snapshot["research_plan"])
+    
+    if snapshot["gathered_info"]:
+        with st.expander(f"🔎 검색 요약 ({len(snapshot['gathered_info'])}개 쿼리, "
+                         f"{len(snapshot['sources'])}개 출처)", expanded=False):
+            for info in snapshot["gathered_info"]:
+                st.markdown(info)
+                st.divider()
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_progress(job_id: str):
+    """실행 중인 작업의 진행 상황 (이 부분만 주기적으로 다시 그림)"""
+    from graph.jobs import NODE_LABELS
+    
+    job = get_job_manager().get(job_id)
+    if job is None:
+        return
+    snapshot = job.snapshot()
+    if job.finished:
+        # 최종 결과는 전체 재실행으로 한 번만 그림
+        st.rerun()
+    
+    st.info(f"📚 주제: {snapshot['topic']} (최대 {job.max_iterations}회 반복)")
+    st.progress(snapshot["progress"])
+    if snapshot["status"] == "queued":
+        st.text("⏳ 다른 리서치가 끝나기를 기다리는 중...")
+    else:
+        label = NODE_LABELS.get(snapshot["current_node"], "⏳ 마무리 중...")
+        if snapshot["current_node"] == "write" and snapshot["iteration"]:
+            label += f" (수정 {snapshot['iteration']}회차)"
+        st.text(f"{label} ({snapshot['elapsed']:.0f}초 경과)")
+    
+    render_artifacts(snapshot)
+    
+    if snapshot["draft"]:
+        st.subheader("✍️ 보고서 초안")
+        cursor = "▌" if snapshot["current_node"] == "write" else ""
+        st.markdown(snapshot["draft"] + cursor)
+
+def render_result(job):
+    """완료된 작업의 최종 보고서 표시"""
+    from graph.state import report_text
+    
+    snapshot = job.snapshot()
+    
+    if snapshot["status"] == "failed":
+        st.error("❌ 오류 발생")
+        st.code(snapshot["error"])
+        return
+    
+    result = snapshot["result"] or {}
+    st.progress(1.0)
+    st.text(f"✅ 리서치 완료! ({snapshot['elapsed']:.0f}초)")
+    render_artifacts(snapshot, expanded=False)
+    
+    final_report = report_text(result)
+    if final_report:
+        st.subheader("📄 최종 보고서")
+        st.markdown(final_report)
+        
+        # 파일 저장 (재실행마다 다시 저장하지 않도록 세션에 기록)
+        saved = st.session_state.setdefault("saved_reports", {})
+        if job.id not in saved:
+            saved[job.id] = str(save_report(final_report, job.topic))
+        st.success(f"보고서가 로컬에 저장되었습니다: {saved[job.id]}")
+        
+        # 다운로드 버튼
+        st.download_button(
+            label="보고서 다운로드 (Markdown)",
+            data=final_report,
+            file_name=os.path.basename(saved[job.id]),
+            mime="text/markdown"
+        )
+    else:
+        st.error("보고서 생성에 실패했습니다.")
+        if result.get("errors"):
+            st.error(f"오류: {result['errors']}")
+            
+    if result.get("review_feedback"):
+        with st.expander("검토 피드백 보기"):
+            st.text(result["review_feedback"])
+
 def main():
     st.set_page_config(page_title="자율 리서치 에이전트", page_icon="🔍", layout="wide")
     
@@ -51,74 +151,38 @@ def main():
     if not check_api_keys():
         st.stop()
     
+    try:
+        manager = get_job_manager()
+    except ImportError as e:
+        st.error(f"❌ 모듈 import 오류: {e}")
+        st.info("pip install -r requirements.txt 를 실행해주세요.")
+        st.stop()
+    
+    job = manager.get(st.session_state.get("job_id"))
+    running = job is not None and not job.finished
+    
     with st.sidebar:
         st.header("설정")
         max_iterations = st.slider("최대 수정 반복 횟수", min_value=1, max_value=5, value=2)
+        st.caption(f"실행 중인 리서치: {manager.active_count()} (동시 최대 {manager.max_workers})")
         
     topic = st.text_input("연구할 주제를 입력하세요", placeholder="예: 2025년 AI 기술 트렌드")
     
-    if st.button("리서치 시작", type="primary"):
+    if st.button("리서치 시작", type="primary", disabled=running):
         if not topic:
             st.warning("주제를 입력해주세요.")
             return
-            
-        status_container = st.container()
-        result_container = st.container()
-        
-        with status_container:
-            st.info(f"📚 주제: {topic} (최대 {max_iterations}회 반복)")
-            progress_bar = st.progress(0)
-            status_text = st.empty()
-            
-            status_text.text("🚀 리서치 에이전트 시작...")
-            progress_bar.progress(10)
-            
-            try:
-                # 리서치 실행
-                from graph.workflow import run_research
-                
-                # 실행 로그를 화면에 표시하기 위해 stdout 캡처는 복잡할 수 있으므로
-                # 간단히 실행 상태만 표시
-                with st.spinner('에이전트들이 열심히 조사하고 보고서를 작성 중입니다...'):
-                    result = run_research(topic, max_iterations=max_iterations)
-                
-                progress_bar.progress(100)
-                status_text.text("✅ 리서치 완료!")
-                
-                final_report = result.get("final_report") or result.get("draft_report", "")
-                
-                with result_container:
-                    if final_report:
-                        st.subheader("📄 최종 보고서")
-                        st.markdown(final_report)
-                        
-                        # 파일 저장
-                        saved_path = save_report(final_report, topic)
-                        st.success(f"보고서가 로컬에 저장되었습니다: {saved_path}")
-                        
-                        # 다운로드 버튼
-                        st.download_button(
-                            label="보고서 다운로드 (Markdown)",
-                            data=final_report,
-                            file_name=os.path.basename(saved_path),
-                            mime="text/markdown"
-                        )
-                    else:
-                        st.error("보고서 생성에 실패했습니다.")
-                        if result.get("errors"):
-                            st.error(f"오류: {result['errors']}")
-                            
-                    if result.get("review_feedback"):
-                        with st.expander("검토 피드백 보기"):
-                            st.text(result["review_feedback"])
-                            
-            except ImportError as e:
-                st.error(f"❌ 모듈 import 오류: {e}")
-                st.info("pip install -r requirements.txt 를 실행해주세요.")
-            except Exception as e:
-                st.error(f"❌ 오류 발생: {e}")
-                import traceback
-                st.code(traceback.format_exc())
+        job = manager.submit(topic, max_iterations=max_iterations)
+        st.session_state["job_id"] = job.id
+        # 버튼 비활성화 상태로 다시 그림
+        st.rerun()
+    
+    if job is None:
+        return
+    if running:
+        render_progress(job.id)
+    else:
+        render_result(job)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
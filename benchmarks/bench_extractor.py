@@ -0,0 +1,115 @@
+"""
+본문 추출 마이크로 벤치마크
+
+저장된 HTML 페이지 코퍼스로 기존 BeautifulSoup(html.parser) 추출 방식과
+tools.extractor 추출 엔진의 처리량(pages/sec)을 비교함
+
+사용법:
+    python -m benchmarks.bench_extractor
+    python -m benchmarks.bench_extractor --corpus path/to/html_dir --rounds 50
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from tools.extractor import extract_content, available_backend
+
+DEFAULT_CORPUS = Path(__file__).parent / "corpus"
+
+
+def legacy_extract(html: str) -> Dict[str, str]:
+    """기존 WebScraper.scrape의 BeautifulSoup 추출 로직 (비교 기준)"""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(html, "html.parser")
+
+    for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
+        tag.decompose()
+
+    title = soup.title.string if soup.title else ""
+    meta_desc = ""
+    meta_tag = soup.find("meta", attrs={"name": "description"})
+    if meta_tag:
+        meta_desc = meta_tag.get("content", "")
+
+    main_content = soup.find("article") or soup.find("main") or soup.body
+
+    if main_content:
+        paragraphs = main_content.find_all(["p", "h1", "h2", "h3", "h4", "li"])
+        text_parts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
+        content = "\n\n".join(text_parts)
+    else:
+        content = soup.get_text(separator="\n", strip=True)
+
+    content = re.sub(r'\n{3,}', '\n\n', content)
+    content = re.sub(r' {2,}', ' ', content)
+
+    return {
+        "title": title.strip() if title else "",
+        "description": meta_desc,
+        "content": content.strip()[:10000]
+    }
+
+
+def load_corpus(corpus_dir: Path) -> List[str]:
+    """코퍼스 디렉터리의 HTML 파일 로드"""
+    pages = [
+        path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted(corpus_dir.glob("*.htm*"))
+    ]
+    if not pages:
+        raise SystemExit(f"HTML 파일이 없습니다: {corpus_dir}")
+    return pages
+
+
+def measure(extract: Callable[[str], Dict[str, str]], pages: List[str], rounds: int) -> float:
+    """pages/sec 측정 (1회 워밍업 후)"""
+    for html in pages:
+        extract(html)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for html in pages:
+            extract(html)
+    elapsed = time.perf_counter() - start
+    return rounds * len(pages) / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 본문 추출 벤치마크")
+    parser.add_argument("--corpus", type=Path, default=DEFAULT_CORPUS, help="HTML 코퍼스 디렉터리")
+    parser.add_argument("--rounds", type=int, default=20, help="코퍼스 반복 횟수 (기본: 20)")
+    args = parser.parse_args()
+
+    pages = load_corpus(args.corpus)
+    total_kb = sum(len(html.encode("utf-8")) for html in pages) / 1024
+    print(f"코퍼스: {len(pages)}개 페이지, {total_kb:.0f} KB, {args.rounds}회 반복")
+
+    candidates = {}
+    try:
+        import bs4  # noqa: F401
+        candidates["legacy (bs4 html.parser)"] = legacy_extract
+    except ImportError:
+        print("⚠️  beautifulsoup4가 없어 기존 방식 측정을 건너뜁니다.")
+    candidates["extractor (html.parser)"] = lambda html: extract_content(html, "html.parser")
+    if available_backend() == "lxml":
+        candidates["extractor (lxml)"] = lambda html: extract_content(html, "lxml")
+
+    results = {name: measure(fn, pages, args.rounds) for name, fn in candidates.items()}
+    baseline = next(iter(results.values()))
+
+    print(f"\n{'방식':<28}{'pages/sec':>12}{'배율':>8}")
+    print("-" * 48)
+    for name, pages_per_sec in results.items():
+        print(f"{name:<28}{pages_per_sec:>12.1f}{pages_per_sec / baseline:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""
+임포트 시간 벤치마크 (python -X importtime 기반)
+
+CLI 시작 경로와 주요 패키지의 임포트 비용을 별도 프로세스에서 측정하고,
+누적 시간이 큰 모듈을 보여줌
+
+사용법:
+    python -m benchmarks.bench_import
+    python -m benchmarks.bench_import --repeat 10 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 측정 대상: (이름, python 인자)
+TARGETS = [
+    ("app.py --help", ["app.py", "--help"]),
+    ("import graph.workflow", ["-c", "import graph.workflow"]),
+    ("import agents.planner", ["-c", "import agents.planner"]),
+    ("import tools.web_search", ["-c", "import tools.web_search"]),
+    ("import tools.scraper", ["-c", "import tools.scraper"]),
+]
+
+# 어떤 스크립트든 로드되는 인터프리터 시작 모듈
+INTERPRETER_MODULES = {"site", "encodings", "_frozen_importlib_external", "zipimport", "codecs"}
+
+
+def run_importtime(args: List[str]) -> Tuple[float, List[Tuple[int, str, int]]]:
+    """
+    -X importtime으로 실행하여 (벽시계 시간 ms, [(깊이, 모듈, 누적 us)]) 반환
+    """
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True
+    )
+    elapsed = (time.perf_counter() - start) * 1000
+
+    entries = []
+    for line in proc.stderr.splitlines():
+        # "import time: self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumul, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) + 1) // 2
+        entries.append((depth, name.strip(), int(cumul)))
+    return elapsed, entries
+
+
+def heaviest_children(entries: List[Tuple[int, str, int]]) -> Tuple[str, List[Tuple[str, int]]]:
+    """
+    인터프리터 기본 모듈(site 등)을 제외하고 가장 무거운 최상위 임포트와
+    그 직접 의존성 목록을 반환
+    """
+    blocks = []
+    children: List[Tuple[str, int]] = []
+    for depth, name, cumul in entries:
+        # importtime은 자식 모듈을 부모보다 먼저 출력함
+        if depth == 1:
+            blocks.append((name, cumul, children))
+            children = []
+        elif depth == 2:
+            children.append((name, cumul))
+
+    candidates = [b for b in blocks if b[0] not in INTERPRETER_MODULES]
+    if not candidates:
+        return "", []
+    name, _, direct = max(candidates, key=lambda b: b[1])
+    return name, sorted(direct, key=lambda kv: kv[1], reverse=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="임포트 시간 벤치마크")
+    parser.add_argument("--repeat", type=int, default=5, help="대상별 반복 횟수 (기본: 5)")
+    parser.add_argument("--top", type=int, default=10, help="표시할 상위 모듈 수 (기본: 10)")
+    args = parser.parse_args()
+
+    print(f"{'대상':<28}{'wall p50 ms':>14}{'import ms':>12}")
+    print("-" * 54)
+
+    details = {}
+    for name, target in TARGETS:
+        walls, imports = [], []
+        for _ in range(args.repeat):
+            wall, entries = run_importtime(target)
+            walls.append(wall)
+            imports.append(sum(cumul for depth, _, cumul in entries if depth == 1) / 1000)
+            details[name] = entries
+        print(f"{name:<28}{statistics.median(walls):>14.1f}{statistics.median(imports):>12.1f}")
+
+    for name, entries in details.items():
+        module, children = heaviest_children(entries)
+        if not module:
+            continue
+        print(f"\n[{name}] {module}의 직접 의존성 상위 {args.top}개 (누적)")
+        for child, us in children[:args.top]:
+            print(f"  {us / 1000:>8.1f} ms  {child}")
+
+
+if __name__ == "__main__":
+    main()
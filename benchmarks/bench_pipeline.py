@@ -0,0 +1,233 @@
+"""
+오프라인 엔드투엔드 파이프라인 벤치마크
+
+실제 create_research_graph() 워크플로우를 가짜 LLM(지연 분포/출력 크기 설정 가능)과
+가짜 검색 도구로 실행하여 노드별/전체 p50·p95 지연, 처리량, 최대 메모리를 측정함.
+네트워크와 API 키가 필요 없음
+
+사용법:
+    python -m benchmarks.bench_pipeline
+    python -m benchmarks.bench_pipeline --runs 50 --concurrency 4 --llm-latency 200
+    python -m benchmarks.bench_pipeline --review-score 4 --max-iterations 2  # 수정 반복 포함
+    python -m benchmarks.bench_pipeline --async --concurrency 30  # 이벤트 루프 하나에서 동시 실행
+    python -m benchmarks.bench_pipeline --enrich-top-k 5 --scrape-sigma 1.0  # 본문 보강 포함
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 캐시는 측정을 왜곡하므로 끔 (캐시 효과는 별도로 측정)
+os.environ.setdefault("LLM_CACHE", "off")
+os.environ.setdefault("SEARCH_CACHE", "off")
+
+from agents import PlannerAgent, ResearcherAgent, WriterAgent, ReviewerAgent
+from graph.runtime import ResearchRuntime
+from graph.state import create_initial_state
+
+from benchmarks.fakes import FakeChatModel, FakeScraper, FakeSearchTool
+
+NODES = ("plan", "research", "write", "review")
+
+
+class TimedRuntime(ResearchRuntime):
+    """노드 실행 시간을 기록하는 런타임"""
+
+    def __init__(self, **agents):
+        super().__init__(**agents)
+        self.timings: Dict[str, List[float]] = defaultdict(list)
+        self._timings_lock = threading.Lock()
+
+    def _timed(self, node: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            with self._timings_lock:
+                self.timings[node].append(elapsed)
+
+    def plan(self, state):
+        return self._timed("plan", super().plan, state)
+
+    def research(self, state):
+        return self._timed("research", super().research, state)
+
+    def write(self, state, config):
+        return self._timed("write", super().write, state, config)
+
+    def review(self, state):
+        return self._timed("review", super().review, state)
+
+    async def _atimed(self, node: str, coro):
+        start = time.perf_counter()
+        try:
+            return await coro
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            with self._timings_lock:
+                self.timings[node].append(elapsed)
+
+    async def aplan(self, state):
+        return await self._atimed("plan", super().aplan(state))
+
+    async def aresearch(self, state):
+        return await self._atimed("research", super().aresearch(state))
+
+    async def awrite(self, state, config):
+        return await self._atimed("write", super().awrite(state, config))
+
+    async def areview(self, state):
+        return await self._atimed("review", super().areview(state))
+
+
+def build_runtime(args) -> TimedRuntime:
+    def llm(role: str, **overrides) -> FakeChatModel:
+        params = {
+            "latency_ms": args.llm_latency,
+            "latency_sigma": args.llm_sigma,
+            "output_chars": args.output_chars,
+        }
+        return FakeChatModel(role=role, **{**params, **overrides})
+
+    return TimedRuntime(
+        planner=PlannerAgent(llm=llm("planner", queries=args.queries)),
+        researcher=ResearcherAgent(
+            llm=llm("researcher", output_chars=args.output_chars // 4),
+            search_tool=FakeSearchTool(latency_ms=args.search_latency),
+            scraper=FakeScraper(latency_ms=args.scrape_latency, latency_sigma=args.scrape_sigma),
+            enrich_top_k=args.enrich_top_k,
+            enrich_budget=args.enrich_budget
+        ),
+        writer=WriterAgent(llm=llm("writer")),
+        reviewer=ReviewerAgent(llm=llm("reviewer", score=args.review_score))
+    )
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def max_rss_mb() -> Optional[float]:
+    """프로세스 최대 RSS (MB). resource 모듈이 없는 Windows에서는 None (tracemalloc 결과만 사용)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    # Linux는 KB, macOS는 바이트 단위
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return maxrss / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+def run_once(runtime: TimedRuntime, topic: str, max_iterations: int) -> float:
+    start = time.perf_counter()
+    runtime.graph.invoke(create_initial_state(topic, max_iterations))
+    return (time.perf_counter() - start) * 1000
+
+
+async def arun_once(runtime: TimedRuntime, topic: str, max_iterations: int) -> float:
+    start = time.perf_counter()
+    await runtime.graph.ainvoke(create_initial_state(topic, max_iterations))
+    return (time.perf_counter() - start) * 1000
+
+
+async def arun_all(runtime: TimedRuntime, topics: List[str], args) -> List[float]:
+    """최대 concurrency개 실행을 하나의 이벤트 루프에서 동시에 진행"""
+    semaphore = asyncio.Semaphore(max(1, args.concurrency))
+
+    async def run(topic: str) -> float:
+        async with semaphore:
+            return await arun_once(runtime, topic, args.max_iterations)
+
+    return list(await asyncio.gather(*(run(topic) for topic in topics)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="오프라인 엔드투엔드 파이프라인 벤치마크")
+    parser.add_argument("--runs", type=int, default=20, help="측정 실행 횟수 (기본: 20)")
+    parser.add_argument("--concurrency", type=int, default=1, help="동시 실행 수 (기본: 1)")
+    parser.add_argument("--llm-latency", type=float, default=50.0, help="LLM 지연 중앙값 ms (기본: 50)")
+    parser.add_argument("--llm-sigma", type=float, default=0.3, help="LLM 지연 로그정규 sigma (기본: 0.3)")
+    parser.add_argument("--search-latency", type=float, default=100.0, help="검색 지연 ms (기본: 100)")
+    parser.add_argument("--enrich-top-k", type=int, default=0, help="본문 보강할 상위 결과 수 (기본: 0, 끔)")
+    parser.add_argument("--enrich-budget", type=float, default=1.0, help="본문 보강 시간 예산 초 (기본: 1.0)")
+    parser.add_argument("--scrape-latency", type=float, default=150.0, help="스크랩 지연 중앙값 ms (기본: 150)")
+    parser.add_argument("--scrape-sigma", type=float, default=0.5, help="스크랩 지연 로그정규 sigma (기본: 0.5)")
+    parser.add_argument("--output-chars", type=int, default=2000, help="보고서 출력 크기 (기본: 2000자)")
+    parser.add_argument("--queries", type=int, default=5, help="계획 쿼리 수 (기본: 5)")
+    parser.add_argument("--review-score", type=int, default=8, help="검토 점수 (6 미만이면 수정 반복)")
+    parser.add_argument("--max-iterations", type=int, default=1, help="최대 수정 반복 (기본: 1)")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 메모리 측정 생략")
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="graph.ainvoke로 실행 (동시 실행을 스레드 대신 이벤트 루프에서 처리)")
+    args = parser.parse_args()
+
+    runtime = build_runtime(args)
+    topics = [f"benchmark topic {i}" for i in range(args.runs)]
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        # 워밍업 (그래프 컴파일, 지연 임포트)
+        run_once(runtime, "warmup", args.max_iterations)
+        runtime.timings.clear()
+
+        start = time.perf_counter()
+        if args.use_async:
+            totals = asyncio.run(arun_all(runtime, topics, args))
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, args.concurrency)) as executor:
+                totals = list(executor.map(
+                    lambda topic: run_once(runtime, topic, args.max_iterations), topics
+                ))
+        wall = time.perf_counter() - start
+        timings = {node: list(values) for node, values in runtime.timings.items()}
+
+        peak_mb = None
+        if not args.no_memory:
+            tracemalloc.start()
+            run_once(runtime, "memory probe", args.max_iterations)
+            peak_mb = tracemalloc.get_traced_memory()[1] / 2**20
+            tracemalloc.stop()
+
+    print(
+        f"실행 {args.runs}회, 동시 {args.concurrency} ({'async' if args.use_async else 'thread'}), LLM {args.llm_latency:.0f}ms "
+        f"(sigma {args.llm_sigma}), 검색 {args.search_latency:.0f}ms, 쿼리 {args.queries}개"
+    )
+    print(f"\n{'구간':<12}{'호출':>6}{'p50 ms':>10}{'p95 ms':>10}{'평균 ms':>10}")
+    print("-" * 48)
+    for node in NODES:
+        values = timings.get(node, [])
+        if values:
+            print(
+                f"{node:<12}{len(values):>6}{percentile(values, 50):>10.1f}"
+                f"{percentile(values, 95):>10.1f}{sum(values) / len(values):>10.1f}"
+            )
+    print(
+        f"{'end-to-end':<12}{len(totals):>6}{percentile(totals, 50):>10.1f}"
+        f"{percentile(totals, 95):>10.1f}{sum(totals) / len(totals):>10.1f}"
+    )
+
+    print(f"\n처리량: {args.runs / wall:.2f} runs/sec ({wall:.2f}s)")
+    if peak_mb is not None:
+        print(f"실행당 최대 Python 할당 (tracemalloc): {peak_mb:.1f} MB")
+    maxrss_mb = max_rss_mb()
+    if maxrss_mb is not None:
+        print(f"프로세스 최대 RSS: {maxrss_mb:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+실행당 준비 오버헤드 벤치마크
+
+기존 방식(실행마다 그래프 컴파일 + 노드 실행마다 에이전트 생성)과
+ResearchRuntime 재사용 방식의 실행당 준비 시간을 비교함.
+LLM/검색 호출은 측정 대상이 아니므로 네트워크가 필요 없음.
+
+사용법:
+    python -m benchmarks.bench_runtime --runs 20 --revisions 1
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ChatOpenAI 생성에는 API 키 형식만 필요 (실제 호출 없음)
+os.environ.setdefault("OPENAI_API_KEY", "sk-benchmark")
+
+from agents import PlannerAgent, ResearcherAgent, WriterAgent, ReviewerAgent
+from graph.runtime import ResearchRuntime
+from graph.workflow import create_research_graph
+
+
+def legacy_setup(revisions: int) -> None:
+    """기존 run_research가 실행마다 하던 준비 작업"""
+    create_research_graph()
+    PlannerAgent()
+    ResearcherAgent()
+    # 수정 반복마다 작성/검토 노드가 에이전트를 다시 생성
+    for _ in range(1 + revisions):
+        WriterAgent()
+        ReviewerAgent()
+
+
+def runtime_setup(runtime: ResearchRuntime, revisions: int) -> None:
+    """런타임 재사용 시 실행마다 하는 준비 작업"""
+    runtime.graph
+    runtime.planner
+    runtime.researcher
+    for _ in range(1 + revisions):
+        runtime.writer
+        runtime.reviewer
+
+
+def measure(fn, runs: int) -> list:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="실행당 준비 오버헤드 벤치마크")
+    parser.add_argument("--runs", type=int, default=20, help="측정 실행 횟수 (기본: 20)")
+    parser.add_argument("--revisions", type=int, default=1, help="실행당 수정 반복 횟수 (기본: 1)")
+    args = parser.parse_args()
+
+    # 임포트/최초 초기화 비용은 양쪽 모두 제외
+    legacy_setup(0)
+    runtime = ResearchRuntime()
+    runtime_setup(runtime, 0)
+
+    results = {
+        "legacy (per-run build)": measure(lambda: legacy_setup(args.revisions), args.runs),
+        "ResearchRuntime (reuse)": measure(lambda: runtime_setup(runtime, args.revisions), args.runs),
+    }
+
+    print(f"실행 {args.runs}회, 실행당 수정 반복 {args.revisions}회")
+    print(f"\n{'방식':<28}{'평균 ms':>10}{'p50 ms':>10}{'최대 ms':>10}")
+    print("-" * 58)
+    for name, timings in results.items():
+        print(
+            f"{name:<28}{statistics.mean(timings):>10.3f}"
+            f"{statistics.median(timings):>10.3f}{max(timings):>10.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+"""
+벤치마크용 가짜 LLM / 검색 / 스크래퍼
+
+네트워크 없이 실제 워크플로우를 실행할 수 있도록 에이전트가 기대하는 형식의
+출력을 결정적으로 생성하고, 설정한 지연 분포만큼 대기함
+"""
+
+import asyncio
+import hashlib
+import json
+import random
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+ROLES = ("planner", "researcher", "writer", "reviewer")
+
+_WORDS = (
+    "연구 결과 모델 성능 데이터 분석 시스템 기술 방법 효율 비용 지연 처리량 "
+    "architecture latency throughput benchmark inference training dataset scaling"
+).split()
+
+
+def _seed(*parts: str) -> int:
+    """입력에서 결정적인 난수 시드 생성 (프로세스/실행 간 동일)"""
+    digest = hashlib.blake2b("\x00".join(parts).encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "big")
+
+
+def _sentence(rng: random.Random, words: int = 12) -> str:
+    return " ".join(rng.choice(_WORDS) for _ in range(words)) + "."
+
+
+def _text(rng: random.Random, chars: int) -> str:
+    parts, size = [], 0
+    while size < chars:
+        parts.append(_sentence(rng))
+        size += len(parts[-1]) + 1
+    return " ".join(parts)[:max(chars, 1)]
+
+
+class FakeChatModel(BaseChatModel):
+    """
+    역할별 출력을 흉내 내는 결정적 채팅 모델
+
+    지연은 latency_ms를 중앙값으로 하는 로그정규 분포(latency_sigma)에서 뽑고,
+    같은 프롬프트에는 항상 같은 지연과 출력을 돌려줌
+    """
+
+    role: str = "writer"
+    latency_ms: float = 50.0
+    latency_sigma: float = 0.3
+    output_chars: int = 2000
+    queries: int = 5
+    score: int = 8
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-benchmark"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"role": self.role, "output_chars": self.output_chars}
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        rng = random.Random(_seed(self.role, prompt))
+        time.sleep(self._latency(rng))
+        message = AIMessage(content=self._render(prompt, rng))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any
+    ) -> ChatResult:
+        prompt = "\n".join(str(m.content) for m in messages)
+        rng = random.Random(_seed(self.role, prompt))
+        await asyncio.sleep(self._latency(rng))
+        message = AIMessage(content=self._render(prompt, rng))
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+    def _latency(self, rng: random.Random) -> float:
+        if self.latency_ms <= 0:
+            return 0.0
+        return rng.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+
+    def _render(self, prompt: str, rng: random.Random) -> str:
+        if self.role == "planner":
+            return json.dumps({
+                "topic_summary": _sentence(rng),
+                "key_aspects": [_sentence(rng, 4) for _ in range(3)],
+                "search_queries": [f"query {i} {_sentence(rng, 3)}" for i in range(self.queries)],
+                "expected_sections": ["서론", "본론", "결론"]
+            }, ensure_ascii=False)
+
+        if self.role == "researcher":
+            bullets = max(1, self.output_chars // 120)
+            return "\n".join(
+                f"- {_text(rng, 100)} [출처: https://example.org/{rng.randrange(1000)}]"
+                for _ in range(bullets)
+            )
+
+        if self.role == "reviewer":
+            return json.dumps({"score": self.score, "feedback": _sentence(rng), "section_feedback": []})
+
+        sections = ["요약", "서론", "본론 1", "본론 2", "결론", "참고문헌"]
+        body = max(40, self.output_chars // len(sections))
+        return "# 벤치마크 보고서\n\n" + "".join(
+            f"## {title}\n\n{_text(rng, body)} [1]\n\n" for title in sections
+        )
+
+
+class FakeSearchTool:
+    """
+    결정적인 가짜 검색 도구
+
+    쿼리마다 고유 결과를 만들되 overlap 비율만큼 공통 URL을 섞어
+    중복 제거 경로도 함께 측정되게 함
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 100.0,
+        content_chars: int = 1500,
+        overlap: float = 0.2
+    ):
+        self.latency_ms = latency_ms
+        self.content_chars = content_chars
+        self.overlap = overlap
+
+    def search(self, query: str, max_results: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        time.sleep(self.latency_ms / 1000)
+        return self._results(query, max_results)
+
+    async def asearch(self, query: str, max_results: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        await asyncio.sleep(self.latency_ms / 1000)
+        return self._results(query, max_results)
+
+    def _results(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        rng = random.Random(_seed("search", query))
+        results = []
+        for i in range(max_results):
+            shared = rng.random() < self.overlap
+            key = f"shared-{i}" if shared else f"{_seed(query) % 10**8}-{i}"
+            page_rng = random.Random(_seed("page", key))
+            results.append({
+                "title": f"Result {key}",
+                "url": f"https://example.org/{key}",
+                "content": _text(page_rng, self.content_chars),
+                "score": round(1 - i * 0.1, 2)
+            })
+        return results
+
+
+class FakeScraper:
+    """
+    WebScraper와 같은 결과 형식을 돌려주는 가짜 스크래퍼
+
+    지연은 URL마다 결정적인 로그정규 분포(latency_sigma)에서 뽑으므로
+    sigma를 키우면 느린 사이트(꼬리 지연)가 섞임
+    """
+
+    def __init__(self, latency_ms: float = 150.0, content_chars: int = 6000, latency_sigma: float = 0.0):
+        self.latency_ms = latency_ms
+        self.content_chars = content_chars
+        self.latency_sigma = latency_sigma
+
+    def _latency(self, url: str) -> float:
+        rng = random.Random(_seed("scrape-latency", url))
+        return rng.lognormvariate(0, self.latency_sigma) * self.latency_ms / 1000
+
+    def _result(self, url: str) -> Dict[str, Any]:
+        rng = random.Random(_seed("scrape", url))
+        return {
+            "url": url,
+            "title": f"Page {url.rsplit('/', 1)[-1]}",
+            "description": _sentence(rng),
+            "content": _text(rng, self.content_chars),
+            "domain": "example.org",
+            "success": True
+        }
+
+    def scrape(self, url: str) -> Dict[str, Any]:
+        time.sleep(self._latency(url))
+        return self._result(url)
+
+    async def scrape_async(self, url: str) -> Dict[str, Any]:
+        await asyncio.sleep(self._latency(url))
+        return self._result(url)
+
+    async def scrape_multiple(self, urls: list, timeout: Optional[float] = None) -> list:
+        tasks = [asyncio.ensure_future(self.scrape_async(url)) for url in urls]
+        if not tasks:
+            return []
+        await asyncio.wait(tasks, timeout=timeout)
+        results = []
+        for url, task in zip(urls, tasks):
+            if task.done():
+                results.append(task.result())
+            else:
+                task.cancel()
+                results.append({"url": url, "error": "시간 예산 초과", "error_type": "deadline", "success": False})
+        return results
+
+    def scrape_many(self, urls: list, timeout: Optional[float] = None) -> list:
+        return asyncio.run(self.scrape_multiple(urls, timeout))
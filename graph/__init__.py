@@ -1,5 +1,21 @@
 """LangGraph workflow components"""
-from .state import ResearchState
-from .workflow import create_research_graph
+import importlib
 
-__all__ = ["ResearchState", "create_research_graph"]
+# 이름 -> 모듈 (langgraph는 그래프가 실제로 필요할 때 로드)
+_EXPORTS = {
+    "ResearchState": ".state",
+    "create_research_graph": ".workflow", "run_research": ".workflow",
+    "stream_research": ".workflow", "arun_research": ".workflow",
+    "astream_research": ".workflow", "resume_research": ".workflow",
+    "ResearchRuntime": ".runtime", "get_runtime": ".runtime",
+    "RunTrace": ".tracing",
+    "CheckpointStore": ".checkpoint", "get_checkpoint_store": ".checkpoint",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
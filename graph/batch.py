@@ -0,0 +1,122 @@
+"""
+Batch Research
+주제 목록을 한 프로세스에서 동시에 실행하는 배치 리서치
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .runtime import ResearchRuntime
+from .state import report_text
+from .workflow import run_research
+
+
+def load_topics(path: str) -> List[str]:
+    """
+    주제 파일 읽기
+
+    - .jsonl: 줄마다 문자열 또는 "topic"(없으면 "title") 필드를 가진 객체
+    - 그 외: 줄마다 주제 하나 (빈 줄과 #으로 시작하는 줄은 무시)
+    """
+    topics = []
+    with open(path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if path.endswith(".jsonl"):
+                item = json.loads(line)
+                topic = item if isinstance(item, str) else item.get("topic") or item.get("title")
+                if not topic:
+                    raise ValueError(f"{path}:{line_no}: topic 또는 title 필드가 없습니다")
+                topics.append(str(topic).strip())
+            else:
+                topics.append(line)
+    return topics
+
+
+def create_batch_runtime() -> ResearchRuntime:
+    """
+    배치용 런타임
+
+    모든 주제가 에이전트, LLM/검색 캐시, HTTP 연결 풀을 공유하며
+    주제 간 같은 검색 쿼리는 SharedSearchTool로 한 번만 검색함
+    """
+    from agents.researcher import ResearcherAgent
+    from tools.web_search import SharedSearchTool, get_search_tool
+
+    return ResearchRuntime(
+        researcher=ResearcherAgent(search_tool=SharedSearchTool(get_search_tool()))
+    )
+
+
+def _report_filename(index: int, topic: str) -> str:
+    safe_topic = "".join(c if c.isalnum() or c in " -_" else "" for c in topic)[:30].strip()
+    return f"{index:04d}_{safe_topic.replace(' ', '_') or 'topic'}.md"
+
+
+def run_batch(
+    topics: List[str],
+    output_dir: str,
+    concurrency: Optional[int] = None,
+    max_iterations: int = 2,
+    runtime: Optional[ResearchRuntime] = None
+) -> List[Dict[str, Any]]:
+    """
+    주제 목록 배치 실행
+
+    보고서는 output_dir에 저장하고, 주제별 상태/지연 시간을 output_dir/manifest.jsonl에
+    완료되는 대로 한 줄씩 기록함 (중간에 중단되어도 완료된 항목은 남음)
+
+    Args:
+        topics: 연구 주제 목록
+        output_dir: 보고서 및 매니페스트 저장 디렉터리
+        concurrency: 동시 실행 수 (기본: BATCH_CONCURRENCY 또는 4)
+        max_iterations: 주제별 최대 수정 반복 횟수
+        runtime: 공유할 런타임 (기본: create_batch_runtime())
+
+    Returns:
+        입력 순서의 매니페스트 항목 목록
+    """
+    concurrency = max(1, concurrency or int(os.getenv("BATCH_CONCURRENCY", "4")))
+    runtime = runtime or create_batch_runtime()
+    out = Path(output_dir)
+    out.mkdir(parents=True, exist_ok=True)
+    manifest_path = out / "manifest.jsonl"
+    manifest_lock = threading.Lock()
+
+    def run_one(index: int, topic: str) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {"index": index, "topic": topic, "started_at": datetime.now().isoformat()}
+        start = time.perf_counter()
+        try:
+            result = run_research(topic, max_iterations=max_iterations, runtime=runtime)
+            report = report_text(result)
+            entry.update(
+                status="ok" if report else "empty",
+                iterations=result.get("iteration_count", 0),
+                sources=len(result.get("sources", [])),
+                errors=result.get("errors", [])
+            )
+            if report:
+                filepath = out / _report_filename(index, topic)
+                filepath.write_text(report, encoding="utf-8")
+                entry["report"] = str(filepath)
+        except Exception as e:
+            entry.update(status="failed", error=f"{type(e).__name__}: {e}")
+        entry["latency_s"] = round(time.perf_counter() - start, 3)
+
+        with manifest_lock, open(manifest_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        print(f"{'✅' if entry['status'] == 'ok' else '❌'} [{index + 1}/{len(topics)}] "
+              f"{topic} ({entry['status']}, {entry['latency_s']:.1f}s)")
+        return entry
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="Batch") as executor:
+        futures = [executor.submit(run_one, i, topic) for i, topic in enumerate(topics)]
+        return [future.result() for future in futures]
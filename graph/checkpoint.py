@@ -0,0 +1,157 @@
+"""
+Research Checkpoints
+SQLite 파일에 노드 단위로 상태를 저장하고 중단된 리서치를 이어서 실행하기 위한 저장소
+
+- LangGraph 체크포인트: thread_id = run_id (langgraph-checkpoint-sqlite 필요)
+- research_runs 테이블: 실행 목록 (주제, 상태, 오류) — 미완료 실행 조회용
+"""
+
+import os
+import secrets
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from tools.blob_store import collect_blob_refs
+
+# 기본 경로는 현재 디렉터리가 아닌 프로젝트 루트 기준 (다른 위치에서 --resume해도 같은 파일을 사용)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CHECKPOINT_PATH = os.getenv("CHECKPOINT_PATH") or str(PROJECT_ROOT / "checkpoints" / "research.sqlite")
+
+# 실행 상태
+RUNNING, DONE, FAILED = "running", "done", "failed"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS research_runs (
+    run_id TEXT PRIMARY KEY,
+    topic TEXT NOT NULL,
+    max_iterations INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    last_node TEXT,
+    error TEXT,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+)
+"""
+
+
+def new_run_id() -> str:
+    """시각 + 난수 형식의 실행 ID (정렬하면 시작 순서)"""
+    return f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{secrets.token_hex(3)}"
+
+
+class CheckpointStore:
+    """
+    리서치 체크포인트 저장소
+
+    그래프 체크포인트(saver)와 실행 목록을 같은 SQLite 파일에 두며,
+    체크포인트와 실행 목록은 서로 다른 연결을 사용해 트랜잭션이 섞이지 않게 함
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = Path(path or CHECKPOINT_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+        self._saver = None
+
+    @property
+    def saver(self):
+        """LangGraph SqliteSaver (최초 접근 시 생성)"""
+        with self._lock:
+            if self._saver is None:
+                try:
+                    from langgraph.checkpoint.sqlite import SqliteSaver
+                except ImportError as e:
+                    raise ImportError(
+                        "체크포인트를 사용하려면 langgraph-checkpoint-sqlite를 설치하세요: "
+                        "pip install langgraph-checkpoint-sqlite"
+                    ) from e
+                conn = sqlite3.connect(str(self.path), check_same_thread=False, timeout=30)
+                self._saver = SqliteSaver(conn)
+                self._saver.setup()
+            return self._saver
+
+    # ----- 실행 목록 -----
+
+    def start(self, run_id: str, topic: str, max_iterations: int) -> None:
+        """실행 시작 (같은 run_id가 있으면 running으로 되돌림)"""
+        now = datetime.now().isoformat(timespec="seconds")
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO research_runs
+                    (run_id, topic, max_iterations, status, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(run_id) DO UPDATE SET
+                    status = excluded.status, error = NULL, updated_at = excluded.updated_at
+                """,
+                (run_id, topic, max_iterations, RUNNING, now, now)
+            )
+
+    def update(self, run_id: str, **fields: Any) -> None:
+        """status, last_node, error 갱신"""
+        fields = {k: v for k, v in fields.items() if k in ("status", "last_node", "error")}
+        if not fields:
+            return
+        fields["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        assignments = ", ".join(f"{key} = ?" for key in fields)
+        with self._lock, self._conn:
+            self._conn.execute(
+                f"UPDATE research_runs SET {assignments} WHERE run_id = ?",
+                (*fields.values(), run_id)
+            )
+
+    def finish(self, run_id: str) -> None:
+        """완료 처리 후 그래프 체크포인트 삭제 (보고서는 이미 저장되므로 실행 기록만 남김)"""
+        self.update(run_id, status=DONE, error=None)
+        self.saver.delete_thread(run_id)
+
+    def blob_refs(self) -> Set[str]:
+        """완료되지 않은(이어서 실행할 수 있는) 실행의 마지막 체크포인트가 참조하는 blob"""
+        with self._lock:
+            run_ids = [row[0] for row in self._conn.execute(
+                f"SELECT run_id FROM research_runs WHERE status != '{DONE}'"
+            )]
+        refs = set()
+        for run_id in run_ids:
+            saved = self.saver.get_tuple({"configurable": {"thread_id": run_id, "checkpoint_ns": ""}})
+            if saved is not None:
+                refs |= collect_blob_refs(saved.checkpoint.get("channel_values", {}))
+        return refs
+    
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT * FROM research_runs WHERE run_id = ?", (run_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def runs(self, incomplete_only: bool = True, limit: int = 50) -> List[Dict[str, Any]]:
+        """최근 실행 목록 (기본: 완료되지 않은 실행만)"""
+        query = "SELECT * FROM research_runs"
+        if incomplete_only:
+            query += f" WHERE status != '{DONE}'"
+        query += " ORDER BY created_at DESC, run_id DESC LIMIT ?"
+        with self._lock:
+            rows = self._conn.execute(query, (limit,)).fetchall()
+        return [dict(row) for row in rows]
+
+
+_stores: Dict[str, CheckpointStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_checkpoint_store(path: Optional[str] = None) -> CheckpointStore:
+    """경로별로 프로세스에서 하나씩 공유하는 체크포인트 저장소"""
+    key = str(Path(path or CHECKPOINT_PATH).resolve())
+    with _stores_lock:
+        if key not in _stores:
+            _stores[key] = CheckpointStore(key)
+        return _stores[key]
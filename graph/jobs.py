@@ -0,0 +1,202 @@
+"""
+Research Jobs
+리서치를 백그라운드 스레드에서 실행하고 노드 단위 진행 상황을 조회하는 작업 관리
+
+웹 UI처럼 여러 사용자가 한 프로세스를 공유하는 환경에서 요청 스레드를 막지 않고
+실행하기 위해 사용함
+"""
+
+import os
+import secrets
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from .runtime import ResearchRuntime, get_runtime
+from .workflow import run_research
+
+# 노드 이름 -> 진행 상태 표시 문구
+NODE_LABELS = {
+    "plan": "📋 연구 계획 수립 중...",
+    "research": "🔎 웹 검색 및 정보 수집 중...",
+    "write": "✍️ 보고서 작성 중...",
+    "review": "🔍 보고서 검토 중...",
+}
+
+# 노드가 끝났을 때의 진행률 (수정 반복 중에는 review 값을 넘지 않음)
+NODE_PROGRESS = {"plan": 0.15, "research": 0.55, "write": 0.8, "review": 0.95}
+
+# 완료 후 조회용으로 보관할 작업 수
+MAX_FINISHED_JOBS = int(os.getenv("WEB_MAX_FINISHED_JOBS", "100"))
+
+
+class ResearchJob:
+    """
+    백그라운드 리서치 작업 1건
+
+    노드가 끝날 때마다 계획, 쿼리별 요약, 초안 등 중간 결과를 갱신하며
+    다른 스레드에서는 snapshot()으로 일관된 사본을 읽음
+    """
+
+    def __init__(self, topic: str, max_iterations: int = 2):
+        self.id = secrets.token_hex(8)
+        self.topic = topic
+        self.max_iterations = max_iterations
+        self.status = "queued"  # queued | running | done | failed
+        self.current_node: Optional[str] = None
+        self.progress = 0.0
+        self.iteration = 0
+        self.research_plan: Optional[str] = None
+        self.search_queries: List[str] = []
+        self.gathered_info: List[str] = []
+        self.sources: List[dict] = []
+        self.draft = ""
+        self.review_feedback: Optional[str] = None
+        self.timeline: List[Dict[str, Any]] = []
+        self.result: Optional[dict] = None
+        self.error: Optional[str] = None
+        self.created_at = time.time()
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("done", "failed")
+
+    def run(self, runtime: Optional[ResearchRuntime] = None) -> None:
+        """작업 실행 (작업 스레드에서 호출, 예외는 status/error로 기록)"""
+        with self._lock:
+            self.status = "running"
+            self.current_node = "plan"
+            self.started_at = time.time()
+        try:
+            result = run_research(
+                self.topic,
+                self.max_iterations,
+                runtime=runtime,
+                on_token=self._on_token,
+                on_draft_start=self._on_draft_start,
+                on_node=self._on_node
+            )
+            with self._lock:
+                self.result = result
+                self.status = "done"
+                self.progress = 1.0
+        except Exception as e:
+            with self._lock:
+                self.error = f"{type(e).__name__}: {e}\n\n{traceback.format_exc()}"
+                self.status = "failed"
+        finally:
+            with self._lock:
+                self.current_node = None
+                self.finished_at = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """현재 진행 상황 사본"""
+        with self._lock:
+            now = self.finished_at or time.time()
+            return {
+                "id": self.id,
+                "topic": self.topic,
+                "status": self.status,
+                "current_node": self.current_node,
+                "progress": self.progress,
+                "iteration": self.iteration,
+                "research_plan": self.research_plan,
+                "search_queries": list(self.search_queries),
+                "gathered_info": list(self.gathered_info),
+                "sources": list(self.sources),
+                "draft": self.draft,
+                "review_feedback": self.review_feedback,
+                "timeline": list(self.timeline),
+                "result": self.result,
+                "error": self.error,
+                "elapsed": now - self.started_at if self.started_at else 0.0,
+            }
+
+    # ----- run_research 콜백 (작업 스레드에서 호출) -----
+
+    def _on_token(self, token: str) -> None:
+        with self._lock:
+            self.draft += token
+
+    def _on_draft_start(self, iteration: int) -> None:
+        with self._lock:
+            self.draft = ""
+            self.iteration = iteration
+            self.current_node = "write"
+
+    def _on_node(self, name: str, update: dict) -> None:
+        with self._lock:
+            self.timeline.append({
+                "node": name,
+                "iteration": self.iteration,
+                "elapsed": round(time.time() - self.started_at, 2),
+            })
+            self.progress = max(self.progress, NODE_PROGRESS.get(name, self.progress))
+
+            if name == "plan":
+                self.research_plan = update.get("research_plan")
+                self.search_queries = list(update.get("search_queries", []))
+                self.current_node = "research"
+            elif name == "research":
+                self.gathered_info = list(update.get("gathered_info", []))
+                self.sources = list(update.get("sources", []))
+                self.current_node = "write"
+            elif name == "write":
+                self.draft = update.get("draft_report") or self.draft
+                self.current_node = "review"
+            elif name == "review":
+                self.review_feedback = update.get("review_feedback")
+                revising = (
+                    update.get("needs_revision")
+                    and update.get("iteration_count", 0) < self.max_iterations
+                )
+                self.current_node = "write" if revising else None
+
+
+class ResearchJobManager:
+    """
+    백그라운드 리서치 작업 실행기
+
+    프로세스 전체에서 하나를 공유하며 동시에 실행하는 작업 수를 제한함
+    (초과한 작업은 queued 상태로 대기). 모든 작업이 같은 런타임의 에이전트와
+    LLM/검색 클라이언트를 재사용함
+    """
+
+    def __init__(self, runtime: Optional[ResearchRuntime] = None, max_workers: Optional[int] = None):
+        self.runtime = runtime or get_runtime()
+        self.max_workers = max(1, max_workers or int(os.getenv("WEB_MAX_JOBS", "4")))
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ResearchJob")
+        self._jobs: Dict[str, ResearchJob] = {}
+        self._lock = threading.Lock()
+
+    def submit(self, topic: str, max_iterations: int = 2) -> ResearchJob:
+        """작업을 큐에 넣고 바로 반환"""
+        job = ResearchJob(topic, max_iterations)
+        with self._lock:
+            self._prune()
+            self._jobs[job.id] = job
+        self._executor.submit(job.run, self.runtime)
+        return job
+
+    def get(self, job_id: Optional[str]) -> Optional[ResearchJob]:
+        with self._lock:
+            return self._jobs.get(job_id) if job_id else None
+
+    def active_count(self) -> int:
+        """대기 중이거나 실행 중인 작업 수"""
+        with self._lock:
+            return sum(not job.finished for job in self._jobs.values())
+
+    def _prune(self) -> None:
+        """오래된 완료 작업 정리 (잠금을 잡은 상태에서 호출)"""
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.finished_at or 0
+        )
+        for job in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job.id]
@@ -0,0 +1,141 @@
+"""
+Research Runtime
+컴파일된 그래프와 에이전트 인스턴스를 프로세스 수명 동안 재사용하는 실행 컨텍스트
+"""
+
+import threading
+from typing import Optional, TYPE_CHECKING
+
+from langchain_core.runnables import RunnableConfig
+
+# 에이전트 모듈(langchain_openai 등)은 해당 노드가 처음 실행될 때 임포트함
+if TYPE_CHECKING:
+    from agents.planner import PlannerAgent
+    from agents.researcher import ResearcherAgent
+    from agents.writer import WriterAgent
+    from agents.reviewer import ReviewerAgent
+
+
+class ResearchRuntime:
+    """
+    리서치 실행 컨텍스트
+
+    에이전트(LLM 클라이언트, 프롬프트 템플릿 포함)와 컴파일된 StateGraph를
+    최초 사용 시 한 번만 만들고, 이후 실행과 수정 반복에서 재사용함.
+    Streamlit, 배치, 서버처럼 오래 실행되는 프로세스에서 사용.
+    """
+
+    def __init__(
+        self,
+        planner: Optional["PlannerAgent"] = None,
+        researcher: Optional["ResearcherAgent"] = None,
+        writer: Optional["WriterAgent"] = None,
+        reviewer: Optional["ReviewerAgent"] = None
+    ):
+        self._planner = planner
+        self._researcher = researcher
+        self._writer = writer
+        self._reviewer = reviewer
+        self._graph = None
+        self._checkpointed_graphs = {}
+        self._lock = threading.RLock()
+
+    @property
+    def planner(self) -> "PlannerAgent":
+        with self._lock:
+            if self._planner is None:
+                from agents.planner import PlannerAgent
+                self._planner = PlannerAgent()
+            return self._planner
+
+    @property
+    def researcher(self) -> "ResearcherAgent":
+        with self._lock:
+            if self._researcher is None:
+                from agents.researcher import ResearcherAgent
+                self._researcher = ResearcherAgent()
+            return self._researcher
+
+    @property
+    def writer(self) -> "WriterAgent":
+        with self._lock:
+            if self._writer is None:
+                from agents.writer import WriterAgent
+                self._writer = WriterAgent()
+            return self._writer
+
+    @property
+    def reviewer(self) -> "ReviewerAgent":
+        with self._lock:
+            if self._reviewer is None:
+                from agents.reviewer import ReviewerAgent
+                self._reviewer = ReviewerAgent()
+            return self._reviewer
+
+    # ----- 에이전트를 주입한 노드 함수 -----
+
+    def plan(self, state: dict) -> dict:
+        from agents.planner import plan_research
+        return plan_research(state, planner=self.planner)
+
+    def research(self, state: dict) -> dict:
+        from agents.researcher import execute_research
+        return execute_research(state, researcher=self.researcher)
+
+    def write(self, state: dict, config: RunnableConfig) -> dict:
+        from agents.writer import write_report
+        return write_report(state, writer=self.writer, config=config)
+
+    def review(self, state: dict) -> dict:
+        from agents.reviewer import review_report
+        return review_report(state, reviewer=self.reviewer)
+
+    # ----- 비동기 노드 함수 (graph.ainvoke / astream에서 사용) -----
+
+    async def aplan(self, state: dict) -> dict:
+        from agents.planner import aplan_research
+        return await aplan_research(state, planner=self.planner)
+
+    async def aresearch(self, state: dict) -> dict:
+        from agents.researcher import aexecute_research
+        return await aexecute_research(state, researcher=self.researcher)
+
+    async def awrite(self, state: dict, config: RunnableConfig) -> dict:
+        from agents.writer import awrite_report
+        return await awrite_report(state, writer=self.writer, config=config)
+
+    async def areview(self, state: dict) -> dict:
+        from agents.reviewer import areview_report
+        return await areview_report(state, reviewer=self.reviewer)
+
+    @property
+    def graph(self):
+        """컴파일된 워크플로우 그래프 (최초 접근 시 한 번만 컴파일)"""
+        with self._lock:
+            if self._graph is None:
+                from .workflow import create_research_graph
+                self._graph = create_research_graph(runtime=self)
+            return self._graph
+
+    def checkpointed_graph(self, checkpointer):
+        """체크포인트 저장소를 붙여 컴파일한 그래프 (저장소마다 한 번만 컴파일)"""
+        with self._lock:
+            graph = self._checkpointed_graphs.get(id(checkpointer))
+            if graph is None:
+                from .workflow import create_research_graph
+                graph = create_research_graph(runtime=self, checkpointer=checkpointer)
+                self._checkpointed_graphs[id(checkpointer)] = graph
+            return graph
+
+
+_default_runtime: Optional[ResearchRuntime] = None
+_default_runtime_lock = threading.Lock()
+
+
+def get_runtime() -> ResearchRuntime:
+    """프로세스 전체에서 공유하는 기본 런타임"""
+    global _default_runtime
+    with _default_runtime_lock:
+        if _default_runtime is None:
+            _default_runtime = ResearchRuntime()
+        return _default_runtime
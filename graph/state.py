@@ -3,23 +3,31 @@ Research Agent State Definition
 LangGraph 상태 관리를 위한 타입 정의
 """
 
-from typing import TypedDict, List, Optional, Annotated
+from typing import Any, TypedDict, Dict, List, Optional, Annotated
 from operator import add
 
+from tools.blob_store import load_text, load_texts
+
 
 class SearchResult(TypedDict):
-    """검색 결과 타입"""
-    title: str
+    """
+    검색 결과 타입
+
+    본문은 blob 저장소에 두고 content_id(참조)만 담음.
+    제목과 쿼리는 같은 순서의 sources 항목에 있음
+    """
     url: str
-    content: str
     score: float
+    content_id: str
 
 
 class ResearchState(TypedDict):
     """
     리서치 에이전트 상태 정의
     
-    LangGraph에서 노드 간 데이터 전달에 사용됨
+    LangGraph에서 노드 간 데이터 전달에 사용됨.
+    큰 텍스트(gathered_info 항목, draft_report, final_report)는 그래프와 체크포인트
+    안에서는 blob 참조이며, run_research 등 공개 함수는 resolve_state로 본문을 채워 반환함
     """
     # 사용자 입력
     topic: str
@@ -30,15 +38,16 @@ class ResearchState(TypedDict):
     
     # 검색 단계
     search_results: Annotated[List[SearchResult], add]
-    gathered_info: Annotated[List[str], add]
+    gathered_info: Annotated[List[str], add]  # 쿼리별 요약 (blob 참조)
     sources: Annotated[List[dict], add]
     
     # 작성 단계
-    draft_report: Optional[str]
-    final_report: Optional[str]
+    draft_report: Optional[str]  # blob 참조
+    final_report: Optional[str]  # blob 참조
     
     # 검토 단계
     review_feedback: Optional[str]
+    section_feedback: Optional[Dict[str, str]]  # 섹션 제목 -> 수정 요청
     needs_revision: bool
     
     # 메타데이터
@@ -60,9 +69,45 @@ def create_initial_state(topic: str, max_iterations: int = 3) -> ResearchState:
         draft_report=None,
         final_report=None,
         review_feedback=None,
+        section_feedback=None,
         needs_revision=False,
         iteration_count=0,
         max_iterations=max_iterations,
         current_step="start",
         errors=[]
     )
+
+
+def resolve_state(state: Dict[str, Any]) -> Dict[str, Any]:
+    """blob 참조인 final_report, draft_report, gathered_info를 본문으로 채운 사본"""
+    resolved = dict(state)
+    for key in ("final_report", "draft_report"):
+        if resolved.get(key):
+            resolved[key] = load_text(resolved[key])
+    if "gathered_info" in resolved:
+        resolved["gathered_info"] = load_texts(resolved["gathered_info"])
+    return resolved
+
+
+def report_text(state: Dict[str, Any]) -> str:
+    """최종 보고서 본문 (없으면 마지막 초안, 둘 다 없으면 빈 문자열)"""
+    return load_text(state.get("final_report") or state.get("draft_report"))
+
+
+def gathered_texts(state: Dict[str, Any]) -> List[str]:
+    """쿼리별 요약 본문 목록"""
+    return load_texts(state.get("gathered_info", []))
+
+
+def load_search_results(state: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """검색 결과를 출처 정보(제목, 쿼리)와 본문까지 채운 형태로 반환"""
+    sources = {source.get("url", ""): source for source in state.get("sources", [])}
+    return [
+        {
+            **sources.get(result["url"], {}),
+            "url": result["url"],
+            "score": result.get("score", 0.0),
+            "content": load_text(result.get("content_id"))
+        }
+        for result in state.get("search_results", [])
+    ]
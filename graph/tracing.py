@@ -0,0 +1,215 @@
+"""
+Workflow Tracing
+실행/노드 단위 추적 구간(span) 기록 및 JSONL 내보내기
+
+TRACING=on일 때만 기록하며, 실행마다 OTLP/JSON ExportTraceServiceRequest 한 줄
+({"resourceSpans": [...]})을 TRACE_PATH에 추가하므로 OpenTelemetry Collector의
+otlpjsonfile 수신기 등으로 그대로 읽을 수 있음. 파일이 TRACE_MAX_MB를 넘으면
+.1 파일로 넘기고 새로 씀
+"""
+
+import json
+import os
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from langchain_core.callbacks import BaseCallbackHandler
+
+from tools import metrics
+
+# 요약 표에 표시할 카운터 (이름, 머리글)
+SUMMARY_COLUMNS = [
+    ("llm.calls", "LLM"),
+    ("llm.prompt_tokens", "입력 토큰"),
+    ("llm.completion_tokens", "출력 토큰"),
+    ("llm.cache_hits", "LLM 캐시"),
+    ("search.calls", "검색"),
+    ("search.cache_hits", "검색 캐시"),
+    ("scrape.pages", "스크랩"),
+]
+
+# OTLP enum 값 (OTLP/JSON은 enum을 정수로 인코딩)
+SPAN_KIND_INTERNAL = 1
+STATUS_CODES = {"STATUS_CODE_UNSET": 0, "STATUS_CODE_OK": 1, "STATUS_CODE_ERROR": 2}
+
+_write_lock = threading.Lock()
+
+
+def is_tracing_enabled() -> bool:
+    return os.getenv("TRACING", "off").lower() in ("1", "on", "true", "yes")
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    """속성 값을 OTLP AnyValue로 변환 (int64는 문자열로 인코딩)"""
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+def _otlp_span(span: Dict[str, Any]) -> Dict[str, Any]:
+    """내부 구간(속성 dict, 정수 나노초)을 OTLP/JSON Span으로 변환"""
+    otlp = {
+        "traceId": span["traceId"],
+        "spanId": span["spanId"],
+        "name": span["name"],
+        "kind": SPAN_KIND_INTERNAL,
+        "startTimeUnixNano": str(span["startTimeUnixNano"]),
+        "endTimeUnixNano": str(span["endTimeUnixNano"] or span["startTimeUnixNano"]),
+        "attributes": _otlp_attributes(span["attributes"]),
+        "status": {"code": STATUS_CODES[span["status"]["code"]]},
+    }
+    if span["parentSpanId"]:
+        otlp["parentSpanId"] = span["parentSpanId"]
+    if span["status"].get("message"):
+        otlp["status"]["message"] = span["status"]["message"]
+    return otlp
+
+
+class LLMMetricsCallback(BaseCallbackHandler):
+    """LLM 호출 수와 토큰 사용량을 현재 추적 구간에 누적하는 콜백"""
+
+    def on_llm_end(self, response, **kwargs: Any) -> None:
+        metrics.increment("llm.calls")
+        prompt_tokens = completion_tokens = 0
+        for generations in response.generations:
+            for generation in generations:
+                usage = getattr(getattr(generation, "message", None), "usage_metadata", None)
+                if usage:
+                    prompt_tokens += usage.get("input_tokens", 0)
+                    completion_tokens += usage.get("output_tokens", 0)
+        if not (prompt_tokens or completion_tokens):
+            usage = (response.llm_output or {}).get("token_usage") or {}
+            prompt_tokens = usage.get("prompt_tokens", 0)
+            completion_tokens = usage.get("completion_tokens", 0)
+        if prompt_tokens or completion_tokens:
+            metrics.increment("llm.prompt_tokens", prompt_tokens)
+            metrics.increment("llm.completion_tokens", completion_tokens)
+
+    def on_llm_error(self, error: BaseException, **kwargs: Any) -> None:
+        metrics.increment("llm.errors")
+
+
+class RunTrace:
+    """
+    리서치 실행 1회의 추적 정보
+
+    실행 전체를 루트 구간으로, 노드 실행마다 하위 구간을 만듦.
+    구간은 요약 계산을 위해 속성을 dict로 들고 있고 export할 때 OTLP 형식으로 변환함
+    """
+
+    def __init__(self, name: str, attributes: Optional[Dict[str, Any]] = None):
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Dict[str, Any]] = []
+        self.root = self._new_span(name, None, attributes)
+        self._lock = threading.Lock()
+
+    def _new_span(self, name: str, parent_id: Optional[str], attributes: Optional[Dict[str, Any]]):
+        return {
+            "traceId": self.trace_id,
+            "spanId": secrets.token_hex(8),
+            "parentSpanId": parent_id,
+            "name": name,
+            "kind": "SPAN_KIND_INTERNAL",
+            "startTimeUnixNano": time.time_ns(),
+            "endTimeUnixNano": None,
+            "attributes": dict(attributes or {}),
+            "status": {"code": "STATUS_CODE_UNSET"},
+        }
+
+    @contextmanager
+    def span(self, name: str, attributes: Optional[Dict[str, Any]] = None) -> Iterator[Dict[str, Any]]:
+        """노드 실행 구간 (구간 안의 LLM/검색/스크랩 카운터를 속성으로 기록)"""
+        span = self._new_span(name, self.root["spanId"], attributes)
+        start = time.perf_counter()
+        with metrics.collect() as counters:
+            try:
+                yield span
+                span["status"] = {"code": "STATUS_CODE_OK"}
+            except BaseException as e:
+                span["status"] = {"code": "STATUS_CODE_ERROR", "message": str(e)}
+                raise
+            finally:
+                span["endTimeUnixNano"] = time.time_ns()
+                span["attributes"]["duration_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                span["attributes"].update(counters)
+                with self._lock:
+                    self.spans.append(span)
+
+    def finish(self, error: Optional[BaseException] = None) -> None:
+        """루트 구간 종료 (노드 카운터 합계를 루트 속성에 기록)"""
+        root = self.root
+        root["endTimeUnixNano"] = time.time_ns()
+        root["attributes"]["duration_ms"] = round(
+            (root["endTimeUnixNano"] - root["startTimeUnixNano"]) / 1e6, 2
+        )
+        for span in self.spans:
+            for key, value in span["attributes"].items():
+                if key.startswith(("llm.", "search.", "scrape.")):
+                    root["attributes"][key] = root["attributes"].get(key, 0) + value
+        root["status"] = (
+            {"code": "STATUS_CODE_ERROR", "message": str(error)} if error
+            else {"code": "STATUS_CODE_OK"}
+        )
+
+    def to_otlp(self) -> Dict[str, Any]:
+        """루트와 노드 구간을 OTLP/JSON ExportTraceServiceRequest로 변환"""
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": _otlp_attributes({"service.name": "research-agent"})},
+                "scopeSpans": [{
+                    "scope": {"name": "graph.tracing"},
+                    "spans": [_otlp_span(span) for span in [self.root, *self.spans]],
+                }],
+            }]
+        }
+
+    def export(self, path: Optional[str] = None) -> Path:
+        """실행 1회를 JSONL 파일에 한 줄로 추가 (TRACE_MAX_MB를 넘으면 .1 파일로 넘김)"""
+        filepath = Path(path or os.getenv("TRACE_PATH", "traces/spans.jsonl"))
+        filepath.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps(self.to_otlp(), ensure_ascii=False)
+        max_bytes = float(os.getenv("TRACE_MAX_MB", "50")) * 1024 * 1024
+        with _write_lock:
+            if filepath.exists() and filepath.stat().st_size + len(line) > max_bytes:
+                os.replace(filepath, filepath.with_name(filepath.name + ".1"))
+            with open(filepath, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+        return filepath
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """노드 이름별 합계 (호출 수, 시간, 카운터)"""
+        rows: Dict[str, Dict[str, float]] = {}
+        for span in self.spans:
+            row = rows.setdefault(span["name"], {"count": 0})
+            row["count"] += 1
+            for key, value in span["attributes"].items():
+                if isinstance(value, (int, float)) and key != "research.iteration":
+                    row[key] = row.get(key, 0) + value
+        return rows
+
+    def format_summary(self) -> str:
+        """요약 표 문자열"""
+        header = f"{'노드':<10}{'횟수':>5}{'시간 ms':>10}" + "".join(
+            f"{title:>10}" for _, title in SUMMARY_COLUMNS
+        )
+        lines = [header, "-" * (25 + 10 * len(SUMMARY_COLUMNS))]
+        rows = self.summary()
+        rows["total"] = {"count": len(self.spans), **self.root["attributes"]}
+        for name, row in rows.items():
+            lines.append(
+                f"{name:<10}{int(row['count']):>5}{row.get('duration_ms', 0):>10.0f}"
+                + "".join(f"{int(row.get(key, 0)):>10}" for key, _ in SUMMARY_COLUMNS)
+            )
+        return "\n".join(lines)
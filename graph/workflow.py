@@ -2,14 +2,22 @@
 LangGraph Workflow - 리서치 에이전트 워크플로우
 """
 
-from typing import Literal
+import asyncio
+import contextlib
+import inspect
+import os
+import queue
+import threading
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, Literal, Optional, Tuple
+from langchain_core.runnables import RunnableConfig, RunnableLambda
 from langgraph.graph import StateGraph, END
 
-from .state import ResearchState, create_initial_state
-from agents.planner import plan_research
-from agents.researcher import execute_research
-from agents.writer import write_report
-from agents.reviewer import review_report
+from tools.blob_store import BlobNotFoundError, collect_blob_refs, get_blob_store
+
+from .state import ResearchState, create_initial_state, resolve_state
+from .runtime import ResearchRuntime, get_runtime
+from .checkpoint import CHECKPOINT_PATH, DONE, FAILED, CheckpointStore, get_checkpoint_store
+from .tracing import LLMMetricsCallback, RunTrace, is_tracing_enabled
 
 
 def should_continue_research(state: ResearchState) -> Literal["write", "end"]:
@@ -27,17 +35,60 @@ def should_revise(state: ResearchState) -> Literal["revise", "end"]:
     return "end"
 
 
-def create_research_graph() -> StateGraph:
-    """리서치 워크플로우 그래프 생성"""
+def traced_node(name: str, fn: Callable, afn: Optional[Callable] = None) -> RunnableLambda:
+    """
+    노드 함수를 추적 구간으로 감쌈
+
+    실행 설정의 configurable["trace"]에 RunTrace가 있으면 노드 실행마다
+    시간과 LLM/검색/스크랩 카운터를 구간으로 기록함.
+    afn(비동기 버전)을 주면 graph.ainvoke / astream에서 afn이 실행됨
+    """
+    takes_config = "config" in inspect.signature(fn).parameters
+    
+    def span(state: ResearchState, config: RunnableConfig):
+        trace = config.get("configurable", {}).get("trace")
+        if trace is None:
+            return contextlib.nullcontext()
+        return trace.span(name, {"research.iteration": state.get("iteration_count", 0)})
+    
+    def node(state: ResearchState, config: RunnableConfig) -> dict:
+        with span(state, config):
+            return fn(state, config) if takes_config else fn(state)
+    
+    if afn is None:
+        return RunnableLambda(node, name=name)
+    
+    atakes_config = "config" in inspect.signature(afn).parameters
+    
+    async def anode(state: ResearchState, config: RunnableConfig) -> dict:
+        with span(state, config):
+            return await (afn(state, config) if atakes_config else afn(state))
+    
+    return RunnableLambda(node, afunc=anode, name=name)
+
+
+def create_research_graph(
+    runtime: Optional[ResearchRuntime] = None,
+    checkpointer: Any = None
+) -> StateGraph:
+    """
+    리서치 워크플로우 그래프 생성
+    
+    Args:
+        runtime: 에이전트를 제공할 런타임 (없으면 이 그래프 전용 런타임 생성)
+        checkpointer: 노드마다 상태를 저장할 LangGraph 체크포인터
+                      (지정 시 실행 설정에 configurable["thread_id"] 필요)
+    """
+    runtime = runtime or ResearchRuntime()
     
     # 그래프 생성
     workflow = StateGraph(ResearchState)
     
-    # 노드 추가
-    workflow.add_node("plan", plan_research)
-    workflow.add_node("research", execute_research)
-    workflow.add_node("write", write_report)
-    workflow.add_node("review", review_report)
+    # 노드 추가 (에이전트는 각 노드가 처음 실행될 때 생성됨)
+    workflow.add_node("plan", traced_node("plan", runtime.plan, runtime.aplan))
+    workflow.add_node("research", traced_node("research", runtime.research, runtime.aresearch))
+    workflow.add_node("write", traced_node("write", runtime.write, runtime.awrite))
+    workflow.add_node("review", traced_node("review", runtime.review, runtime.areview))
     
     # 엣지 연결
     workflow.set_entry_point("plan")
@@ -52,22 +103,350 @@ def create_research_graph() -> StateGraph:
         {"revise": "write", "end": END}
     )
     
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def run_research(
+    topic: str,
+    max_iterations: int = 3,
+    runtime: Optional[ResearchRuntime] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    on_draft_start: Optional[Callable[[int], None]] = None,
+    on_node: Optional[Callable[[str, dict], None]] = None,
+    run_id: Optional[str] = None
+) -> dict:
+    """
+    리서치 실행
+    
+    Args:
+        topic: 연구 주제
+        max_iterations: 최대 수정 반복 횟수
+        runtime: 사용할 런타임 (기본: 프로세스 공유 런타임)
+        on_token: 보고서 작성 중 LLM 토큰마다 호출되는 콜백 (지정 시 스트리밍)
+        on_draft_start: 초안 작성이 시작될 때 반복 횟수와 함께 호출되는 콜백
+        on_node: 노드가 끝날 때마다 (노드 이름, 상태 업데이트)로 호출되는 콜백
+                 (지정 시 graph.stream으로 실행)
+        run_id: 지정하면 노드가 끝날 때마다 상태를 체크포인트(CHECKPOINT_PATH)에 저장.
+                실패하거나 프로세스가 종료되어도 resume_research(run_id)로
+                마지막으로 완료된 노드 다음부터 이어서 실행할 수 있음
+    
+    Returns:
+        최종 상태. 그래프와 체크포인트 안에서는 큰 텍스트를 blob 참조로 다루지만,
+        반환값과 on_node 업데이트의 final_report, draft_report, gathered_info는
+        본문으로 채워져 있음 (search_results의 본문은 load_search_results로 읽음)
+    
+    TRACING=on이면 노드별 구간을 TRACE_PATH(기본 traces/spans.jsonl)에 OTLP/JSON으로
+    추가하고 실행 후 노드별 요약 표를 출력함
+    """
+    store = None
+    if run_id is not None:
+        store = get_checkpoint_store()
+        store.start(run_id, topic, max_iterations)
+    
+    graph, initial_state, config, trace = _prepare_run(
+        topic, max_iterations, runtime, on_token, on_draft_start, run_id, store
+    )
+    if store is not None:
+        print(f"💾 체크포인트 저장: {run_id}")
+    return _execute_run(graph, initial_state, config, trace, on_node, run_id, store)
+
+
+def resume_research(
+    run_id: str,
+    runtime: Optional[ResearchRuntime] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    on_draft_start: Optional[Callable[[int], None]] = None,
+    on_node: Optional[Callable[[str, dict], None]] = None
+) -> dict:
+    """
+    체크포인트에서 중단된 리서치를 이어서 실행
+    
+    마지막으로 완료된 노드까지의 상태(계획, 검색 결과 등)를 불러와
+    다음 노드부터 실행하므로 완료된 계획/검색을 다시 하지 않음
+    
+    Raises:
+        KeyError: 체크포인트에 없는 run_id
+        ValueError: 이미 완료된 실행
+        BlobNotFoundError: 체크포인트가 참조하는 본문이 BLOB_DIR에 없음
+    """
+    store = get_checkpoint_store()
+    run = store.get(run_id)
+    if run is None:
+        raise KeyError(f"체크포인트에 없는 실행입니다: {run_id}")
+    if run["status"] == DONE:
+        raise ValueError(f"이미 완료된 실행입니다: {run_id}")
+    
+    graph, initial_state, config, trace = _prepare_run(
+        run["topic"], run["max_iterations"], runtime, on_token, on_draft_start, run_id, store
+    )
+    snapshot = graph.get_state(config)
+    refs = collect_blob_refs(snapshot.values)
+    blob_store = get_blob_store()
+    missing = [ref for ref in refs if ref not in blob_store]
+    if missing:
+        raise BlobNotFoundError(
+            missing[0],
+            f"체크포인트가 참조하는 본문 {len(missing)}개를 {blob_store.spill_dir}에서 찾을 수 없어 "
+            f"이어서 실행할 수 없습니다: {run_id}"
+        )
+    if snapshot.values and not snapshot.next:
+        # 마지막 노드까지 끝났지만 완료 처리 전에 중단된 경우
+        with blob_store.pin_scope(refs):
+            final_state = resolve_state(snapshot.values)
+            store.finish(run_id)
+            _finish_run(trace)
+        return final_state
+    
+    store.start(run_id, run["topic"], run["max_iterations"])
+    if snapshot.values:
+        print(f"♻️  이어서 실행: {run_id} (다음 노드: {', '.join(snapshot.next)})")
+        graph_input = None
+    else:
+        print(f"♻️  저장된 노드가 없어 처음부터 실행: {run_id}")
+        graph_input = initial_state
+    return _execute_run(graph, graph_input, config, trace, on_node, run_id, store, pinned=refs)
+
+
+def _execute_run(
+    graph: Any,
+    graph_input: Optional[ResearchState],
+    config: RunnableConfig,
+    trace: Optional[RunTrace],
+    on_node: Optional[Callable[[str, dict], None]],
+    run_id: Optional[str] = None,
+    store: Optional[CheckpointStore] = None,
+    pinned: Iterable[str] = ()
+) -> dict:
+    """
+    그래프 실행 (체크포인트 사용 시 마지막 완료 노드와 실패 상태를 기록)
+    
+    실행 중 저장한 본문과 pinned(이어서 실행할 때 체크포인트가 참조하는 본문)는
+    실행이 끝날 때까지 blob 저장소 정리 대상에서 제외하고, 반환 전에 본문으로 채움
+    """
+    if store is not None:
+        user_on_node = on_node
+        
+        def on_node(name: str, update: dict) -> None:
+            # 다른 프로세스에서 이어서 실행할 수 있도록 상태가 참조하는 본문을 디스크에 기록
+            get_blob_store().flush()
+            store.update(run_id, last_node=name)
+            if user_on_node is not None:
+                user_on_node(name, update)
+    
+    with get_blob_store().pin_scope(pinned):
+        try:
+            if on_node is None:
+                final_state = graph.invoke(graph_input, config=config)
+            else:
+                final_state = graph_input
+                for mode, chunk in graph.stream(graph_input, config=config, stream_mode=["updates", "values"]):
+                    final_state = _on_stream_chunk(mode, chunk, on_node, final_state)
+        except BaseException as e:
+            if store is not None:
+                store.update(run_id, status=FAILED, error=f"{type(e).__name__}: {e}")
+                print(f"\n💾 이어서 실행하려면: python app.py --resume {run_id}")
+            _abort_run(trace, e)
+            raise
+        
+        final_state = resolve_state(final_state)
+        if store is not None:
+            store.finish(run_id)
+        _finish_run(trace)
+    return final_state
 
 
-def run_research(topic: str, max_iterations: int = 3) -> dict:
-    """리서치 실행"""
+async def arun_research(
+    topic: str,
+    max_iterations: int = 3,
+    runtime: Optional[ResearchRuntime] = None,
+    on_token: Optional[Callable[[str], None]] = None,
+    on_draft_start: Optional[Callable[[int], None]] = None,
+    on_node: Optional[Callable[[str, dict], None]] = None
+) -> dict:
+    """
+    run_research의 비동기 버전 (graph.ainvoke)
+    
+    노드가 비동기 에이전트 메서드(ainvoke/abatch, 비동기 검색)로 실행되므로
+    하나의 이벤트 루프에서 여러 리서치를 동시에 진행할 수 있음
+    
+        results = await asyncio.gather(*(arun_research(t) for t in topics))
+    """
+    graph, initial_state, config, trace = _prepare_run(
+        topic, max_iterations, runtime, on_token, on_draft_start
+    )
+    
+    with get_blob_store().pin_scope():
+        try:
+            if on_node is None:
+                final_state = await graph.ainvoke(initial_state, config=config)
+            else:
+                final_state = initial_state
+                async for mode, chunk in graph.astream(initial_state, config=config, stream_mode=["updates", "values"]):
+                    final_state = _on_stream_chunk(mode, chunk, on_node, final_state)
+        except BaseException as e:
+            _abort_run(trace, e)
+            raise
+        
+        final_state = resolve_state(final_state)
+        _finish_run(trace)
+    return final_state
+
+
+def _prepare_run(
+    topic: str,
+    max_iterations: int,
+    runtime: Optional[ResearchRuntime],
+    on_token: Optional[Callable[[str], None]],
+    on_draft_start: Optional[Callable[[int], None]],
+    run_id: Optional[str] = None,
+    store: Optional[CheckpointStore] = None
+) -> Tuple[Any, ResearchState, RunnableConfig, Optional[RunTrace]]:
+    """(그래프, 초기 상태, 실행 설정, 추적) 준비"""
     print(f"\n{'='*50}")
     print(f"🔬 리서치 시작: {topic}")
     print(f"{'='*50}")
     
-    graph = create_research_graph()
+    runtime = runtime or get_runtime()
+    graph = runtime.graph if store is None else runtime.checkpointed_graph(store.saver)
     initial_state = create_initial_state(topic, max_iterations)
     
-    final_state = graph.invoke(initial_state)
-    
+    trace = RunTrace("research_run", {"research.topic": topic}) if is_tracing_enabled() else None
+    config: RunnableConfig = {
+        "configurable": {"on_token": on_token, "on_draft_start": on_draft_start, "trace": trace}
+    }
+    if run_id is not None:
+        config["configurable"]["thread_id"] = run_id
+        if trace is not None:
+            trace.root["attributes"]["research.run_id"] = run_id
+    if trace is not None:
+        config["callbacks"] = [LLMMetricsCallback()]
+    return graph, initial_state, config, trace
+
+
+def _on_stream_chunk(
+    mode: str,
+    chunk: dict,
+    on_node: Callable[[str, dict], None],
+    state: ResearchState
+) -> ResearchState:
+    """스트림 청크 처리: 노드 업데이트는 본문을 채워 콜백으로 전달하고 최신 전체 상태를 반환"""
+    if mode == "values":
+        return chunk
+    for name, update in chunk.items():
+        on_node(name, resolve_state(update or {}))
+    return state
+
+
+def _abort_run(trace: Optional[RunTrace], error: BaseException) -> None:
+    if trace is not None:
+        trace.finish(error=error)
+        trace.export()
+
+
+def _finish_run(trace: Optional[RunTrace]) -> None:
     print(f"\n{'='*50}")
     print("✅ 리서치 완료!")
     print(f"{'='*50}")
     
-    return final_state
+    _prune_blobs()
+    
+    if trace is not None:
+        trace.finish()
+        path = trace.export()
+        print(f"\n⏱️  실행 추적 ({path})")
+        print(trace.format_summary())
+
+
+def _prune_blobs() -> None:
+    """보관 기간/용량을 넘은 디스크 본문 정리 (이어서 실행할 수 있는 체크포인트의 본문은 유지)"""
+    keep = set()
+    if os.path.exists(CHECKPOINT_PATH):
+        try:
+            keep = get_checkpoint_store().blob_refs()
+        except ImportError:
+            # 체크포인트 내용을 읽을 수 없으면 필요한 본문을 지울 수 있으므로 정리하지 않음
+            return
+    pruned = get_blob_store().prune(keep=keep)
+    if pruned:
+        print(f"🧹 오래된 blob {pruned}개 삭제")
+
+
+def stream_research(
+    topic: str,
+    max_iterations: int = 3,
+    runtime: Optional[ResearchRuntime] = None
+) -> Iterator[Tuple[str, Any]]:
+    """
+    리서치를 실행하며 이벤트를 순서대로 반환하는 이터레이터
+    
+    이벤트:
+        ("node", (노드 이름, 상태 업데이트)): 노드 실행 완료
+        ("draft_start", 반복 횟수): 보고서 초안 작성 시작
+        ("token", 텍스트): 보고서 LLM 토큰
+        ("done", 최종 상태): 실행 완료
+    
+    실행 중 예외가 발생하면 이터레이터에서 다시 발생함
+    """
+    events: "queue.Queue[Tuple[str, Any]]" = queue.Queue()
+    
+    def worker():
+        try:
+            final_state = run_research(
+                topic,
+                max_iterations,
+                runtime=runtime,
+                on_token=lambda token: events.put(("token", token)),
+                on_draft_start=lambda iteration: events.put(("draft_start", iteration)),
+                on_node=lambda name, update: events.put(("node", (name, update)))
+            )
+            events.put(("done", final_state))
+        except BaseException as e:
+            events.put(("error", e))
+    
+    threading.Thread(target=worker, name="ResearchStream", daemon=True).start()
+    
+    while True:
+        kind, payload = events.get()
+        if kind == "error":
+            raise payload
+        yield kind, payload
+        if kind == "done":
+            return
+
+
+async def astream_research(
+    topic: str,
+    max_iterations: int = 3,
+    runtime: Optional[ResearchRuntime] = None
+) -> AsyncIterator[Tuple[str, Any]]:
+    """
+    stream_research의 비동기 버전 (이벤트 종류 동일, 스레드 없이 이벤트 루프에서 실행)
+    """
+    events: "asyncio.Queue[Tuple[str, Any]]" = asyncio.Queue()
+    
+    async def worker():
+        try:
+            final_state = await arun_research(
+                topic,
+                max_iterations,
+                runtime=runtime,
+                on_token=lambda token: events.put_nowait(("token", token)),
+                on_draft_start=lambda iteration: events.put_nowait(("draft_start", iteration)),
+                on_node=lambda name, update: events.put_nowait(("node", (name, update)))
+            )
+            events.put_nowait(("done", final_state))
+        except BaseException as e:
+            events.put_nowait(("error", e))
+    
+    task = asyncio.create_task(worker())
+    try:
+        while True:
+            kind, payload = await events.get()
+            if kind == "error":
+                raise payload
+            yield kind, payload
+            if kind == "done":
+                return
+    finally:
+        if not task.done():
+            task.cancel()
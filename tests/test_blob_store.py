@@ -0,0 +1,76 @@
+import os
+import time
+
+import pytest
+
+from tools.blob_store import BlobNotFoundError, BlobStore
+
+
+def test_prune_removes_expired_blobs(tmp_path):
+    store = BlobStore(spill_dir=str(tmp_path), spill=True, ttl_seconds=60, max_disk_bytes=0)
+    old, fresh = store.put("old"), store.put("fresh")
+    store.flush()
+    past = time.time() - 120
+    os.utime(store._path(old), (past, past))
+
+    assert store.prune() == 1
+    assert fresh in store
+    # 메모리에 남아 있던 본문은 조회되고 다음 flush에서 다시 기록됨
+    assert store.get(old) == "old"
+    assert store.flush() == 1
+
+
+def test_prune_caps_disk_usage_by_last_use(tmp_path):
+    store = BlobStore(memory_limit_bytes=0, spill_dir=str(tmp_path), spill=True,
+                      ttl_seconds=0, max_disk_bytes=250)
+    refs = [store.put(str(i) * 100) for i in range(4)]
+    store.flush()
+    now = time.time()
+    for age, ref in zip((40, 30, 20, 10), refs):
+        os.utime(store._path(ref), (now - age, now - age))
+    # 다시 저장한 본문은 최근 사용으로 취급
+    store.put("0" * 100)
+
+    assert store.prune() == 2
+    assert store.get(refs[0]) == "0" * 100
+    assert store.get(refs[3]) == "3" * 100
+    with pytest.raises(KeyError):
+        store.get(refs[1])
+
+
+def test_memory_is_bounded_without_spill(tmp_path):
+    store = BlobStore(memory_limit_bytes=250, spill_dir=str(tmp_path), spill=False)
+    refs = [store.put(str(i) * 100) for i in range(4)]
+
+    assert store.stats()["memory_bytes"] <= 250
+    assert store.stats()["dropped"] == 2
+    assert store.get(refs[3]) == "3" * 100
+    with pytest.raises(KeyError):
+        store.get(refs[0])
+    assert not any(tmp_path.iterdir())
+
+
+def test_pinned_blobs_are_kept_without_spill(tmp_path):
+    store = BlobStore(memory_limit_bytes=250, spill_dir=str(tmp_path), spill=False)
+    with store.pin_scope():
+        refs = [store.put(str(i) * 100) for i in range(4)]
+        assert store.stats()["dropped"] == 0
+        assert all(store.get(ref) for ref in refs)
+    store.put("x" * 100)
+
+    assert store.stats()["memory_bytes"] <= 250
+    with pytest.raises(BlobNotFoundError, match="blob 본문을 찾을 수 없습니다"):
+        store.get(refs[0])
+
+
+def test_prune_skips_pinned_and_kept_refs(tmp_path):
+    store = BlobStore(spill_dir=str(tmp_path), spill=True, ttl_seconds=1, max_disk_bytes=0)
+    kept, loose = store.put("kept"), store.put("loose")
+    with store.pin_scope():
+        pinned = store.put("pinned")
+    store.flush()
+
+    with store.pin_scope([pinned]):
+        assert store.prune(keep=[kept], now=time.time() + 60) == 1
+    assert kept in store and pinned in store
+    assert not store._path(loose).exists()
@@ -0,0 +1,33 @@
+import pytest
+
+from tools.dedup import ResultDeduplicator, canonicalize_url
+
+
+def test_content_selecting_params_are_kept():
+    assert canonicalize_url("https://github.com/o/r/blob/x?ref=main") != \
+        canonicalize_url("https://github.com/o/r/blob/x?ref=dev")
+    assert canonicalize_url("https://api.example.com/data?source=census") != \
+        canonicalize_url("https://api.example.com/data?source=survey")
+    assert canonicalize_url("https://www.example.com/a/?utm_source=x&fbclid=1&gclid=2") == \
+        canonicalize_url("http://example.com/a")
+
+
+@pytest.mark.parametrize("distance", [3, 5, 9])
+def test_band_index_finds_every_fingerprint_within_distance(distance):
+    deduplicator = ResultDeduplicator(max_distance=distance)
+    base = 0x0123456789ABCDEF
+    for band, key in enumerate(deduplicator._band_keys(base)):
+        deduplicator._bands[band].setdefault(key, []).append(base)
+
+    # 밴드마다 한 비트씩 바꿔 모든 밴드 키가 달라지는 최악의 경우도 찾아야 함
+    flipped = base
+    for start, _ in deduplicator._band_spans[:distance]:
+        flipped ^= 1 << start
+    assert deduplicator._find_similar(flipped)
+    assert not deduplicator._find_similar(flipped ^ 1 << deduplicator._band_spans[distance][0])
+
+
+@pytest.mark.parametrize("distance", [-1, 17])
+def test_out_of_range_distance_is_rejected(distance):
+    with pytest.raises(ValueError, match="SEARCH_DEDUP_DISTANCE"):
+        ResultDeduplicator(max_distance=distance)
@@ -0,0 +1,46 @@
+"""본문 추출 엔진 테스트"""
+
+import os
+
+import pytest
+
+from tools.extractor import _lxml_etree, extract_content
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+CORPUS = sorted(name for name in os.listdir(CORPUS_DIR) if name.endswith(".html"))
+
+UNCLOSED_P = """
+<html><body><article>
+<p>First paragraph with enough words to be kept as content
+<h2>Section heading</h2>
+<p>Second paragraph, also long enough to count as body text
+<ul><li>first list item<li>second list item</ul>
+<p>Third paragraph before a block container element here
+<div>Trailing block of text inside a div element</div>
+<p>Fourth paragraph before a table with a single cell here
+<table><tr><td>cell text</td></tr></table>
+</article></body></html>
+"""
+
+
+def test_unclosed_paragraph_is_closed_by_block_tags():
+    content = extract_content(UNCLOSED_P, backend="html.parser")["content"]
+    paragraphs = content.split("\n\n")
+    assert "Section heading" in paragraphs
+    assert "first list item" in paragraphs
+    assert "Trailing block of text inside a div element" in paragraphs
+    assert all("content Section" not in p and "here Trailing" not in p for p in paragraphs)
+
+
+@pytest.mark.skipif(_lxml_etree is None, reason="lxml이 설치되지 않음")
+@pytest.mark.parametrize("html", [UNCLOSED_P], ids=["unclosed_p"])
+def test_backends_agree_on_unclosed_tags(html):
+    assert extract_content(html, backend="lxml") == extract_content(html, backend="html.parser")
+
+
+@pytest.mark.skipif(_lxml_etree is None, reason="lxml이 설치되지 않음")
+@pytest.mark.parametrize("name", CORPUS)
+def test_backends_agree_on_corpus(name):
+    with open(os.path.join(CORPUS_DIR, name), encoding="utf-8") as f:
+        html = f.read()
+    assert extract_content(html, backend="lxml") == extract_content(html, backend="html.parser")
@@ -0,0 +1,49 @@
+import json
+
+from langchain_core.language_models import FakeListChatModel
+from langchain_core.messages import AIMessage
+
+from agents.reviewer import ReviewerAgent
+from agents.sections import split_sections
+
+
+def _reviewer(chunk_chars=4000):
+    return ReviewerAgent(llm=FakeListChatModel(responses=["unused"]), chunk_chars=chunk_chars)
+
+
+def _response(score, feedback, section_feedback=()):
+    return AIMessage(content=json.dumps({
+        "score": score,
+        "feedback": feedback,
+        "section_feedback": [{"section": s, "feedback": f} for s, f in section_feedback]
+    }, ensure_ascii=False))
+
+
+def test_failed_chunks_are_reported_by_original_index():
+    chunks = ["a" * 100, "b" * 100, "c" * 200]
+    responses = [_response(8, "첫 부분"), TimeoutError("timed out"), _response(7, "셋째 부분", [("결론", "보강")])]
+    result = _reviewer()._reduce_responses(chunks, responses)
+
+    assert result["coverage"] == 0.75
+    lines = result["feedback"].splitlines()
+    assert lines[0].startswith("⚠️ 청크 1/3개 검토 실패")
+    assert lines[1].startswith("[1/3] (8/10) 첫 부분")
+    assert lines[2] == "[2/3] 검토 실패: TimeoutError: timed out"
+    assert lines[3].startswith("[3/3] (7/10) 셋째 부분")
+    assert result["section_feedback"] == {"결론": "보강"}
+
+
+def test_oversize_section_is_split_on_paragraphs_with_title():
+    paragraphs = [f"문단 {i} " + "내용 " * 40 for i in range(10)]
+    report = "## 개요\n\n짧은 개요\n\n## 분석\n\n" + "\n\n".join(paragraphs) + "\n"
+    reviewer = _reviewer(chunk_chars=600)
+    chunks = reviewer._chunk_sections(split_sections(report))
+
+    assert len(chunks) > 2
+    assert all(len(chunk) <= 600 for chunk in chunks)
+    analysis = [chunk for chunk in chunks if "문단" in chunk]
+    # 조각마다 섹션 제목이 있어 섹션 피드백을 같은 섹션으로 지정할 수 있음
+    assert all(any(s.title == "분석" for s in split_sections(chunk)) for chunk in analysis)
+    # 문단 경계에서만 나눔
+    assert all(chunk.count("문단") == sum(p in chunk for p in paragraphs) for chunk in analysis)
+    assert "".join(chunks).count("문단") == len(paragraphs)
@@ -0,0 +1,128 @@
+"""HostScheduler / WebScraper 시간 예산(deadline) 처리 및 비동기 클라이언트 수명 테스트"""
+
+import asyncio
+import time
+
+from tools import scraper as scraper_module
+from tools.scraper import HostScheduler, WebScraper
+
+URL = "https://flaky.example/page"
+
+
+def _scheduler(cooldown: float) -> HostScheduler:
+    return HostScheduler(
+        max_concurrency=4, per_host_concurrency=1, rate_per_host=1000,
+        failure_threshold=1, cooldown=cooldown
+    )
+
+
+def test_cancelled_probe_does_not_block_host_forever():
+    scheduler = _scheduler(cooldown=0.05)
+
+    async def failing(index, url):
+        return {"url": url, "error": "timeout", "error_type": "timeout", "success": False}
+
+    async def hanging(index, url):
+        await asyncio.sleep(10)
+        return {"url": url, "success": True}
+
+    async def ok(index, url):
+        return {"url": url, "success": True}
+
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        # 1) 실패로 회로가 열림
+        await scheduler.run([URL], failing)
+        assert scheduler.breaker("flaky.example").is_open
+
+        # 2) cooldown 후 반열림 시험 요청이 마감으로 취소됨
+        await asyncio.sleep(0.06)
+        results = await scheduler.run([URL], hanging, deadline=loop.time() + 0.05)
+        assert results[0]["error_type"] == "deadline"
+
+        # 3) cooldown 후 다시 스크랩되어야 함 (마감 없이도 끝나야 함)
+        await asyncio.sleep(0.06)
+        return await asyncio.wait_for(scheduler.run([URL], ok), timeout=2)
+
+    results = asyncio.run(scenario())
+    assert results[0]["success"]
+    assert not scheduler.breaker("flaky.example").probing
+
+
+def test_caller_cancellation_releases_probe():
+    scheduler = _scheduler(cooldown=0.0)
+    breaker = scheduler.breaker("flaky.example")
+    breaker.record(failed=True)
+
+    async def hanging(index, url):
+        await asyncio.sleep(10)
+
+    async def scenario():
+        task = asyncio.ensure_future(scheduler.run([URL], hanging))
+        await asyncio.sleep(0.05)
+        assert breaker.probing
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    asyncio.run(scenario())
+    assert not breaker.probing
+    assert breaker.allow()
+
+
+def test_offloaded_parsing_respects_deadline(monkeypatch):
+    def slow_extract(html):
+        time.sleep(0.2)
+        return {"title": "t", "description": "", "content": html}
+
+    monkeypatch.setattr(scraper_module, "extract_content", slow_extract)
+    scraper = WebScraper(parse_mode="thread", parse_workers=1)
+
+    async def fake_fetch(url):
+        return "<p>content</p>"
+
+    monkeypatch.setattr(scraper, "_afetch", fake_fetch)
+    urls = [f"https://host{i}.example/" for i in range(5)]
+
+    async def scenario():
+        start = time.perf_counter()
+        results = await scraper.scrape_multiple(urls, timeout=0.1)
+        return results, time.perf_counter() - start
+
+    try:
+        results, elapsed = asyncio.run(scenario())
+    finally:
+        scraper.close()
+
+    assert elapsed < 0.5
+    assert all(r["error_type"] == "deadline" for r in results)
+
+
+def test_async_client_is_closed_when_its_loop_ends():
+    scraper = WebScraper()
+
+    async def get_client():
+        client = scraper._get_async_client()
+        assert scraper._get_async_client() is client
+        return client
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+    assert first.is_closed and second.is_closed
+    assert not scraper._async_clients and not scraper._host_semaphores
+    scraper.close()
+
+
+def test_aclose_closes_current_loop_client():
+    scraper = WebScraper()
+
+    async def use_and_close():
+        client = scraper._get_async_client()
+        scraper._host_semaphore(URL)
+        await scraper.aclose()
+        return client
+
+    assert asyncio.run(use_and_close()).is_closed
+    assert not scraper._async_clients and not scraper._host_semaphores
+    scraper.close()
@@ -0,0 +1,43 @@
+import json
+
+from graph.tracing import RunTrace, is_tracing_enabled
+
+
+def _trace():
+    trace = RunTrace("research_run", {"research.topic": "주제"})
+    with trace.span("plan", {"research.iteration": 0}):
+        pass
+    trace.finish()
+    return trace
+
+
+def test_tracing_is_off_by_default(monkeypatch):
+    monkeypatch.delenv("TRACING", raising=False)
+    assert not is_tracing_enabled()
+    monkeypatch.setenv("TRACING", "on")
+    assert is_tracing_enabled()
+
+
+def test_export_writes_otlp_json(tmp_path):
+    path = _trace().export(str(tmp_path / "spans.jsonl"))
+    request = json.loads(path.read_text(encoding="utf-8"))
+
+    spans = request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    root, plan = spans
+    assert "parentSpanId" not in root and plan["parentSpanId"] == root["spanId"]
+    assert isinstance(root["startTimeUnixNano"], str) and int(root["endTimeUnixNano"]) >= int(root["startTimeUnixNano"])
+    assert root["kind"] == 1 and root["status"] == {"code": 1}
+    attributes = {item["key"]: item["value"] for item in plan["attributes"]}
+    assert attributes["research.iteration"] == {"intValue": "0"}
+    assert "doubleValue" in attributes["duration_ms"]
+    assert {"key": "research.topic", "value": {"stringValue": "주제"}} in root["attributes"]
+
+
+def test_export_rotates_large_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("TRACE_MAX_MB", "0.001")
+    path = tmp_path / "spans.jsonl"
+    for _ in range(3):
+        _trace().export(str(path))
+
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+    assert (tmp_path / "spans.jsonl.1").exists()
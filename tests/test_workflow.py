@@ -0,0 +1,108 @@
+"""run_research / resume_research 반환값과 blob 보관 테스트 (가짜 LLM/검색)"""
+
+import contextlib
+import io
+import shutil
+
+import pytest
+
+from benchmarks.fakes import FakeChatModel, FakeSearchTool
+from agents import PlannerAgent, ResearcherAgent, ReviewerAgent, WriterAgent
+from graph import checkpoint as checkpoint_module
+from graph import workflow as workflow_module
+from graph.checkpoint import new_run_id
+from graph.runtime import ResearchRuntime
+from graph.workflow import resume_research, run_research
+from tools import blob_store as blob_store_module
+from tools.blob_store import BlobNotFoundError, BlobStore, is_blob_ref
+
+
+class FlakyRuntime(ResearchRuntime):
+    """fail이 켜져 있으면 작성 노드에서 실패하는 런타임"""
+    fail = False
+
+    def write(self, state, config):
+        if self.fail:
+            raise RuntimeError("writer failed")
+        return super().write(state, config)
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("LLM_CACHE", "off")
+    monkeypatch.setenv("TRACING", "off")
+    return FlakyRuntime(
+        planner=PlannerAgent(llm=FakeChatModel(role="planner", latency_ms=0)),
+        researcher=ResearcherAgent(
+            llm=FakeChatModel(role="researcher", latency_ms=0),
+            search_tool=FakeSearchTool(latency_ms=0)
+        ),
+        writer=WriterAgent(llm=FakeChatModel(role="writer", latency_ms=0)),
+        reviewer=ReviewerAgent(llm=FakeChatModel(role="reviewer", latency_ms=0))
+    )
+
+
+@pytest.fixture
+def stores(tmp_path, monkeypatch):
+    """임시 체크포인트 파일과 blob 디렉터리를 쓰는 기본 저장소"""
+    path = str(tmp_path / "research.sqlite")
+    monkeypatch.setattr(checkpoint_module, "CHECKPOINT_PATH", path)
+    monkeypatch.setattr(workflow_module, "CHECKPOINT_PATH", path)
+    blob_dir = tmp_path / "blobs"
+
+    def new_blob_store(**kwargs):
+        store = BlobStore(spill_dir=str(blob_dir), spill=True, **kwargs)
+        monkeypatch.setattr(blob_store_module, "_default_store", store)
+        return store
+
+    new_blob_store()
+    return blob_dir, new_blob_store
+
+
+def _quiet(fn, *args, **kwargs):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return fn(*args, **kwargs)
+
+
+def test_run_returns_texts_instead_of_refs(runtime, stores):
+    updates = {}
+    state = _quiet(run_research, "topic", 1, runtime=runtime,
+                   on_node=lambda name, update: updates.setdefault(name, update))
+
+    assert state["final_report"] and not is_blob_ref(state["final_report"])
+    assert state["gathered_info"] and not any(map(is_blob_ref, state["gathered_info"]))
+    assert not any(map(is_blob_ref, updates["research"]["gathered_info"]))
+    assert not is_blob_ref(updates["write"]["draft_report"])
+
+
+def test_prune_keeps_blobs_of_resumable_runs(runtime, stores):
+    blob_dir, new_blob_store = stores
+    run_id = new_run_id()
+    runtime.fail = True
+    with pytest.raises(RuntimeError):
+        _quiet(run_research, "topic", 1, runtime=runtime, run_id=run_id)
+
+    # 다른 실행이 끝날 때 모든 본문이 정리 대상이 되도록 한도를 0에 가깝게 설정
+    new_blob_store(ttl_seconds=0, max_disk_bytes=1)
+    runtime.fail = False
+    _quiet(run_research, "other topic", 1, runtime=runtime)
+
+    # 다른 프로세스에서 이어서 실행하는 것처럼 빈 메모리로 시작
+    new_blob_store()
+    state = _quiet(resume_research, run_id, runtime=runtime)
+    assert state["final_report"] and not is_blob_ref(state["final_report"])
+
+
+def test_resume_reports_missing_blobs(runtime, stores):
+    blob_dir, new_blob_store = stores
+    run_id = new_run_id()
+    runtime.fail = True
+    with pytest.raises(RuntimeError):
+        _quiet(run_research, "topic", 1, runtime=runtime, run_id=run_id)
+
+    shutil.rmtree(blob_dir)
+    new_blob_store()
+    runtime.fail = False
+    with pytest.raises(BlobNotFoundError, match=run_id):
+        _quiet(resume_research, run_id, runtime=runtime)
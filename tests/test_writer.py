@@ -0,0 +1,51 @@
+from langchain_core.language_models import FakeListChatModel
+
+from agents.sections import split_sections
+from agents.writer import WriterAgent
+
+REPORT = """# 보고서
+
+## 개요
+
+기존 개요
+
+## 분석
+
+기존 분석
+
+## 결론
+
+기존 결론
+"""
+
+
+def _writer():
+    return WriterAgent(llm=FakeListChatModel(responses=["unused"]))
+
+
+def _section(title):
+    return next(section for section in split_sections(REPORT) if section.title == title)
+
+
+def test_merge_keeps_original_heading():
+    original = _section("분석")
+    merged = _writer()._merge_section(original, "## 분석 (수정)\n\n새 분석\n")
+    assert merged == "## 분석\n\n새 분석\n\n"
+
+
+def test_merge_keeps_deeper_subsections():
+    original = _section("분석")
+    merged = _writer()._merge_section(original, "새 분석\n\n### 세부\n\n내용")
+    assert merged == "## 분석\n\n새 분석\n\n### 세부\n\n내용\n\n"
+
+
+def test_merge_rejects_extra_sibling_sections():
+    original = _section("분석")
+    rewritten = "## 분석\n\n새 분석\n\n## 결론\n\n중복된 결론\n"
+    assert _writer()._merge_section(original, rewritten) == original.text
+
+
+def test_merge_rejects_whole_report():
+    original = _section("분석")
+    rewritten = REPORT.replace("기존 분석", "새 분석")
+    assert _writer()._merge_section(original, rewritten) == original.text
@@ -1,5 +1,23 @@
 """Research tools for web search and scraping"""
-from .web_search import TavilySearchTool, search_web
-from .scraper import WebScraper, scrape_url
+import importlib
 
-__all__ = ["TavilySearchTool", "search_web", "WebScraper", "scrape_url"]
+# 이름 -> 모듈 (검색만 쓰는 경우 스크래퍼 의존성(httpx 등)을 로드하지 않도록 지연 임포트)
+_EXPORTS = {
+    "TavilySearchTool": ".web_search", "MockSearchTool": ".web_search",
+    "get_search_tool": ".web_search", "search_web": ".web_search",
+    "SharedSearchTool": ".web_search",
+    "SearchCache": ".search_cache", "get_search_cache": ".search_cache",
+    "ResultDeduplicator": ".dedup", "canonicalize_url": ".dedup",
+    "select_passages": ".ranking",
+    "BlobStore": ".blob_store", "get_blob_store": ".blob_store",
+    "BlobNotFoundError": ".blob_store",
+    "WebScraper": ".scraper", "get_scraper": ".scraper", "scrape_url": ".scraper",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        return getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,317 @@
+"""
+Blob Store
+큰 텍스트(검색 본문, 요약, 보고서)를 내용 해시로 저장하는 저장소
+
+워크플로우 상태에는 "blob:<해시>" 참조만 담고 본문은 여기 둬서
+노드 간 전달, 스트리밍, 체크포인트 직렬화 비용이 쿼리 수와 무관하게 작게 유지되게 함.
+메모리 사용량이 한도를 넘으면 오래 사용하지 않은 본문부터 디스크로 내보냄(spill).
+디스크의 본문은 prune()에서 보관 기간(BLOB_TTL_HOURS)과 용량(BLOB_DIR_MAX_MB) 기준으로 정리하되,
+실행 중인 리서치가 고정(pin_scope)한 본문과 prune(keep=...)으로 넘긴 본문은 남김
+"""
+
+import contextlib
+import contextvars
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+BLOB_PREFIX = "blob:"
+
+# 기본 저장 위치 (현재 디렉터리가 아닌 프로젝트 루트 기준이므로 다른 위치에서 이어서 실행해도 같은 본문을 읽음)
+DEFAULT_BLOB_DIR = Path(__file__).resolve().parent.parent / ".cache" / "blobs"
+
+
+def is_blob_ref(value) -> bool:
+    return isinstance(value, str) and value.startswith(BLOB_PREFIX)
+
+
+def collect_blob_refs(value: Any) -> Set[str]:
+    """상태(dict/list 중첩)에 들어 있는 blob 참조 전체"""
+    if is_blob_ref(value):
+        return {value}
+    if isinstance(value, dict):
+        value = value.values()
+    elif not isinstance(value, (list, tuple)):
+        return set()
+    refs = set()
+    for item in value:
+        refs |= collect_blob_refs(item)
+    return refs
+
+
+class BlobNotFoundError(KeyError):
+    """참조한 본문이 메모리와 디스크에 모두 없음 (정리되었거나 다른 BLOB_DIR을 사용)"""
+
+    def __init__(self, ref: str, message: Optional[str] = None):
+        super().__init__(ref)
+        self.ref = ref
+        self.message = message or (
+            f"blob 본문을 찾을 수 없습니다: {ref} "
+            "(보관 기간/용량 정리로 삭제되었거나 BLOB_DIR이 다름)"
+        )
+
+    def __str__(self) -> str:
+        return self.message
+
+
+# 현재 실행(pin_scope)이 고정한 참조 집합 (LangGraph 노드에도 전달됨)
+_current_pins: "contextvars.ContextVar[Optional[Set[str]]]" = contextvars.ContextVar(
+    "blob_pins", default=None
+)
+
+
+class BlobStore:
+    """
+    내용 주소 기반 텍스트 저장소 (메모리 LRU + 선택적 디스크 spill)
+
+    - 같은 내용은 한 번만 저장 (실행 간에도 공유)
+    - spill을 끄면 한도를 넘은 오래된 본문은 버림 (이후 조회 시 BlobNotFoundError)
+    - 디스크 본문은 마지막 사용 시각(mtime) 기준으로 보관 기간/용량을 넘으면 삭제
+    - pin_scope() 안에서 저장한 본문은 블록이 끝날 때까지 버리거나 삭제하지 않음
+    """
+
+    def __init__(
+        self,
+        memory_limit_bytes: Optional[int] = None,
+        spill_dir: Optional[str] = None,
+        spill: Optional[bool] = None,
+        max_disk_bytes: Optional[int] = None,
+        ttl_seconds: Optional[float] = None
+    ):
+        self.memory_limit_bytes = memory_limit_bytes if memory_limit_bytes is not None else int(
+            float(os.getenv("BLOB_MEMORY_MB", "64")) * 1024 * 1024
+        )
+        self.spill_dir = Path(spill_dir or os.getenv("BLOB_DIR") or DEFAULT_BLOB_DIR)
+        if spill is None:
+            spill = os.getenv("BLOB_SPILL", "on").lower() not in ("0", "off", "false", "no")
+        self.spill = spill
+        # 0이면 해당 기준으로는 정리하지 않음
+        self.max_disk_bytes = max_disk_bytes if max_disk_bytes is not None else int(
+            float(os.getenv("BLOB_DIR_MAX_MB", "1024")) * 1024 * 1024
+        )
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else (
+            float(os.getenv("BLOB_TTL_HOURS", "168")) * 3600
+        )
+
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
+        self._memory_bytes = 0
+        self._on_disk = set()
+        self._scopes: Dict[int, Set[str]] = {}
+        self._lock = threading.Lock()
+        self.spilled = 0
+        self.dropped = 0
+        self.pruned = 0
+
+    @staticmethod
+    def make_ref(data: bytes) -> str:
+        return BLOB_PREFIX + hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    def _path(self, ref: str) -> Path:
+        digest = ref[len(BLOB_PREFIX):]
+        return self.spill_dir / digest[:2] / digest
+
+    def put(self, text: str) -> str:
+        """텍스트 저장 후 참조 반환"""
+        data = text.encode("utf-8")
+        ref = self.make_ref(data)
+        pins = _current_pins.get()
+        with self._lock:
+            if pins is not None:
+                pins.add(ref)
+            if ref in self._memory:
+                self._memory.move_to_end(ref)
+                return ref
+            if ref in self._on_disk and self._touch(ref):
+                return ref
+            self._memory[ref] = data
+            self._memory_bytes += len(data)
+            self._evict()
+        return ref
+
+    def get(self, ref: str) -> str:
+        """참조로 텍스트 조회 (없으면 BlobNotFoundError)"""
+        with self._lock:
+            data = self._memory.get(ref)
+            if data is not None:
+                self._memory.move_to_end(ref)
+                return data.decode("utf-8")
+        path = self._path(ref)
+        try:
+            text = path.read_bytes().decode("utf-8")
+            os.utime(path)
+        except (FileNotFoundError, ValueError):
+            raise BlobNotFoundError(ref) from None
+        return text
+
+    def __contains__(self, ref: str) -> bool:
+        with self._lock:
+            if ref in self._memory or ref in self._on_disk:
+                return True
+        return self._path(ref).exists()
+
+    @contextlib.contextmanager
+    def pin_scope(self, refs: Iterable[str] = ()) -> Iterator[Set[str]]:
+        """
+        블록 안에서 저장한 본문과 refs를 블록이 끝날 때까지 고정
+
+        실행 하나를 감싸서 사용하며, 고정된 본문은 메모리 한도를 넘어도 버리지 않고
+        prune()에서도 삭제하지 않음 (spill을 켠 경우 디스크로 내보내는 것은 허용)
+        """
+        pinned = set(refs)
+        with self._lock:
+            self._scopes[id(pinned)] = pinned
+        token = _current_pins.set(pinned)
+        try:
+            yield pinned
+        finally:
+            _current_pins.reset(token)
+            with self._lock:
+                del self._scopes[id(pinned)]
+
+    def flush(self) -> int:
+        """메모리에만 있는 본문을 디스크에 기록 (다른 프로세스에서 이어서 실행할 때 필요)"""
+        with self._lock:
+            pending = [(ref, data) for ref, data in self._memory.items() if ref not in self._on_disk]
+            for ref, data in pending:
+                self._write(ref, data)
+            return len(pending)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "memory_blobs": len(self._memory),
+                "memory_bytes": self._memory_bytes,
+                "disk_blobs": len(self._on_disk),
+                "spilled": self.spilled,
+                "dropped": self.dropped,
+                "pruned": self.pruned
+            }
+
+    def prune(self, keep: Iterable[str] = (), now: Optional[float] = None) -> int:
+        """
+        디스크 본문 정리 (삭제한 파일 수 반환)
+
+        마지막 사용 후 보관 기간이 지난 본문을 지우고, 남은 용량이 한도를 넘으면
+        오래 사용하지 않은 본문부터 지움. 고정된 본문과 keep(예: 이어서 실행할 수 있는
+        체크포인트가 참조하는 본문)은 남기며, 메모리에 남아 있는 본문은 flush()에서 다시 기록됨
+        """
+        keep = set(keep)
+        if not self.spill_dir.is_dir():
+            return 0
+        now = time.time() if now is None else now
+        files = []
+        for path in self.spill_dir.glob("??/*"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        removed = 0
+        with self._lock:
+            for mtime, size, path in files:
+                expired = self.ttl_seconds > 0 and now - mtime > self.ttl_seconds
+                over = self.max_disk_bytes > 0 and total > self.max_disk_bytes
+                temporary = path.name.startswith(".tmp-")
+                ref = BLOB_PREFIX + path.name
+                # 쓰는 중인 임시 파일은 보관 기간이 지난 경우(중단된 기록)만 삭제
+                if not (expired or (over and not temporary)):
+                    continue
+                if not temporary and (ref in keep or self._is_pinned(ref)):
+                    continue
+                try:
+                    path.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+                self._on_disk.discard(ref)
+            self.pruned += removed
+        return removed
+
+    def _evict(self) -> None:
+        """
+        메모리 한도를 넘은 만큼 LRU 순서로 디스크에 내보냄 (잠금을 잡은 상태에서 호출)
+
+        spill을 끈 경우 디스크에 기록되지 않은 본문은 버리되 고정된 본문은 한도를 넘어도 유지
+        """
+        if self._memory_bytes <= self.memory_limit_bytes:
+            return
+        # 가장 최근에 저장한 본문은 항상 메모리에 남김
+        for ref in list(self._memory)[:-1]:
+            if self._memory_bytes <= self.memory_limit_bytes:
+                break
+            if ref not in self._on_disk:
+                if self.spill:
+                    self._write(ref, self._memory[ref])
+                    self.spilled += 1
+                elif self._is_pinned(ref):
+                    continue
+                else:
+                    self.dropped += 1
+            self._memory_bytes -= len(self._memory.pop(ref))
+
+    def _is_pinned(self, ref: str) -> bool:
+        """실행 중인 pin_scope가 고정한 참조인지 (잠금을 잡은 상태에서 호출)"""
+        return any(ref in pinned for pinned in self._scopes.values())
+
+    def _touch(self, ref: str) -> bool:
+        """디스크 본문의 사용 시각 갱신 (prune에서 이미 지워졌으면 False)"""
+        try:
+            os.utime(self._path(ref))
+            return True
+        except FileNotFoundError:
+            self._on_disk.discard(ref)
+            return False
+
+    def _write(self, ref: str, data: bytes) -> None:
+        path = self._path(ref)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # 임시 파일에 쓴 뒤 교체해 다른 프로세스가 쓰다 만 파일을 읽지 않게 함
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._on_disk.add(ref)
+
+
+_default_store: Optional[BlobStore] = None
+_default_store_lock = threading.Lock()
+
+
+def get_blob_store() -> BlobStore:
+    """프로세스 전체에서 공유하는 기본 저장소"""
+    global _default_store
+    with _default_store_lock:
+        if _default_store is None:
+            _default_store = BlobStore()
+        return _default_store
+
+
+def store_text(text: Optional[str]) -> Optional[str]:
+    """텍스트를 저장하고 참조 반환 (None/빈 문자열/이미 참조인 값은 그대로)"""
+    if not text or is_blob_ref(text):
+        return text
+    return get_blob_store().put(text)
+
+
+def load_text(value: Optional[str]) -> str:
+    """참조면 본문을 읽고, 일반 텍스트면 그대로 반환 (None은 빈 문자열)"""
+    if is_blob_ref(value):
+        return get_blob_store().get(value)
+    return value or ""
+
+
+def store_texts(texts: Iterable[str]) -> List[str]:
+    return [store_text(text) for text in texts]
+
+
+def load_texts(values: Iterable[str]) -> List[str]:
+    return [load_text(value) for value in values]
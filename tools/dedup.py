@@ -0,0 +1,176 @@
+"""
+Result Deduplication
+검색 결과 중복 제거 (URL 정규화 + SimHash 유사 문서 탐지)
+"""
+
+import hashlib
+import os
+import re
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# 제거할 추적용 쿼리 파라미터 (광고/캠페인 클릭 ID만 포함.
+# ref, source처럼 사이트에 따라 내용(브랜치, 데이터 출처 등)을 고르는 키는 남김)
+TRACKING_PARAMS = {
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref_src", "ref_url", "spm", "cmpid", "ncid", "ocid",
+}
+TRACKING_PREFIXES = ("utm_", "ga_", "hsa_", "pk_", "mtm_")
+
+# 같은 사이트의 모바일/AMP 호스트 접두어
+HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+SIMHASH_BITS = 64
+# 유사 문서로 볼 최대 해밍 거리 상한 (그 이상은 관련 없는 문서도 묶임)
+MAX_SIMHASH_DISTANCE = 16
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    비교용 URL 정규화
+
+    스킴/호스트 소문자화, www/m/amp 호스트 접두어와 기본 포트 제거,
+    추적 파라미터와 fragment 제거, 쿼리 파라미터 정렬, 끝 슬래시와 /amp 경로 제거
+    """
+    url = (url or "").strip()
+    if not url:
+        return ""
+    parts = urlsplit(url if "//" in url else f"//{url}")
+
+    host = (parts.hostname or "").lower().rstrip(".")
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix) and host.count(".") > 1:
+            host = host[len(prefix):]
+            break
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+
+    path = re.sub(r"/{2,}", "/", parts.path or "/")
+    path = re.sub(r"/amp/?$", "/", path)
+    path = re.sub(r"/index\.(html?|php)$", "/", path)
+    if len(path) > 1:
+        path = path.rstrip("/")
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+
+    # http/https는 같은 문서로 취급
+    return urlunsplit(("", host, path, urlencode(query), ""))
+
+
+def _shingles(text: str, size: int = 3) -> List[str]:
+    """단어 n-gram shingle (단어가 적으면 문자 n-gram)"""
+    words = _WORD.findall(text.casefold())
+    if len(words) >= size * 2:
+        return [" ".join(words[i:i + size]) for i in range(len(words) - size + 1)]
+    joined = "".join(words)
+    return [joined[i:i + 4] for i in range(max(1, len(joined) - 3))]
+
+
+def simhash(text: str) -> int:
+    """텍스트의 64비트 SimHash"""
+    weights = [0] * SIMHASH_BITS
+    for shingle in _shingles(text):
+        value = int.from_bytes(
+            hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    return sum(1 << bit for bit, weight in enumerate(weights) if weight > 0)
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+class ResultDeduplicator:
+    """
+    검색 결과 중복 제거기
+
+    - 정규화한 URL이 같으면 중복
+    - 제목 + 본문 SimHash의 해밍 거리가 max_distance 이하이면 유사 문서로 보고 중복
+      (64비트를 max_distance + 1개 밴드로 나눈 인덱스로 후보만 비교하므로
+      비둘기집 원리에 따라 거리 max_distance 이하인 문서는 누락 없이 찾음)
+
+    먼저 들어온 결과를 남기므로 쿼리/결과 순서대로 호출하면 됨
+    """
+
+    def __init__(
+        self,
+        max_distance: Optional[int] = None,
+        min_content_chars: int = 80,
+        enabled: Optional[bool] = None
+    ):
+        self.max_distance = max_distance if max_distance is not None else int(
+            os.getenv("SEARCH_DEDUP_DISTANCE", "3")
+        )
+        if not 0 <= self.max_distance <= MAX_SIMHASH_DISTANCE:
+            raise ValueError(
+                f"SEARCH_DEDUP_DISTANCE는 0~{MAX_SIMHASH_DISTANCE} 사이여야 합니다: {self.max_distance}"
+            )
+        self.min_content_chars = min_content_chars
+        if enabled is None:
+            enabled = os.getenv("SEARCH_DEDUP", "on").lower() not in ("0", "off", "false", "no")
+        self.enabled = enabled
+
+        self._urls = set()
+        # 밴드별 (시작 비트, 비트 수): 64비트를 거의 같은 폭으로 나눔
+        bands = self.max_distance + 1
+        self._band_spans = [
+            (SIMHASH_BITS * band // bands, SIMHASH_BITS * (band + 1) // bands - SIMHASH_BITS * band // bands)
+            for band in range(bands)
+        ]
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self.url_duplicates = 0
+        self.content_duplicates = 0
+
+    def is_duplicate(self, result: Dict[str, Any]) -> bool:
+        """이미 본 결과와 중복인지 확인하고, 새 결과면 등록"""
+        if not self.enabled:
+            return False
+
+        url = canonicalize_url(result.get("url", ""))
+        if url and url in self._urls:
+            self.url_duplicates += 1
+            return True
+
+        content = result.get("content") or ""
+        fingerprint = None
+        if len(content) >= self.min_content_chars:
+            fingerprint = simhash(f"{result.get('title', '')}\n{content}")
+            if self._find_similar(fingerprint):
+                self.content_duplicates += 1
+                return True
+
+        if url:
+            self._urls.add(url)
+        if fingerprint is not None:
+            for band, key in enumerate(self._band_keys(fingerprint)):
+                self._bands[band].setdefault(key, []).append(fingerprint)
+        return False
+
+    def filter(self, results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """중복이 아닌 결과만 순서대로 반환"""
+        return [result for result in results if not self.is_duplicate(result)]
+
+    def stats(self) -> Tuple[int, int]:
+        """(URL 중복 수, 내용 중복 수)"""
+        return self.url_duplicates, self.content_duplicates
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        return [fingerprint >> start & ((1 << width) - 1) for start, width in self._band_spans]
+
+    def _find_similar(self, fingerprint: int) -> bool:
+        seen = set()
+        for band, key in enumerate(self._band_keys(fingerprint)):
+            for candidate in self._bands[band].get(key, ()):
+                if candidate in seen:
+                    continue
+                seen.add(candidate)
+                if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                    return True
+        return False
@@ -0,0 +1,351 @@
+"""
+Content Extractor
+HTML 본문 추출 엔진 (단일 패스 + 텍스트 밀도 점수)
+
+lxml이 설치되어 있으면 lxml 파서를, 없으면 표준 라이브러리 html.parser를 사용함.
+두 백엔드 모두 같은 이벤트 핸들러(_ExtractionHandler)를 구동하며, html.parser는
+생략된 종료 태그를 보정하지 않으므로 핸들러가 HTML의 암시적 종료 규칙(<p>, <li> 등)을
+적용함. 심하게 깨진 문서에서는 두 파서의 복구 방식 차이로 결과가 다를 수 있음.
+"""
+
+import os
+import re
+from html.parser import HTMLParser
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:  # pragma: no cover - lxml은 선택 의존성
+    _lxml_etree = None
+
+
+# 내용 전체를 건너뛰는 태그
+SKIP_TAGS = frozenset({
+    "script", "style", "noscript", "template", "svg", "iframe",
+    "nav", "footer", "header", "aside", "form", "button", "select"
+})
+
+# 하나의 문단으로 취급하는 태그
+BLOCK_TAGS = frozenset({
+    "p", "h1", "h2", "h3", "h4", "h5", "h6", "li", "pre",
+    "blockquote", "td", "th", "dd", "dt", "figcaption"
+})
+
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+
+# 점수를 누적받는 컨테이너 태그
+CONTAINER_TAGS = frozenset({
+    "body", "article", "main", "section", "div", "td", "table", "ul", "ol"
+})
+
+# 열린 <p>를 암시적으로 닫는 시작 태그 (HTML 명세의 p 종료 태그 생략 규칙)
+P_CLOSING_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "details", "dialog", "div", "dl",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hgroup", "hr", "main", "menu", "nav", "ol", "p", "pre",
+    "section", "table", "ul", "li", "dd", "dt"
+})
+
+# 시작 태그 -> 같은 범위에서 암시적으로 닫히는 열린 태그
+IMPLIED_END_TAGS = {
+    "li": ("li",),
+    "dt": ("dt", "dd"),
+    "dd": ("dt", "dd"),
+    "td": ("td", "th"),
+    "th": ("td", "th"),
+    "tr": ("tr", "td", "th"),
+}
+
+# 암시적 종료를 찾을 때 넘어가지 않는 범위 경계
+SCOPE_TAGS = frozenset({"html", "table", "td", "th", "caption", "template", "button", "object"})
+LIST_SCOPE_TAGS = SCOPE_TAGS | {"ul", "ol", "dl"}
+
+# 종료 태그가 없는 태그
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+})
+
+POSITIVE_HINTS = re.compile(
+    r"article|body|content|entry|main|post|story|text|본문|기사", re.I
+)
+NEGATIVE_HINTS = re.compile(
+    r"ad-|ads|banner|comment|footer|menu|nav|popup|promo|related|share|"
+    r"sidebar|social|sponsor|widget|댓글|광고", re.I
+)
+
+MIN_PARAGRAPH_CHARS = 25
+MAX_LINK_DENSITY = 0.5
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def available_backend() -> str:
+    """사용 가능한 가장 빠른 파서 백엔드 이름"""
+    return "lxml" if _lxml_etree is not None else "html.parser"
+
+
+class _Paragraph:
+    __slots__ = ("text", "link_chars", "tag", "containers")
+
+    def __init__(self, text: str, link_chars: int, tag: str, containers: Tuple[int, ...]):
+        self.text = text
+        self.link_chars = link_chars
+        self.tag = tag
+        self.containers = containers
+
+    @property
+    def link_density(self) -> float:
+        return self.link_chars / max(1, len(self.text))
+
+
+class _ExtractionHandler:
+    """
+    파서 이벤트(start/end/data)를 받아 한 번의 순회로
+    제목, 메타 설명, 문단 목록과 컨테이너 가중치를 수집함
+    """
+
+    def __init__(self):
+        self.title_parts: List[str] = []
+        self.description = ""
+        self.paragraphs: List[_Paragraph] = []
+        # 컨테이너 id -> (태그, class/id 가중치)
+        self.containers: Dict[int, Tuple[str, float]] = {}
+
+        self._stack: List[Tuple[str, Optional[int]]] = []
+        self._container_path: List[int] = []
+        self._skip_depth = 0
+        self._in_title = False
+        self._link_depth = 0
+
+        self._block_tag: Optional[str] = None
+        self._block_depth = 0
+        self._buffer: List[str] = []
+        self._link_chars = 0
+
+    # ----- 파서 이벤트 -----
+
+    def start(self, tag: str, attrs: Dict[str, Any]) -> None:
+        tag = tag.lower()
+        # html.parser는 생략된 종료 태그를 닫지 않으므로 명세 규칙대로 직접 닫음
+        self._close_implied(tag)
+
+        if tag == "meta":
+            self._handle_meta(attrs)
+            return
+        if tag in VOID_TAGS:
+            if tag == "br":
+                self._append_text(" ")
+            return
+
+        container_id = None
+        if self._skip_depth or tag in SKIP_TAGS:
+            self._skip_depth += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag in BLOCK_TAGS and self._block_tag is None:
+            self._flush()
+            self._block_tag = tag
+            self._block_depth = len(self._stack) + 1
+        elif tag in CONTAINER_TAGS and self._block_tag is None:
+            self._flush()
+            container_id = len(self.containers)
+            self.containers[container_id] = (tag, self._class_weight(tag, attrs))
+            self._container_path.append(container_id)
+        elif tag == "a":
+            self._link_depth += 1
+
+        self._stack.append((tag, container_id))
+
+    def end(self, tag: str) -> None:
+        tag = tag.lower()
+        if tag in VOID_TAGS:
+            return
+        # 짝이 맞지 않는 종료 태그는 무시, 생략된 종료 태그는 함께 닫음
+        if not any(open_tag == tag for open_tag, _ in self._stack):
+            return
+        while self._stack:
+            open_tag, container_id = self._stack.pop()
+            self._close(open_tag, container_id)
+            if open_tag == tag:
+                break
+
+    def data(self, text: str) -> None:
+        if self._skip_depth:
+            return
+        if self._in_title:
+            self.title_parts.append(text)
+            return
+        self._append_text(text)
+
+    def close(self) -> None:
+        while self._stack:
+            open_tag, container_id = self._stack.pop()
+            self._close(open_tag, container_id)
+        self._flush()
+
+    # ----- 내부 처리 -----
+
+    def _close_implied(self, tag: str) -> None:
+        """새 시작 태그로 인해 암시적으로 닫히는 열린 요소를 닫음"""
+        if tag in P_CLOSING_TAGS and self._open_in_scope(("p",), SCOPE_TAGS):
+            self.end("p")
+        implied = IMPLIED_END_TAGS.get(tag)
+        if implied:
+            boundary = LIST_SCOPE_TAGS if tag in ("li", "dt", "dd") else frozenset({"table"})
+            open_tag = self._open_in_scope(implied, boundary)
+            if open_tag:
+                self.end(open_tag)
+
+    def _open_in_scope(self, tags: Tuple[str, ...], boundary: frozenset) -> Optional[str]:
+        """범위 경계 안쪽에서 가장 가까운 열린 태그 (없으면 None)"""
+        for open_tag, _ in reversed(self._stack):
+            if open_tag in tags:
+                return open_tag
+            if open_tag in boundary:
+                return None
+        return None
+
+    def _close(self, tag: str, container_id: Optional[int]) -> None:
+        if self._skip_depth:
+            self._skip_depth -= 1
+            return
+        if tag == "title":
+            self._in_title = False
+        elif tag == "a":
+            self._link_depth = max(0, self._link_depth - 1)
+        elif self._block_tag is not None and len(self._stack) + 1 == self._block_depth:
+            self._flush()
+        elif container_id is not None:
+            self._flush()
+            if self._container_path and self._container_path[-1] == container_id:
+                self._container_path.pop()
+
+    def _append_text(self, text: str) -> None:
+        self._buffer.append(text)
+        if self._link_depth:
+            self._link_chars += len(text.strip())
+
+    def _flush(self) -> None:
+        """버퍼에 모인 텍스트를 문단으로 확정"""
+        if self._buffer:
+            text = _WHITESPACE.sub(" ", "".join(self._buffer)).strip()
+            if text:
+                self.paragraphs.append(_Paragraph(
+                    text,
+                    self._link_chars,
+                    self._block_tag or "",
+                    tuple(self._container_path)
+                ))
+        self._buffer = []
+        self._link_chars = 0
+        self._block_tag = None
+        self._block_depth = 0
+
+    def _handle_meta(self, attrs: Dict[str, Any]) -> None:
+        if self.description:
+            return
+        name = (attrs.get("name") or attrs.get("property") or "").lower()
+        if name in ("description", "og:description"):
+            self.description = (attrs.get("content") or "").strip()
+
+    @staticmethod
+    def _class_weight(tag: str, attrs: Dict[str, Any]) -> float:
+        hints = f"{attrs.get('class') or ''} {attrs.get('id') or ''}"
+        weight = 1.0
+        if tag in ("article", "main"):
+            weight += 0.5
+        if POSITIVE_HINTS.search(hints):
+            weight += 0.25
+        if NEGATIVE_HINTS.search(hints):
+            weight -= 0.75
+        return max(weight, 0.1)
+
+
+class _StdlibParser(HTMLParser):
+    """html.parser 백엔드 어댑터"""
+
+    def __init__(self, handler: _ExtractionHandler):
+        super().__init__(convert_charrefs=True)
+        self.handler = handler
+
+    def handle_starttag(self, tag, attrs):
+        self.handler.start(tag, dict(attrs))
+
+    def handle_startendtag(self, tag, attrs):
+        self.handler.start(tag, dict(attrs))
+        self.handler.end(tag)
+
+    def handle_endtag(self, tag):
+        self.handler.end(tag)
+
+    def handle_data(self, data):
+        self.handler.data(data)
+
+
+def _parse(html: str, backend: str) -> _ExtractionHandler:
+    handler = _ExtractionHandler()
+    if backend == "lxml" and _lxml_etree is not None:
+        parser = _lxml_etree.HTMLParser(target=handler, recover=True)
+        parser.feed(html)
+        parser.close()
+    else:
+        parser = _StdlibParser(handler)
+        parser.feed(html)
+        parser.close()
+        handler.close()
+    return handler
+
+
+def _select_main_content(handler: _ExtractionHandler) -> List[_Paragraph]:
+    """텍스트 밀도 점수가 가장 높은 컨테이너의 문단 선택"""
+    scores: Dict[int, float] = {}
+    for paragraph in handler.paragraphs:
+        if len(paragraph.text) < MIN_PARAGRAPH_CHARS or not paragraph.containers:
+            continue
+        score = 1.0 + paragraph.text.count(",") + min(len(paragraph.text) / 100, 3.0)
+        score *= 1.0 - paragraph.link_density
+        # 부모 컨테이너에 전체, 조부모에 절반 점수 부여
+        parent = paragraph.containers[-1]
+        scores[parent] = scores.get(parent, 0.0) + score
+        if len(paragraph.containers) > 1:
+            grandparent = paragraph.containers[-2]
+            scores[grandparent] = scores.get(grandparent, 0.0) + score / 2
+
+    candidates = handler.paragraphs
+    if scores:
+        best = max(scores, key=lambda cid: scores[cid] * handler.containers[cid][1])
+        candidates = [p for p in handler.paragraphs if best in p.containers]
+
+    return [
+        p for p in candidates
+        if p.tag in HEADING_TAGS or p.link_density < MAX_LINK_DENSITY
+    ]
+
+
+def extract_content(html: str, backend: Optional[str] = None) -> Dict[str, str]:
+    """
+    HTML에서 제목, 설명, 본문 텍스트 추출
+
+    Args:
+        html: HTML 문자열
+        backend: "lxml" 또는 "html.parser" (기본: SCRAPER_PARSER 환경변수 또는 자동 선택)
+
+    Returns:
+        {"title", "description", "content"} 딕셔너리
+    """
+    backend = backend or os.getenv("SCRAPER_PARSER") or available_backend()
+    try:
+        handler = _parse(html, backend)
+    except Exception:
+        if backend == "html.parser":
+            raise
+        # lxml이 처리하지 못하는 문서(빈 문서 등)는 표준 파서로 재시도
+        handler = _parse(html, "html.parser")
+
+    paragraphs = _select_main_content(handler)
+    return {
+        "title": _WHITESPACE.sub(" ", "".join(handler.title_parts)).strip(),
+        "description": handler.description,
+        "content": "\n\n".join(p.text for p in paragraphs)
+    }
@@ -0,0 +1,49 @@
+"""
+Run Metrics
+실행 구간별 카운터 수집 (LLM/검색/스크랩 호출 수, 캐시 적중 등)
+
+collect()로 구간을 열면 같은 컨텍스트(스레드/태스크)에서 호출된 increment()가
+해당 구간의 카운터에 누적됨. 구간이 열려 있지 않으면 아무 일도 하지 않으므로
+도구 코드에서 항상 호출해도 됨
+"""
+
+import contextvars
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+_current: contextvars.ContextVar[Optional[Dict[str, float]]] = contextvars.ContextVar(
+    "run_metrics", default=None
+)
+_lock = threading.Lock()
+
+
+def increment(name: str, value: float = 1) -> None:
+    """현재 구간의 카운터 증가"""
+    counters = _current.get()
+    if counters is not None:
+        with _lock:
+            counters[name] = counters.get(name, 0) + value
+
+
+@contextmanager
+def collect() -> Iterator[Dict[str, float]]:
+    """이 컨텍스트 안에서 발생한 카운터를 모으는 구간"""
+    counters: Dict[str, float] = {}
+    token = _current.set(counters)
+    try:
+        yield counters
+    finally:
+        _current.reset(token)
+
+
+def bind(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    현재 구간을 다른 스레드에서도 이어받도록 함수에 컨텍스트를 묶음
+
+    ThreadPoolExecutor는 contextvars를 전달하지 않으므로 submit 전에 감쌈
+    """
+    context = contextvars.copy_context()
+    return lambda *args, **kwargs: context.run(fn, *args, **kwargs)
@@ -0,0 +1,149 @@
+"""
+Passage Ranking
+검색 결과/스크랩 본문에서 쿼리와 관련된 문단을 BM25로 골라내는 로컬 랭커
+"""
+
+import os
+import re
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# 결과 하나당 요약 프롬프트에 넣을 최대 문자 수
+PASSAGE_BUDGET_CHARS = int(os.getenv("PASSAGE_BUDGET_CHARS", "500"))
+# 문단(패시지) 최대 길이
+PASSAGE_MAX_CHARS = 200
+
+_SENTENCE_END = re.compile(r"(?<=[.!?。…])\s+|(?<=다\.)|\n+")
+_LATIN = re.compile(r"[a-z0-9]+(?:['’][a-z]+)?")
+_HANGUL = re.compile(r"[가-힣]+")
+
+STOPWORDS = {
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "for", "with", "by",
+    "is", "are", "was", "were", "be", "as", "at", "it", "its", "this", "that",
+    "from", "how", "what", "which", "who", "why", "do", "does",
+}
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    한국어/영어 토큰화
+
+    영어는 소문자 단어(불용어 제외), 한글은 조사/어미 변화에 강하도록
+    음절 bigram(1음절 단어는 그대로)으로 나눔
+    """
+    text = text.casefold()
+    tokens = [t for t in _LATIN.findall(text) if t not in STOPWORDS]
+    for word in _HANGUL.findall(text):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens += map(str.__add__, word, word[1:])
+    return tokens
+
+
+def split_passages(text: str, max_chars: int = PASSAGE_MAX_CHARS) -> List[str]:
+    """문장 단위로 나눈 뒤 max_chars 이하의 문단으로 묶음 (긴 문장은 잘라서 사용)"""
+    passages: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_END.split(text or ""):
+        sentence = " ".join(sentence.split())
+        if not sentence:
+            continue
+        while len(sentence) > max_chars:
+            if current:
+                passages.append(current)
+                current = ""
+            passages.append(sentence[:max_chars])
+            sentence = sentence[max_chars:]
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            passages.append(current)
+            current = ""
+        current = f"{current} {sentence}" if current else sentence
+    if current:
+        passages.append(current)
+    return passages
+
+
+class BM25:
+    """NumPy 기반 Okapi BM25 (문서-단어 빈도 행렬을 한 번에 계산)"""
+
+    def __init__(self, documents: List[List[str]], k1: float = 1.5, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        n = len(documents)
+        flat = [token for tokens in documents for token in tokens]
+        terms, cols = np.unique(np.asarray(flat, dtype=str), return_inverse=True)
+        self.vocab: Dict[str, int] = {term: i for i, term in enumerate(terms.tolist())}
+        rows = np.repeat(np.arange(n), [len(tokens) for tokens in documents])
+
+        width = max(1, len(terms))
+        counts = np.bincount(rows * width + cols.ravel(), minlength=n * width)
+        self.tf = counts.reshape(n, width).astype(np.float32)
+
+        lengths = self.tf.sum(axis=1)
+        avg_length = lengths.mean() if len(documents) else 0.0
+        self.norm = k1 * (1 - b + b * lengths / (avg_length or 1.0))
+        df = (self.tf > 0).sum(axis=0)
+        self.idf = np.log1p((n - df + 0.5) / (df + 0.5)).astype(np.float32)
+
+    def scores(self, query: List[str]) -> np.ndarray:
+        """쿼리에 대한 문서별 BM25 점수"""
+        ids = [self.vocab[t] for t in set(query) if t in self.vocab]
+        if not ids:
+            return np.zeros(self.tf.shape[0], dtype=np.float32)
+        tf = self.tf[:, ids]
+        weights = tf * (self.k1 + 1) / (tf + self.norm[:, None])
+        return weights @ self.idf[ids]
+
+
+def select_passages(
+    query: str,
+    documents: List[str],
+    budget_chars: Optional[int] = None,
+    max_chars: int = PASSAGE_MAX_CHARS
+) -> List[str]:
+    """
+    문서마다 쿼리 관련도가 높은 문단을 문자 예산 안에서 선택
+
+    모든 문서의 문단을 하나의 BM25 인덱스로 만들어 IDF를 공유하고,
+    문서별로 점수 순으로 예산을 채운 뒤 원래 순서대로 이어붙임.
+    예산보다 짧은 문서는 그대로 반환
+
+    Args:
+        query: 검색 쿼리
+        documents: 본문 목록
+        budget_chars: 문서당 최대 문자 수 (없으면 PASSAGE_BUDGET_CHARS)
+        max_chars: 문단 최대 길이
+
+    Returns:
+        documents와 같은 순서의 발췌문 목록
+    """
+    budget = budget_chars or PASSAGE_BUDGET_CHARS
+    max_chars = min(max_chars, budget)
+    selected = [doc or "" for doc in documents]
+    long_docs = [i for i, doc in enumerate(selected) if len(doc) > budget]
+    if not long_docs:
+        return selected
+
+    passages: List[Tuple[int, int, str]] = []  # (문서 인덱스, 문서 내 순서, 문단)
+    for i in long_docs:
+        for order, passage in enumerate(split_passages(selected[i], max_chars)):
+            passages.append((i, order, passage))
+
+    scores = BM25([tokenize(p) for _, _, p in passages]).scores(tokenize(query))
+
+    chosen: Dict[int, List[Tuple[int, str]]] = {i: [] for i in long_docs}
+    used = {i: 0 for i in long_docs}
+    # 점수 내림차순 (동점이면 앞쪽 문단 우선)
+    for index in np.lexsort((np.arange(len(passages)), -scores)):
+        doc, order, passage = passages[index]
+        cost = len(passage) + (1 if chosen[doc] else 0)
+        if used[doc] + cost <= budget:
+            chosen[doc].append((order, passage))
+            used[doc] += cost
+
+    for i in long_docs:
+        picked = [p for _, p in sorted(chosen[i])]
+        selected[i] = " ".join(picked) if picked else selected[i][:budget]
+    return selected
@@ -4,21 +4,561 @@ Web Scraper Tool
 """
 
 import asyncio
-from typing import Optional, Dict, Any
+import importlib.util
+import multiprocessing
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Dict, Any, Awaitable, Callable, List
 from urllib.parse import urlparse
 
 import httpx
-from bs4 import BeautifulSoup
+
+from .extractor import extract_content
+from .metrics import increment
+
+
+# 파싱 대상으로 허용하는 Content-Type
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml", "text/plain")
+
+
+class ContentRejectedError(Exception):
+    """HTML이 아니거나 크기 제한을 넘는 응답"""
+
+
+# 호스트 장애로 간주하는 오류 유형 (회로 차단기 집계 대상)
+HOST_FAILURE_TYPES = ("timeout", "transport", "http_429", "http_5xx")
+
+
+def classify_error(error: Exception) -> str:
+    """예외를 스케줄러가 사용하는 오류 유형으로 분류"""
+    if isinstance(error, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        if status == 429:
+            return "http_429"
+        return "http_5xx" if status >= 500 else "http_4xx"
+    if isinstance(error, httpx.TransportError):
+        return "transport"
+    if isinstance(error, ContentRejectedError):
+        return "rejected"
+    return "error"
+
+
+class TokenBucket:
+    """호스트별 요청 속도 제한용 토큰 버킷"""
+    
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    def try_acquire(self) -> bool:
+        """토큰이 있으면 1개 소비하고 True"""
+        if self.rate <= 0:
+            return True
+        self._refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+    
+    def refund(self) -> None:
+        """사용하지 않은 토큰 반환"""
+        self.tokens = min(self.capacity, self.tokens + 1)
+    
+    def wait_time(self) -> float:
+        """다음 토큰까지 남은 시간 (초)"""
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        return max(0.0, (1 - self.tokens) / self.rate)
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기
+    
+    연속 실패가 임계값에 도달하면 cooldown 동안 열림(요청 차단).
+    cooldown이 지나면 반열림 상태로 요청 1건을 시험하고, 성공하면 닫힘.
+    """
+    
+    def __init__(self, failure_threshold: int, cooldown: float):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.failures = 0
+        self.opened_at: Optional[float] = None
+        self.probing = False
+    
+    def allow(self) -> bool:
+        if self.opened_at is None:
+            return True
+        if not self.probing and time.monotonic() - self.opened_at >= self.cooldown:
+            self.probing = True
+            return True
+        return False
+    
+    @property
+    def is_open(self) -> bool:
+        """cooldown 중이라 요청을 보낼 수 없는 상태"""
+        return (
+            self.opened_at is not None
+            and not self.probing
+            and time.monotonic() - self.opened_at < self.cooldown
+        )
+    
+    def record(self, failed: bool) -> None:
+        if failed:
+            self.failures += 1
+            if self.probing or self.failures >= self.failure_threshold:
+                self.opened_at = time.monotonic()
+        else:
+            self.failures = 0
+            self.opened_at = None
+        self.probing = False
+    
+    def release_probe(self) -> None:
+        """시험 요청이 결과 없이 취소된 경우 (마감/호출자 취소) 다음 요청이 다시 시험할 수 있게 함"""
+        self.probing = False
+
+
+class HostScheduler:
+    """
+    호스트 인식 요청 스케줄러
+    
+    - 호스트별 동시 요청 수 및 토큰 버킷 속도 제한
+    - 연속 오류/타임아웃 호스트에 회로 차단기 적용 (남은 URL은 즉시 실패 처리)
+    - 호스트를 순환하며 디스패치하여 한 도메인이 몰린 배치에서도 전체 동시성을 유지
+    
+    상태(버킷, 차단기)는 스케줄러 인스턴스에 유지되어 배치 간에 이어짐
+    """
+    
+    def __init__(
+        self,
+        max_concurrency: int,
+        per_host_concurrency: int,
+        rate_per_host: float,
+        failure_threshold: int = 3,
+        cooldown: float = 60.0
+    ):
+        self.max_concurrency = max_concurrency
+        self.per_host_concurrency = per_host_concurrency
+        self.rate_per_host = rate_per_host
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._breakers: Dict[str, CircuitBreaker] = {}
+    
+    def _bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(
+                self.rate_per_host, max(1.0, float(self.per_host_concurrency))
+            )
+        return self._buckets[host]
+    
+    def breaker(self, host: str) -> CircuitBreaker:
+        if host not in self._breakers:
+            self._breakers[host] = CircuitBreaker(self.failure_threshold, self.cooldown)
+        return self._breakers[host]
+    
+    async def run(
+        self,
+        urls: List[str],
+        fetch: Callable[[int, str], Awaitable[Dict[str, Any]]],
+        deadline: Optional[float] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        URL 목록을 스케줄링하여 실행
+        
+        Args:
+            urls: URL 목록
+            fetch: (인덱스, URL)을 받아 결과 딕셔너리를 반환하는 코루틴 함수.
+                   실패 시 결과의 "error_type"이 HOST_FAILURE_TYPES에 속하면 차단기에 집계됨
+            deadline: 이벤트 루프 시각(loop.time()) 기준 마감. 마감까지 끝나지 않은 요청은
+                      취소하고 "deadline" 오류로 채움 (차단기에는 집계하지 않음)
+            
+        Returns:
+            입력 순서와 같은 결과 목록
+        """
+        loop = asyncio.get_running_loop()
+        results: List[Optional[Dict[str, Any]]] = [None] * len(urls)
+        queues: Dict[str, deque] = {}
+        for index, url in enumerate(urls):
+            queues.setdefault(urlparse(url).netloc, deque()).append((index, url))
+        
+        hosts = deque(queues)
+        active: Dict[str, int] = {host: 0 for host in queues}
+        running: Dict[asyncio.Future, tuple] = {}
+        
+        try:
+            while hosts or running:
+                remaining = None if deadline is None else deadline - loop.time()
+                if remaining is not None and remaining <= 0:
+                    self._fail_unfinished(urls, results)
+                    break
+                await self._dispatch(fetch, hosts, queues, active, running, results, remaining)
+        finally:
+            # 마감 또는 호출자 취소 시 진행 중인 요청도 함께 취소
+            # (반열림 시험 요청이 취소되면 결과가 기록되지 않으므로 시험 상태를 풀어 줌)
+            for task, (host, _, probe) in running.items():
+                task.cancel()
+                if probe:
+                    self.breaker(host).release_probe()
+        
+        return results
+    
+    async def _dispatch(
+        self,
+        fetch: Callable[[int, str], Awaitable[Dict[str, Any]]],
+        hosts: deque,
+        queues: Dict[str, deque],
+        active: Dict[str, int],
+        running: Dict[asyncio.Future, tuple],
+        results: list,
+        remaining: Optional[float]
+    ) -> None:
+        """보낼 수 있는 요청을 디스패치하고 다음 완료(또는 토큰 생성, 마감)까지 대기"""
+        # 호스트를 한 바퀴 돌며 보낼 수 있는 요청을 최대한 디스패치
+        for _ in range(len(hosts)):
+            if len(running) >= self.max_concurrency:
+                break
+            host = hosts[0]
+            hosts.rotate(-1)
+            breaker = self.breaker(host)
+            
+            if breaker.is_open:
+                self._fail_remaining(host, queues, results)
+                continue
+            if active[host] >= self.per_host_concurrency:
+                continue
+            bucket = self._bucket(host)
+            if not bucket.try_acquire():
+                continue
+            if not breaker.allow():
+                # 반열림 상태에서 시험 요청이 진행 중이면 결과를 기다림
+                bucket.refund()
+                continue
+            
+            index, url = queues[host].popleft()
+            active[host] += 1
+            probe = breaker.opened_at is not None
+            running[asyncio.ensure_future(fetch(index, url))] = (host, index, probe)
+        
+        for host in [h for h in hosts if not queues[h]]:
+            hosts.remove(host)
+        
+        if running:
+            timeout = _earliest(self._next_wakeup(hosts, active) if hosts else None, remaining)
+            done, _ = await asyncio.wait(
+                running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                host, index, _ = running.pop(task)
+                active[host] -= 1
+                result = task.result()
+                results[index] = result
+                self.breaker(host).record(
+                    not result.get("success") and result.get("error_type") in HOST_FAILURE_TYPES
+                )
+        elif hosts:
+            await asyncio.sleep(_earliest(self._next_wakeup(hosts, active), remaining))
+    
+    def _next_wakeup(self, hosts: deque, active: Dict[str, int]) -> float:
+        """대기 중인 호스트 중 가장 빨리 토큰이 생기는 시간"""
+        waits = [
+            self._bucket(host).wait_time()
+            for host in hosts
+            if active[host] < self.per_host_concurrency
+        ]
+        return max(0.01, min(waits)) if waits else 0.05
+    
+    def _fail_remaining(self, host: str, queues: Dict[str, deque], results: list) -> None:
+        """회로가 열린 호스트의 남은 URL을 즉시 실패 처리"""
+        while queues[host]:
+            index, url = queues[host].popleft()
+            results[index] = {
+                "url": url,
+                "error": f"회로 차단됨: {host} 연속 오류",
+                "error_type": "circuit_open",
+                "success": False
+            }
+    
+    def _fail_unfinished(self, urls: List[str], results: list) -> None:
+        """마감까지 끝나지 않은(대기 또는 진행 중) URL을 실패 처리"""
+        for index, url in enumerate(urls):
+            if results[index] is None:
+                results[index] = _deadline_result(url)
+
+
+def _deadline_result(url: str) -> Dict[str, Any]:
+    """시간 예산 안에 끝나지 않은 URL의 실패 결과"""
+    increment("scrape.deadline_skips")
+    return {
+        "url": url,
+        "error": "시간 예산 초과",
+        "error_type": "deadline",
+        "success": False
+    }
+
+
+def _earliest(*timeouts: Optional[float]) -> Optional[float]:
+    """None(무기한)을 제외한 가장 짧은 대기 시간"""
+    values = [t for t in timeouts if t is not None]
+    return max(0.0, min(values)) if values else None
 
 
 class WebScraper:
-    """웹 페이지 스크래퍼"""
+    """
+    웹 페이지 스크래퍼
     
-    def __init__(self, timeout: int = 10):
+    동기/비동기 httpx 클라이언트를 한 번만 만들어 연결 풀(keep-alive)을 재사용함.
+    사용 후 close()/aclose()를 호출하거나 with / async with 문으로 사용할 것.
+    """
+    
+    def __init__(
+        self,
+        timeout: int = 10,
+        max_connections: Optional[int] = None,
+        max_connections_per_host: Optional[int] = None,
+        http2: Optional[bool] = None,
+        max_bytes: Optional[int] = None,
+        parse_mode: Optional[str] = None,
+        parse_workers: Optional[int] = None
+    ):
         self.timeout = timeout
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
         }
+        self.max_connections = max_connections or int(
+            os.getenv("SCRAPER_MAX_CONNECTIONS", "20")
+        )
+        self.max_connections_per_host = max_connections_per_host or int(
+            os.getenv("SCRAPER_MAX_CONNECTIONS_PER_HOST", "4")
+        )
+        if http2 is None:
+            http2 = os.getenv("SCRAPER_HTTP2", "on").lower() not in ("0", "off", "false", "no")
+        # 페이지당 최대 다운로드 바이트 수
+        self.max_bytes = max_bytes or int(os.getenv("SCRAPER_MAX_BYTES", str(2 * 1024 * 1024)))
+        # HTTP/2는 h2 패키지가 설치된 경우에만 사용
+        self.http2 = http2 and importlib.util.find_spec("h2") is not None
+        
+        self._client: Optional[httpx.Client] = None
+        # 비동기 클라이언트와 호스트별 세마포어는 이벤트 루프마다 따로 둠
+        self._async_clients: Dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+        self._async_closers: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+        self._host_locks: Dict[str, threading.BoundedSemaphore] = {}
+        self._host_semaphores: Dict[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]] = {}
+        self._lock = threading.Lock()
+        
+        # scrape_many()용 백그라운드 이벤트 루프
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        
+        # scrape_multiple()의 HTML 파싱 실행 방식: "inline" | "thread" | "process"
+        self.parse_mode = (parse_mode or os.getenv("SCRAPER_PARSE_MODE", "inline")).lower()
+        self.parse_workers = parse_workers or int(
+            os.getenv("SCRAPER_PARSE_WORKERS", str(os.cpu_count() or 2))
+        )
+        # 다운로드가 끝나고 파싱을 기다리는 문서 수 상한 (메모리 상한)
+        self.parse_queue_size = self.parse_workers * 2
+        self._parse_executor: Optional[Executor] = None
+        
+        # scrape_multiple()의 호스트별 동시성/속도 제한 및 회로 차단기
+        self.scheduler = HostScheduler(
+            max_concurrency=self.max_connections,
+            per_host_concurrency=self.max_connections_per_host,
+            rate_per_host=float(os.getenv("SCRAPER_HOST_RATE", "2.0")),
+            failure_threshold=int(os.getenv("SCRAPER_BREAKER_THRESHOLD", "3")),
+            cooldown=float(os.getenv("SCRAPER_BREAKER_COOLDOWN", "60"))
+        )
+    
+    def _limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_connections,
+            keepalive_expiry=30.0
+        )
+    
+    @property
+    def client(self) -> httpx.Client:
+        """Lazy initialization of pooled sync client"""
+        with self._lock:
+            if self._client is None:
+                self._client = httpx.Client(
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    limits=self._limits(),
+                    http2=self.http2,
+                    follow_redirects=True
+                )
+            return self._client
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """
+        현재 이벤트 루프에 묶인 비동기 클라이언트 반환
+        
+        클라이언트는 다른 루프에서 재사용하거나 닫을 수 없으므로 루프마다 만들고,
+        루프가 끝날 때(asyncio.run이 남은 작업을 취소할 때) 같은 루프에서 닫음
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._async_clients.get(loop)
+            if client is None:
+                client = httpx.AsyncClient(
+                    timeout=self.timeout,
+                    headers=self.headers,
+                    limits=self._limits(),
+                    http2=self.http2,
+                    follow_redirects=True
+                )
+                self._async_clients[loop] = client
+                self._async_closers[loop] = loop.create_task(self._close_on_loop_exit(loop, client))
+        return client
+    
+    async def _close_on_loop_exit(self, loop: asyncio.AbstractEventLoop, client: httpx.AsyncClient) -> None:
+        """취소될 때까지 대기하다가 루프의 클라이언트를 닫음 (aclose 또는 루프 종료 시)"""
+        try:
+            await loop.create_future()
+        finally:
+            self._discard_async_client(loop, client)
+            await client.aclose()
+    
+    def _discard_async_client(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        client: Optional[httpx.AsyncClient] = None
+    ) -> Optional[httpx.AsyncClient]:
+        """
+        루프에 묶인 클라이언트와 세마포어를 목록에서 제거하고 클라이언트 반환
+        
+        client를 지정하면 그 사이 같은 루프에 새로 만든 클라이언트는 제거하지 않음
+        """
+        with self._lock:
+            if client is not None and self._async_clients.get(loop) is not client:
+                return None
+            self._async_closers.pop(loop, None)
+            self._host_semaphores.pop(loop, None)
+            return self._async_clients.pop(loop, None)
+    
+    def _host_lock(self, url: str) -> threading.BoundedSemaphore:
+        """호스트별 동시 연결 수 제한 (동기)"""
+        host = urlparse(url).netloc
+        with self._lock:
+            if host not in self._host_locks:
+                self._host_locks[host] = threading.BoundedSemaphore(self.max_connections_per_host)
+            return self._host_locks[host]
+    
+    def _host_semaphore(self, url: str) -> asyncio.Semaphore:
+        """호스트별 동시 연결 수 제한 (비동기)"""
+        host = urlparse(url).netloc
+        with self._lock:
+            semaphores = self._host_semaphores.setdefault(asyncio.get_running_loop(), {})
+            if host not in semaphores:
+                semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+            return semaphores[host]
+    
+    def close(self) -> None:
+        """동기 클라이언트 및 백그라운드 루프 종료"""
+        with self._lock:
+            if self._client is not None:
+                self._client.close()
+                self._client = None
+        
+        if self._loop is not None:
+            asyncio.run_coroutine_threadsafe(self.aclose(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop_thread.join()
+            self._loop.close()
+            self._loop = None
+            self._loop_thread = None
+        
+        if self._parse_executor is not None:
+            self._parse_executor.shutdown(wait=True)
+            self._parse_executor = None
+    
+    async def aclose(self) -> None:
+        """비동기 클라이언트 종료 (현재 루프에 묶인 클라이언트만)"""
+        loop = asyncio.get_running_loop()
+        closer = self._async_closers.get(loop)
+        client = self._discard_async_client(loop)
+        if closer is not None:
+            closer.cancel()
+        if client is not None:
+            await client.aclose()
+    
+    def __enter__(self) -> "WebScraper":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    async def __aenter__(self) -> "WebScraper":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+        self.close()
+    
+    def _fetch(self, url: str) -> str:
+        """
+        응답 본문을 스트리밍으로 받아 바이트 예산 내에서 읽음
+        
+        HTML이 아니거나 Content-Length가 예산을 넘으면 본문을 받기 전에 중단하고,
+        길이를 알 수 없는 응답은 예산만큼만 읽고 연결을 닫음
+        """
+        with self._host_lock(url):
+            with self.client.stream("GET", url) as response:
+                self._check_response(response)
+                body = bytearray()
+                for chunk in response.iter_bytes():
+                    body += chunk
+                    if len(body) >= self.max_bytes:
+                        break
+        return self._decode(response, bytes(body[:self.max_bytes]))
+    
+    async def _afetch(self, url: str) -> str:
+        """_fetch의 비동기 버전"""
+        client = self._get_async_client()
+        async with self._host_semaphore(url):
+            async with client.stream("GET", url) as response:
+                self._check_response(response)
+                body = bytearray()
+                async for chunk in response.aiter_bytes():
+                    body += chunk
+                    if len(body) >= self.max_bytes:
+                        break
+        return self._decode(response, bytes(body[:self.max_bytes]))
+    
+    def _check_response(self, response: httpx.Response) -> None:
+        """상태 코드, Content-Type, Content-Length 사전 검사"""
+        response.raise_for_status()
+        
+        content_type = response.headers.get("content-type", "").lower()
+        if content_type and not any(t in content_type for t in HTML_CONTENT_TYPES):
+            raise ContentRejectedError(f"HTML이 아닌 응답 ({content_type})")
+        
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise ContentRejectedError(
+                f"응답 크기 초과 ({int(content_length)} > {self.max_bytes} bytes)"
+            )
+    
+    def _decode(self, response: httpx.Response, body: bytes) -> str:
+        """헤더의 charset으로 디코딩 (잘린 멀티바이트 문자는 대체 문자로)"""
+        encoding = response.charset_encoding or "utf-8"
+        try:
+            return body.decode(encoding, errors="replace")
+        except LookupError:
+            return body.decode("utf-8", errors="replace")
     
     def scrape(self, url: str) -> Dict[str, Any]:
         """
@@ -31,53 +571,21 @@ class WebScraper:
             추출된 콘텐츠 딕셔너리
         """
         try:
-            with httpx.Client(timeout=self.timeout) as client:
-                response = client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                # 불필요한 요소 제거
-                for tag in soup(["script", "style", "nav", "footer", "header", "aside"]):
-                    tag.decompose()
-                
-                # 메타 정보 추출
-                title = soup.title.string if soup.title else ""
-                meta_desc = ""
-                meta_tag = soup.find("meta", attrs={"name": "description"})
-                if meta_tag:
-                    meta_desc = meta_tag.get("content", "")
-                
-                # 본문 텍스트 추출
-                # article 또는 main 태그 우선
-                main_content = soup.find("article") or soup.find("main") or soup.body
-                
-                if main_content:
-                    # 문단별로 텍스트 추출
-                    paragraphs = main_content.find_all(["p", "h1", "h2", "h3", "h4", "li"])
-                    text_parts = [p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True)]
-                    content = "\n\n".join(text_parts)
-                else:
-                    content = soup.get_text(separator="\n", strip=True)
-                
-                # 텍스트 정리
-                content = self._clean_text(content)
-                
-                return {
-                    "url": url,
-                    "title": title.strip() if title else "",
-                    "description": meta_desc,
-                    "content": content[:10000],  # 최대 10000자
-                    "domain": urlparse(url).netloc,
-                    "success": True
-                }
-                
+            html = self._fetch(url)
+            return self._build_result(url, html)
+            
         except httpx.HTTPError as e:
             return {
                 "url": url,
                 "error": f"HTTP 오류: {str(e)}",
                 "success": False
             }
+        except ContentRejectedError as e:
+            return {
+                "url": url,
+                "error": f"콘텐츠 거부: {str(e)}",
+                "success": False
+            }
         except Exception as e:
             return {
                 "url": url,
@@ -88,41 +596,148 @@ class WebScraper:
     async def scrape_async(self, url: str) -> Dict[str, Any]:
         """비동기 스크래핑"""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.get(url, headers=self.headers, follow_redirects=True)
-                response.raise_for_status()
-                
-                soup = BeautifulSoup(response.text, "html.parser")
-                
-                for tag in soup(["script", "style", "nav", "footer"]):
-                    tag.decompose()
-                
-                title = soup.title.string if soup.title else ""
-                main_content = soup.find("article") or soup.find("main") or soup.body
-                
-                if main_content:
-                    content = main_content.get_text(separator="\n", strip=True)
-                else:
-                    content = soup.get_text(separator="\n", strip=True)
-                
-                return {
-                    "url": url,
-                    "title": title.strip() if title else "",
-                    "content": self._clean_text(content)[:10000],
-                    "success": True
-                }
-                
+            html = await self._afetch(url)
+            return self._build_result(url, html)
+            
         except Exception as e:
-            return {
-                "url": url,
-                "error": str(e),
-                "success": False
-            }
+            return self._error_result(url, e)
     
-    async def scrape_multiple(self, urls: list) -> list:
-        """여러 URL 동시 스크래핑"""
-        tasks = [self.scrape_async(url) for url in urls]
-        return await asyncio.gather(*tasks)
+    def _error_result(self, url: str, error: Exception) -> Dict[str, Any]:
+        increment("scrape.errors")
+        return {
+            "url": url,
+            "error": str(error),
+            "error_type": classify_error(error),
+            "success": False
+        }
+    
+    def _build_result(self, url: str, html: str) -> Dict[str, Any]:
+        """추출 엔진으로 본문을 뽑아 결과 딕셔너리 구성"""
+        return self._result_from_extracted(url, extract_content(html))
+    
+    def _result_from_extracted(self, url: str, extracted: Dict[str, str]) -> Dict[str, Any]:
+        increment("scrape.pages")
+        return {
+            "url": url,
+            "title": extracted["title"],
+            "description": extracted["description"],
+            "content": self._clean_text(extracted["content"])[:10000],  # 최대 10000자
+            "domain": urlparse(url).netloc,
+            "success": True
+        }
+    
+    async def scrape_multiple(self, urls: list, timeout: Optional[float] = None) -> list:
+        """
+        여러 URL 동시 스크래핑
+        
+        Args:
+            urls: URL 목록
+            timeout: 전체 시간 예산(초). 지나면 남은 요청을 취소하고 해당 URL은
+                     error_type "deadline" 실패 결과로 반환 (완료된 결과는 그대로)
+        """
+        deadline = None if timeout is None else asyncio.get_running_loop().time() + timeout
+        if self.parse_mode in ("thread", "process"):
+            return await self._scrape_multiple_offloaded(urls, deadline)
+        return await self.scheduler.run(urls, lambda index, url: self.scrape_async(url), deadline)
+    
+    async def _scrape_multiple_offloaded(self, urls: list, deadline: Optional[float] = None) -> list:
+        """
+        다운로드는 이벤트 루프에서, 파싱은 실행기(프로세스/스레드 풀)에서 처리
+        
+        다운로드 완료 문서는 크기가 제한된 큐를 거쳐 파싱 워커로 전달되므로
+        큐가 차면 다운로드가 대기하여 메모리 사용량이 일정하게 유지됨.
+        마감(deadline)이 지나면 큐에 남은 문서는 파싱하지 않고 "deadline" 실패로 처리함
+        """
+        loop = asyncio.get_running_loop()
+        executor = self._get_parse_executor()
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.parse_queue_size)
+        results: list = [None] * len(urls)
+        
+        async def fetch(index: int, url: str) -> Dict[str, Any]:
+            try:
+                html = await self._afetch(url)
+            except Exception as e:
+                return self._error_result(url, e)
+            await queue.put((index, url, html))
+            return {"url": url, "success": True}
+        
+        async def parse_worker() -> None:
+            while True:
+                item = await queue.get()
+                try:
+                    if item is None:
+                        return
+                    index, url, html = item
+                    remaining = None if deadline is None else deadline - loop.time()
+                    if remaining is not None and remaining <= 0:
+                        results[index] = _deadline_result(url)
+                        continue
+                    try:
+                        extracted = await asyncio.wait_for(
+                            loop.run_in_executor(executor, extract_content, html), remaining
+                        )
+                        results[index] = self._result_from_extracted(url, extracted)
+                    except asyncio.TimeoutError:
+                        # 실행기에서 진행 중인 파싱은 중단할 수 없으므로 결과만 버림
+                        results[index] = _deadline_result(url)
+                    except Exception as e:
+                        results[index] = {
+                            "url": url, "error": str(e), "error_type": "parse", "success": False
+                        }
+                finally:
+                    queue.task_done()
+        
+        workers = [asyncio.create_task(parse_worker()) for _ in range(self.parse_workers)]
+        try:
+            fetched = await self.scheduler.run(urls, fetch, deadline)
+            for index, outcome in enumerate(fetched):
+                if not outcome.get("success"):
+                    results[index] = outcome
+        finally:
+            for _ in workers:
+                await queue.put(None)
+            await asyncio.gather(*workers)
+        return results
+    
+    def _get_parse_executor(self) -> Executor:
+        """파싱 실행기 (최초 호출 시 생성)"""
+        with self._lock:
+            if self._parse_executor is None:
+                if self.parse_mode == "process":
+                    # 백그라운드 스레드가 있는 프로세스에서 fork는 안전하지 않으므로 spawn 사용
+                    self._parse_executor = ProcessPoolExecutor(
+                        max_workers=self.parse_workers,
+                        mp_context=multiprocessing.get_context("spawn")
+                    )
+                else:
+                    self._parse_executor = ThreadPoolExecutor(
+                        max_workers=self.parse_workers,
+                        thread_name_prefix="WebScraperParse"
+                    )
+            return self._parse_executor
+    
+    def scrape_many(self, urls: list, timeout: Optional[float] = None) -> list:
+        """
+        동기 코드에서 여러 URL 동시 스크래핑 (timeout은 scrape_multiple과 동일)
+        
+        호출마다 새 이벤트 루프를 만들지 않고 스크래퍼가 소유한 백그라운드 루프에서
+        실행하므로 비동기 연결 풀이 호출 간에 재사용됨
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            self.scrape_multiple(urls, timeout), self._background_loop()
+        )
+        return future.result()
+    
+    def _background_loop(self) -> asyncio.AbstractEventLoop:
+        """백그라운드 이벤트 루프 (최초 호출 시 시작)"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._loop_thread = threading.Thread(
+                    target=self._loop.run_forever, name="WebScraperLoop", daemon=True
+                )
+                self._loop_thread.start()
+            return self._loop
     
     def _clean_text(self, text: str) -> str:
         """텍스트 정리"""
@@ -134,13 +749,24 @@ class WebScraper:
         return text.strip()
 
 
+_default_scraper: Optional[WebScraper] = None
+_default_scraper_lock = threading.Lock()
+
+
+def get_scraper() -> WebScraper:
+    """프로세스 전체에서 공유하는 기본 스크래퍼 (연결 풀 재사용)"""
+    global _default_scraper
+    with _default_scraper_lock:
+        if _default_scraper is None:
+            _default_scraper = WebScraper()
+        return _default_scraper
+
+
 def scrape_url(url: str) -> Dict[str, Any]:
     """URL 스크래핑 헬퍼 함수"""
-    scraper = WebScraper()
-    return scraper.scrape(url)
+    return get_scraper().scrape(url)
 
 
 def scrape_urls(urls: list) -> list:
     """여러 URL 스크래핑 헬퍼 함수"""
-    scraper = WebScraper()
-    return asyncio.run(scraper.scrape_multiple(urls))
+    return get_scraper().scrape_many(urls)
@@ -0,0 +1,183 @@
+"""
+Search Cache
+검색 결과 영구 캐시 (SQLite 기반, TTL + LRU)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+
+class SearchCache:
+    """
+    검색 결과 디스크 캐시
+
+    - 키: 정규화된 쿼리 + max_results + search_depth + 도메인 필터
+    - TTL이 지난 항목은 조회 시 삭제
+    - 최대 항목 수를 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (LRU)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl_seconds: Optional[float] = None,
+        max_entries: Optional[int] = None,
+        enabled: Optional[bool] = None
+    ):
+        self.path = path or os.getenv("SEARCH_CACHE_PATH", ".cache/search_cache.sqlite")
+        self.ttl_seconds = ttl_seconds if ttl_seconds is not None else float(
+            os.getenv("SEARCH_CACHE_TTL", "86400")
+        )
+        self.max_entries = max_entries if max_entries is not None else int(
+            os.getenv("SEARCH_CACHE_MAX_ENTRIES", "5000")
+        )
+        if enabled is None:
+            enabled = os.getenv("SEARCH_CACHE", "on").lower() not in ("0", "off", "false", "no")
+        self.enabled = enabled
+
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._conn = None
+
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """Lazy initialization of SQLite connection"""
+        if self._conn is None:
+            if self.path != ":memory:":
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed "
+                "ON search_cache (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    @staticmethod
+    def make_key(
+        query: str,
+        max_results: int,
+        search_depth: str = "basic",
+        include_domains: Optional[List[str]] = None,
+        exclude_domains: Optional[List[str]] = None
+    ) -> str:
+        """정규화된 캐시 키 생성"""
+        normalized = " ".join(unicodedata.normalize("NFC", query).casefold().split())
+        return json.dumps(
+            [
+                normalized,
+                int(max_results),
+                search_depth,
+                sorted(d.strip().lower() for d in include_domains or []),
+                sorted(d.strip().lower() for d in exclude_domains or []),
+            ],
+            ensure_ascii=False
+        )
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT value, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            value, created_at = row
+            if self.ttl_seconds > 0 and now - created_at > self.ttl_seconds:
+                self.conn.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                self.conn.commit()
+                self.misses += 1
+                return None
+
+            self.conn.execute(
+                "UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self.conn.commit()
+            self.hits += 1
+
+        return json.loads(value)
+
+    def set(self, key: str, results: List[Dict[str, Any]]) -> None:
+        """캐시 저장 후 최대 항목 수 초과분 정리"""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO search_cache (key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, json.dumps(results, ensure_ascii=False), now, now)
+            )
+            if self.max_entries > 0:
+                self.conn.execute(
+                    """DELETE FROM search_cache WHERE key IN (
+                        SELECT key FROM search_cache
+                        ORDER BY accessed_at DESC
+                        LIMIT -1 OFFSET ?
+                    )""",
+                    (self.max_entries,)
+                )
+            self.conn.commit()
+
+    def clear(self) -> None:
+        """캐시 전체 삭제"""
+        with self._lock:
+            self.conn.execute("DELETE FROM search_cache")
+            self.conn.commit()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중 통계"""
+        total = self.hits + self.misses
+        with self._lock:
+            size = self.conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "size": size
+        }
+
+    def close(self) -> None:
+        """SQLite 연결 종료"""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+_default_cache: Optional[SearchCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """프로세스 전체에서 공유하는 기본 검색 캐시"""
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = SearchCache()
+        return _default_cache
@@ -3,30 +3,42 @@ Web Search Tool
 Tavily API를 활용한 웹 검색 도구
 """
 
+import asyncio
 import os
+import threading
+from concurrent.futures import Future
 from typing import List, Dict, Any, Optional
 from dotenv import load_dotenv
 
+from .search_cache import SearchCache, get_search_cache
+from .metrics import increment
+
 load_dotenv()
 
 
 class TavilySearchTool:
     """Tavily 웹 검색 도구"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: Optional[SearchCache] = None):
         self.api_key = api_key or os.getenv("TAVILY_API_KEY")
+        self.cache = cache if cache is not None else get_search_cache()
         self._client = None
+        self._async_client = None
+        self._async_loop = None
         
+    def _check_api_key(self) -> None:
+        if not self.api_key or self.api_key.startswith("tvly-your"):
+            raise ValueError(
+                "Tavily API 키가 설정되지 않았습니다. "
+                ".env 파일에 TAVILY_API_KEY를 설정하거나 "
+                "https://tavily.com 에서 무료 API 키를 발급받으세요."
+            )
+    
     @property
     def client(self):
         """Lazy initialization of Tavily client"""
         if self._client is None:
-            if not self.api_key or self.api_key.startswith("tvly-your"):
-                raise ValueError(
-                    "Tavily API 키가 설정되지 않았습니다. "
-                    ".env 파일에 TAVILY_API_KEY를 설정하거나 "
-                    "https://tavily.com 에서 무료 API 키를 발급받으세요."
-                )
+            self._check_api_key()
             try:
                 from tavily import TavilyClient
                 self._client = TavilyClient(api_key=self.api_key)
@@ -34,13 +46,32 @@ class TavilySearchTool:
                 raise ImportError("tavily-python 패키지를 설치해주세요: pip install tavily-python")
         return self._client
     
+    @property
+    def async_client(self):
+        """
+        Lazy initialization of async Tavily client
+        
+        비동기 HTTP 클라이언트는 이벤트 루프에 묶이므로 루프가 바뀌면 새로 생성
+        """
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            self._check_api_key()
+            try:
+                from tavily import AsyncTavilyClient
+                self._async_client = AsyncTavilyClient(api_key=self.api_key)
+                self._async_loop = loop
+            except ImportError:
+                raise ImportError("tavily-python 패키지를 설치해주세요: pip install tavily-python")
+        return self._async_client
+    
     def search(
         self,
         query: str,
         max_results: int = 5,
         search_depth: str = "basic",
         include_domains: List[str] = None,
-        exclude_domains: List[str] = None
+        exclude_domains: List[str] = None,
+        bypass_cache: bool = False
     ) -> List[Dict[str, Any]]:
         """
         웹 검색 실행
@@ -51,10 +82,20 @@ class TavilySearchTool:
             search_depth: 검색 깊이 ("basic" or "advanced")
             include_domains: 포함할 도메인 목록
             exclude_domains: 제외할 도메인 목록
+            bypass_cache: True면 캐시를 읽지 않고 새로 검색 (결과는 캐시에 갱신)
             
         Returns:
             검색 결과 리스트
         """
+        cache_key = SearchCache.make_key(
+            query, max_results, search_depth, include_domains, exclude_domains
+        )
+        if not bypass_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                increment("search.cache_hits")
+                return cached
+        
         try:
             response = self.client.search(
                 query=query,
@@ -63,21 +104,60 @@ class TavilySearchTool:
                 include_domains=include_domains or [],
                 exclude_domains=exclude_domains or []
             )
-            
-            results = []
-            for item in response.get("results", []):
-                results.append({
-                    "title": item.get("title", ""),
-                    "url": item.get("url", ""),
-                    "content": item.get("content", ""),
-                    "score": item.get("score", 0.0)
-                })
-            
-            return results
-            
+            results = self._parse_results(response)
+        except Exception as e:
+            print(f"검색 오류: {e}")
+            return []
+        
+        # 오류가 아닌 정상 응답만 캐시
+        self.cache.set(cache_key, results)
+        return results
+    
+    async def asearch(
+        self,
+        query: str,
+        max_results: int = 5,
+        search_depth: str = "basic",
+        include_domains: List[str] = None,
+        exclude_domains: List[str] = None,
+        bypass_cache: bool = False
+    ) -> List[Dict[str, Any]]:
+        """search의 비동기 버전 (AsyncTavilyClient 사용)"""
+        cache_key = SearchCache.make_key(
+            query, max_results, search_depth, include_domains, exclude_domains
+        )
+        if not bypass_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                increment("search.cache_hits")
+                return cached
+        
+        try:
+            response = await self.async_client.search(
+                query=query,
+                max_results=max_results,
+                search_depth=search_depth,
+                include_domains=include_domains or [],
+                exclude_domains=exclude_domains or []
+            )
+            results = self._parse_results(response)
         except Exception as e:
             print(f"검색 오류: {e}")
             return []
+        
+        self.cache.set(cache_key, results)
+        return results
+    
+    def _parse_results(self, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        return [
+            {
+                "title": item.get("title", ""),
+                "url": item.get("url", ""),
+                "content": item.get("content", ""),
+                "score": item.get("score", 0.0)
+            }
+            for item in response.get("results", [])
+        ]
     
     def get_search_context(
         self,
@@ -117,12 +197,85 @@ class MockSearchTool:
                 "score": 0.8
             }
         ]
+    
+    async def asearch(self, query: str, max_results: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        return self.search(query, max_results=max_results, **kwargs)
+
+
+class SharedSearchTool:
+    """
+    여러 리서치 실행이 함께 쓰는 검색 도구 래퍼
+
+    같은 쿼리(정규화 기준)는 한 번만 검색하고 결과를 공유함. 동시에 들어온
+    같은 쿼리는 먼저 시작한 검색이 끝나기를 기다려 결과를 받음 (캐시가 꺼져
+    있어도 동작). 배치 실행처럼 주제들이 비슷한 쿼리를 만들 때 사용
+    """
+    
+    def __init__(self, tool: Any):
+        self.tool = tool
+        self._results: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.searches = 0
+    
+    def search(self, query: str, max_results: int = 5, **kwargs) -> List[Dict[str, Any]]:
+        key = SearchCache.make_key(
+            query,
+            max_results,
+            kwargs.get("search_depth", "basic"),
+            kwargs.get("include_domains"),
+            kwargs.get("exclude_domains")
+        )
+        with self._lock:
+            self.requests += 1
+            future = self._results.get(key)
+            owner = future is None
+            if owner:
+                future = self._results[key] = Future()
+                self.searches += 1
+        
+        if not owner:
+            increment("search.shared_hits")
+            return list(future.result())
+        
+        try:
+            results = self.tool.search(query, max_results=max_results, **kwargs)
+        except BaseException as e:
+            with self._lock:
+                self._results.pop(key, None)
+            future.set_exception(e)
+            raise
+        if not results:
+            # 빈 결과(오류 포함)는 공유하지 않고 다음 요청에서 다시 검색
+            with self._lock:
+                self._results.pop(key, None)
+        future.set_result(results)
+        return list(results)
+
+
+def get_search_tool(use_mock: bool = False):
+    """
+    검색 도구 생성
+    
+    Tavily API 키가 없거나 패키지가 없으면 MockSearchTool을 반환
+    """
+    if use_mock:
+        return MockSearchTool()
+    try:
+        tool = TavilySearchTool()
+        # API 키 검증을 위해 client 속성 접근
+        _ = tool.client
+        return tool
+    except (ValueError, ImportError):
+        print("⚠️  Tavily API 키가 없거나 패키지가 없어 Mock 검색을 사용합니다.")
+        return MockSearchTool()
 
 
 def search_web(
     query: str,
     max_results: int = 5,
-    use_mock: bool = False
+    use_mock: bool = False,
+    bypass_cache: bool = False
 ) -> List[Dict[str, Any]]:
     """
     웹 검색 헬퍼 함수
@@ -131,22 +284,13 @@ def search_web(
         query: 검색 쿼리
         max_results: 최대 결과 수
         use_mock: Mock 검색 사용 여부
+        bypass_cache: 검색 캐시 우회 여부
         
     Returns:
         검색 결과 리스트
     """
-    if use_mock:
-        tool = MockSearchTool()
-    else:
-        try:
-            tool = TavilySearchTool()
-            # API 키 검증을 위해 client 속성 접근
-            _ = tool.client
-        except (ValueError, ImportError):
-            print("⚠️  Tavily API 키가 없거나 패키지가 없어 Mock 검색을 사용합니다.")
-            tool = MockSearchTool()
-    
-    return tool.search(query, max_results=max_results)
+    tool = get_search_tool(use_mock)
+    return tool.search(query, max_results=max_results, bypass_cache=bypass_cache)
 
 
 # LangChain Tool 형태로 정의